@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass, replace
+from functools import partial
+from io import StringIO
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+import generate_docs as docgen  # noqa: E402
+
+
+@dataclass(slots=True)
+class CorpusProfile:
+    """Size of a gamemode tree in the terms the synthetic corpus generator scales."""
+
+    lua_files: int = 0
+    lua_bytes: int = 0
+    meta_files: int = 0
+    meta_symbols: int = 0
+    library_files: int = 0
+    library_symbols: int = 0
+    library_hooks: int = 0
+    core_hook_files: int = 0
+    core_hooks: int = 0
+    module_hook_files: int = 0
+    module_hooks: int = 0
+    modules: int = 0
+    submodules: int = 0
+
+
+def measure_corpus_profile(base_dir: Path, docs_dir: Path) -> CorpusProfile:
+    profile = CorpusProfile()
+    inventory = docgen.get_source_inventory(base_dir)
+    profile.lua_files = len(inventory.entries)
+    profile.lua_bytes = sum(entry.size for entry in inventory.entries)
+    profile.modules = sum(1 for entry in inventory.entries if entry.kind == "module-entry")
+    profile.submodules = sum(1 for entry in inventory.entries if entry.kind == "submodule" and entry.path.name == "module.lua")
+    page_sources = set()
+    for page in docgen.iter_corpus_pages(base_dir, docs_dir):
+        if page.kind == "meta":
+            profile.meta_files += 1
+            profile.meta_symbols += len(page.symbols)
+        elif page.kind == "library":
+            profile.library_files += 1
+            profile.library_symbols += len(page.symbols)
+            profile.library_hooks += len(page.hooks)
+        if page.kind != "hooks":
+            page_sources.update(page.sources)
+            continue
+        # Hooks documented inside meta and library files are already counted with those files.
+        paths = {symbol.location.path for symbol in page.symbols if symbol.location}
+        if paths & page_sources:
+            continue
+        if any(path.startswith("gamemode/modules/") for path in paths):
+            profile.module_hook_files += 1
+            profile.module_hooks += len(page.symbols)
+        else:
+            profile.core_hook_files += 1
+            profile.core_hooks += len(page.symbols)
+    return profile
+
+
+SYNTHETIC_VERBS = ("get", "set", "has", "can", "add", "remove", "find", "load", "save", "sync", "draw", "build", "check", "reset", "update")
+SYNTHETIC_NOUNS = ("player", "item", "vendor", "door", "faction", "class", "money", "chat", "config", "log", "data", "storage", "ticket", "warning", "spawn", "attribute", "flag", "command", "menu", "panel")
+SYNTHETIC_TYPES = ("string", "number", "boolean", "table", "Player", "Entity", "Color", "function", "string|nil", "table|nil")
+SYNTHETIC_REALMS = ("Server", "Client", "Shared")
+SYNTHETIC_FILLER = """local function helper{n}(value, fallback)
+    -- Normalizes a value before it is networked to clients.
+    if value == nil then return fallback end
+    if istable(value) then
+        local copy = {{}}
+        for key, entry in pairs(value) do
+            copy[key] = entry
+        end
+        return copy
+    end
+    return value
+end
+
+"""
+
+
+class SyntheticCorpus:
+    """Deterministic Lilia-style gamemode tree: doc blocks, module/submodule layouts and Folder:/File:/Append: directives."""
+
+    def __init__(self, profile: CorpusProfile, scale: float, seed: int = 0):
+        self.profile = profile
+        self.scale = scale
+        self.rng = random.Random(f"{seed}:{scale:g}")
+        self.hook_names: List[str] = []
+        self.used_hook_names: set = set()
+
+    def count(self, value: int, minimum: int = 1) -> int:
+        return max(minimum, round(value * self.scale))
+
+    def spread(self, total: int, buckets: int) -> List[int]:
+        """total split over buckets, each within a third of the mean."""
+        if buckets <= 0:
+            return []
+        sizes = [total // buckets] * buckets
+        for index in range(total - sum(sizes)):
+            sizes[index] += 1
+        for index in range(0, buckets - 1, 2):
+            shift = self.rng.randint(0, sizes[index] // 3)
+            sizes[index] -= shift
+            sizes[index + 1] += shift
+        return sizes
+
+    def identifier(self, used: set) -> str:
+        name = self.rng.choice(SYNTHETIC_VERBS) + self.rng.choice(SYNTHETIC_NOUNS).capitalize() + self.rng.choice(SYNTHETIC_NOUNS).capitalize()
+        unique = name
+        while unique in used:
+            unique = f"{name}{len(used)}"
+        used.add(unique)
+        return unique
+
+    def parameters(self) -> List[Tuple[str, str]]:
+        names = self.rng.sample(SYNTHETIC_NOUNS, self.rng.randint(0, 4))
+        return [(name, self.rng.choice(SYNTHETIC_TYPES)) for name in names]
+
+    def doc_block(self, purpose: str, params: List[Tuple[str, str]], example: str, hook: Optional[str] = None, category: Optional[str] = None) -> str:
+        lines = ["--[["]
+        if hook:
+            lines += ["    Hooks:", f"        {hook}({', '.join(name for name, _ in params)})", ""]
+        lines += ["    Purpose:", f"        {purpose}", ""]
+        if category:
+            lines += ["    Category:", f"        {category}", ""]
+        if params:
+            lines.append("    Parameters:")
+            for name, type_name in params:
+                lines += [f"        {name} ({type_name})", f"            The {name} this call works on.", ""]
+        if self.rng.random() < 0.6:
+            lines += ["    Returns:", f"        {self.rng.choice(SYNTHETIC_TYPES)}", "            The resulting value, or nil when nothing matched.", ""]
+        lines += ["    Example Usage:", "        ```lua", f"        {example}", "        ```", ""]
+        lines += ["    Realm:", f"        {self.rng.choice(SYNTHETIC_REALMS)}", "]]"]
+        return "\n".join(lines) + "\n"
+
+    def function_block(self, name: str, purpose: str) -> str:
+        params = self.parameters()
+        arguments = ", ".join(param for param, _ in params)
+        body = f'    hook.Run("{self.rng.choice(self.hook_names)}", {arguments or "nil"})\n' if self.hook_names and self.rng.random() < 0.3 else ""
+        return (
+            self.doc_block(purpose, params, f'local result = {name.replace(":", ".")}({arguments})')
+            + f'function {name}({arguments})\n{body}    return {params[0][0] if params else "nil"}\nend\n\n'
+        )
+
+    def hook_block(self, category: str) -> str:
+        name = self.identifier(self.used_hook_names)
+        name = name[0].upper() + name[1:]
+        self.hook_names.append(name)
+        params = self.parameters()
+        arguments = ", ".join(param for param, _ in params)
+        example = f'hook.Add("{name}", "liaExample{name}", function({arguments}) end)'
+        return self.doc_block(f"Runs when {category.lower()} state changes.", params, example, hook=name, category=category)
+
+    def directives(self, folder: str, filename: str, append: bool = False) -> str:
+        lines = ["--[[", f"    Folder: {folder}", f"    File: {filename}"]
+        if append:
+            lines.append("    Append: true")
+        return "\n".join(lines + ["]]"]) + "\n"
+
+    def iter_files(self) -> Iterator[Tuple[str, str]]:
+        """(relative path, text) for every file of the corpus, generated one at a time."""
+        profile = self.profile
+        modules = [f"{self.rng.choice(SYNTHETIC_NOUNS)}{index}" for index in range(self.count(profile.modules))]
+        submodules = [(modules[index % len(modules)], f"sub{index}") for index in range(self.count(profile.submodules, 0))]
+        categories = [noun.capitalize() for noun in SYNTHETIC_NOUNS[:12]]
+        files = 0
+        documented_bytes = 0
+
+        def documented(rel: str, text: str) -> Tuple[str, str]:
+            nonlocal files, documented_bytes
+            files += 1
+            documented_bytes += len(text.encode("utf-8"))
+            return rel, text
+
+        # Hooks first, so function bodies can fire them.
+        for index, size in enumerate(self.spread(self.count(profile.core_hooks), self.count(profile.core_hook_files))):
+            yield documented(f"gamemode/core/hooks/hooks{index}.lua", "".join(self.hook_block(self.rng.choice(categories)) for _ in range(size)))
+        module_hook_homes = [f"gamemode/modules/{module}/module.lua" for module in modules]
+        module_hook_homes += [f"gamemode/modules/{module}/submodules/{sub}/module.lua" for module, sub in submodules]
+        for index, size in enumerate(self.spread(self.count(profile.module_hooks), len(module_hook_homes))):
+            home = module_hook_homes[index]
+            yield documented(home, f'MODULE.name = "{Path(home).parent.name}"\n\n' + "".join(self.hook_block(self.rng.choice(categories)) for _ in range(size)))
+
+        for index, size in enumerate(self.spread(self.count(profile.meta_symbols), self.count(profile.meta_files))):
+            table = f"{SYNTHETIC_NOUNS[index % len(SYNTHETIC_NOUNS)]}{index}"
+            used: set = set()
+            parts = [self.directives("Developer - Meta Tables", f"{table}.md"), f"local {table}Meta = lia.meta.{table} or {{}}\n\n"]
+            parts += [self.function_block(f"{table}Meta:{self.identifier(used)}", f"Works on the {table} object.") for _ in range(size)]
+            yield documented(f"gamemode/core/meta/{table}.lua", "".join(parts))
+
+        # Each module gets a library page and each submodule appends to it. The inventory walk lists a
+        # directory's files before its subdirectories, so the module's own page is always written first.
+        library_homes = [(f"gamemode/modules/{module}/library.lua", module, False) for module in modules]
+        library_homes += [(f"gamemode/modules/{module}/submodules/{sub}/libraries/client.lua", module, True) for module, sub in submodules]
+        core_libraries = max(1, self.count(profile.library_files) - len(modules))
+        library_homes = [(f"gamemode/core/libraries/lib{index}.lua", f"lib{index}", False) for index in range(core_libraries)] + library_homes
+        library_sizes = self.spread(self.count(profile.library_symbols), len(library_homes))
+        hook_sizes = self.spread(self.count(profile.library_hooks, 0), core_libraries)
+        for index, ((path, library, append), size) in enumerate(zip(library_homes, library_sizes)):
+            used = set()
+            parts = [self.directives("Developer - Libraries", f"lia.{library}.md", append)]
+            if not append:
+                parts.append(f"--[[\n    {library.capitalize()}\n\n    Helpers for the {library} subsystem.\n]]\n--[[\n    Overview:\n        The {library} library groups the {library} helpers under `lia.{library}`.\n]]\n")
+            if index < core_libraries:
+                parts += [self.hook_block(self.rng.choice(categories)) for _ in range(hook_sizes[index])]
+            parts.append(f"lia.{library} = lia.{library} or {{}}\n\n")
+            parts += [self.function_block(f"lia.{library}.{self.identifier(used)}", f"Handles {library} bookkeeping.") for _ in range(size)]
+            yield documented(path, "".join(parts))
+
+        # Undocumented code fills the tree up to the profile's file count and size.
+        filler_files = max(0, self.count(profile.lua_files) - files)
+        filler_bytes = max(0, round(profile.lua_bytes * self.scale) - documented_bytes)
+        for index, size in enumerate(self.spread(filler_bytes, filler_files)):
+            module = modules[index % len(modules)]
+            path = f"gamemode/modules/{module}/derma/cl_panel{index}.lua" if index % 2 else f"gamemode/modules/{module}/netcalls/sv_net{index}.lua"
+            chunks = []
+            written = 0
+            while written < size:
+                chunk = SYNTHETIC_FILLER.format(n=len(chunks))
+                chunks.append(chunk)
+                written += len(chunk)
+            yield path, "".join(chunks)
+
+    def write(self, target_dir: Path, mkdocs_path: Path) -> Dict[str, int]:
+        """Write the corpus file by file, so only the file being generated is held in memory."""
+        if target_dir.exists():
+            shutil.rmtree(target_dir)
+        size = {"files": 0, "bytes": 0}
+        for rel, text in self.iter_files():
+            path = target_dir / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            data = text.encode("utf-8")
+            path.write_bytes(data)
+            size["files"] += 1
+            size["bytes"] += len(data)
+        documentation_dir = target_dir / "documentation"
+        for directory in docgen.DEVELOPER_SECTION_DIRS:
+            (documentation_dir / "docs" / directory).mkdir(parents=True, exist_ok=True)
+        if mkdocs_path.exists():
+            shutil.copyfile(mkdocs_path, documentation_dir / "mkdocs.yml")
+        return size
+
+
+def run_phase_suite(corpus_dir: Path, repeat: int) -> Dict[str, float]:
+    """Best-of-repeat seconds for each pipeline phase over one corpus, kept apart from the others."""
+    docs_dir = corpus_dir / "documentation" / "docs"
+    timings: Dict[str, float] = {}
+
+    def scan() -> int:
+        docgen.SOURCE_INVENTORIES.pop(os.fspath(corpus_dir), None)
+        docgen.SOURCE_CACHE.clear()
+        entries = {
+            entry.path: entry
+            for entry in (*docgen.meta_source_entries(corpus_dir), *docgen.library_source_entries(corpus_dir), *docgen.hook_source_entries(corpus_dir))
+        }
+        for path in entries:
+            source = docgen.SOURCE_CACHE.get(path)
+            if source is not None:
+                source.index
+        return len(entries)
+
+    def parse() -> List[docgen.Page]:
+        docgen.SOURCE_CACHE.clear(parsed_only=True)
+        return list(docgen.iter_corpus_pages(corpus_dir, docs_dir))
+
+    timings["scan_seconds"] = docgen.best_time(scan, repeat)
+    timings["parse_seconds"] = docgen.best_time(parse, repeat)
+    pages = parse()
+    timings["render_seconds"] = docgen.best_time(lambda: [docgen.render_page_markdown(page) for page in pages], repeat)
+
+    # Validation and nav sync work on a written tree, so write it once outside the timings.
+    written = set()
+    with redirect_stdout(StringIO()):
+        for page in docgen.merge_appended_pages(pages):
+            if page.output_path in written:
+                page = replace(page, output_path=page.output_path.with_name(f"{page.output_path.stem}-{len(written)}.md"))
+            written.add(page.output_path)
+            docgen.write_page(page)
+    docgen.DOC_MODEL.pages.clear()
+
+    def index() -> int:
+        rows = []
+        for page in pages:
+            url = page.output_path.relative_to(docs_dir).with_suffix("").as_posix() + "/"
+            rows.extend((name, url, *rest) for name, *rest in docgen.symbol_index_rows(page))
+        return len(json.dumps(docgen.SymbolIndex.build(rows).to_payload(), ensure_ascii=False, separators=(",", ":")))
+
+    def nav() -> None:
+        with redirect_stdout(StringIO()):
+            docgen.sync_mkdocs_nav(corpus_dir / "documentation" / "mkdocs.yml", docs_dir, docgen.DEVELOPER_SECTION_DIRS)
+
+    timings["validate_seconds"] = docgen.best_time(lambda: docgen.LinkChecker(corpus_dir, docs_dir).run(), repeat)
+    timings["index_seconds"] = docgen.best_time(index, repeat)
+    timings["nav_seconds"] = docgen.best_time(nav, repeat)
+    timings["pages"] = len(pages)
+    timings["symbols"] = sum(len(page.symbols) + len(page.hooks) for page in pages)
+    return timings
+
+
+def bench_phases(base_dir: Path, docs_dir: Path, repeat: int, scales: Sequence[float] = (1,), seed: int = 0, corpus_dir: Optional[Path] = None) -> Dict[str, object]:
+    """Time scan, parse, render, validate, index and nav sync over synthetic corpora scaled from gamemode/."""
+    profile = measure_corpus_profile(base_dir, docs_dir)
+    results: Dict[str, object] = {"profile": asdict(profile), "seed": seed, "repeat": repeat}
+    with tempfile.TemporaryDirectory(prefix="docgen-corpus-") as temp_dir:
+        root = corpus_dir or Path(temp_dir)
+        for scale in scales:
+            label = f"x{scale:g}"
+            target_dir = root / label
+            started = time.perf_counter()
+            size = SyntheticCorpus(profile, scale, seed).write(target_dir, base_dir / "documentation" / "mkdocs.yml")
+            print(f" phases {label}: generated {size['files']} Lua files ({size['bytes']} bytes) in {time.perf_counter() - started:.2f}s")
+            timings = run_phase_suite(target_dir, repeat)
+            results[label] = {**size, **timings}
+            print(
+                f" phases {label}: {timings['pages']} pages, {timings['symbols']} symbols, best of {repeat}: "
+                + ", ".join(f"{name[:-len('_seconds')]} {seconds * 1000:.1f} ms" for name, seconds in timings.items() if name.endswith("_seconds"))
+            )
+            docgen.SOURCE_INVENTORIES.pop(os.fspath(target_dir), None)
+            docgen.SOURCE_CACHE.clear()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time each documentation build phase over synthetic corpora scaled from gamemode/.")
+    parser.add_argument("--scale", type=float, action="append", metavar="N", help="Size of a synthetic corpus relative to gamemode/ (repeatable, e.g. --scale 1 --scale 10 --scale 100; default 1)")
+    parser.add_argument("--repeat", type=int, default=3, metavar="N", help="Timed passes per phase and corpus; the best one is reported")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic corpus generator")
+    parser.add_argument("--corpus-dir", metavar="DIR", help="Generate the synthetic corpora under DIR and keep them instead of using a temporary directory")
+    parser.add_argument("--output", metavar="PATH", help="Save the results as JSON to PATH")
+    parser.add_argument("--baseline", metavar="PATH", help="Compare against results saved with --output and fail on regressions")
+    parser.add_argument("--threshold", type=float, default=docgen.BENCH_REGRESSION_THRESHOLD, metavar="FRACTION", help=f"Slowdown over the baseline that counts as a regression (default {docgen.BENCH_REGRESSION_THRESHOLD})")
+    parser.add_argument("--no-history", action="store_true", help=f"Do not append the run to the {docgen.BENCH_HISTORY_NAME} history")
+    parser.add_argument("--label", metavar="NAME", help="Tag this run in the benchmark history so bench compare can refer to it by name")
+    args = parser.parse_args()
+
+    repeat = max(1, args.repeat)
+    corpus_dir = Path(args.corpus_dir).resolve() if args.corpus_dir else None
+    docgen.BENCHMARKS["phases"] = partial(bench_phases, scales=tuple(args.scale or (1,)), seed=args.seed, corpus_dir=corpus_dir)
+    docs_dir = REPO_ROOT / "documentation" / "docs"
+    if not docgen.run_benchmarks(REPO_ROOT, docs_dir, ["phases"], repeat, args.output, args.baseline, args.threshold, not args.no_history, args.label):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,32 @@ import os
 import re
 import sys
 import argparse
+import ast
+import urllib.parse
 import urllib.request
+import posixpath
 import json
+import hashlib
+import heapq
+import textwrap
 import shutil
+import sqlite3
+import subprocess
+import mmap
+import fnmatch
+import time
+import threading
+import tracemalloc
+import multiprocessing
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import contextmanager, nullcontext, redirect_stdout
+from functools import partial
+from itertools import accumulate
 from pathlib import Path
+from dataclasses import dataclass, field, asdict, replace
 from io import StringIO
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Sequence, Callable, Iterator
 
 CORE_HOOKS = {
     'OnCharVarChanged', 'GetModelGender', 'CharPreSave', 'PlayerLoadedChar', 'PlayerDeath',
@@ -34,296 +54,234 @@ CORE_HOOKS = {
 
 REPO_BLOB_BASE = "https://github.com/LiliaFramework/Lilia/blob/main"
 
+PAGE_CSS_BLOCK = '''<style>
+details > summary {
+    position: relative;
+    display: flex;
+    align-items: center;
+    min-height: 70px;
+    padding-right: 180px;
+}
 
-def parse_comment_block(comment_text):
-    lines = comment_text.strip().split('\n')
-    parsed = {
-        'purpose': '',
-        'when_called': '',
-        'category': '',
-        'parameters': [],
-        'returns': '',
-        'realm': '',
-        'examples': [],
-        'explanation': '',
-        'when_used': ''
-    }
-
-    current_section = None
-    current_example = None
-    example_complexity = None
-    section_content = []
-    pending_parameter = None# Track pending parameter for new format (name, type)
-
-    def finalize_current_section():
-        if current_section and section_content:
-            content = '\n'.join(section_content).strip()
-            if current_section == 'purpose':
-                parsed['purpose'] = content
-            elif current_section == 'when_called':
-                parsed['when_called'] = content
-            elif current_section == 'category':
-                parsed['category'] = content
-            elif current_section == 'when_used':
-                parsed['when_used'] = content
-            elif current_section == 'explanation':
-                parsed['explanation'] = content
-            elif current_section == 'returns':
-                parsed['returns'] = content
-            elif current_section == 'realm':
-                parsed['realm'] = content
-        section_content.clear()
+details > summary .summary-main {
+    min-width: 0;
+}
 
-    for line in lines:
-        original_line = line
-        line = line.strip()
+details > summary .source-link-button--summary {
+    position: absolute;
+    right: 56px;
+    top: 50%;
+    transform: translateY(-50%);
+    white-space: nowrap;
+    z-index: 2;
+}
+</style>\n\n'''
 
-        if line.startswith('--[[') or line.startswith('--]]') or line.strip() in ['[[', ']]', '--[[', '--]]'] or not line:
-            continue
 
-        if line.startswith('Purpose:'):
-            finalize_current_section()
-            current_section = 'purpose'
-            inline_content = line[8:].strip()
-            if inline_content:
-                section_content.append(inline_content)
-        elif line.startswith('When Called:'):
-            finalize_current_section()
-            current_section = 'when_called'
-            inline_content = line[12:].strip()
-            if inline_content:
-                section_content.append(inline_content)
-        elif line.startswith('When Used:'):
-            finalize_current_section()
-            current_section = 'when_used'
-            inline_content = line[10:].strip()
-            if inline_content:
-                section_content.append(inline_content)
-        elif line.startswith('Category:'):
-            finalize_current_section()
-            current_section = 'category'
-            inline_content = line[len('Category:'):].strip()
-            if inline_content:
-                section_content.append(inline_content)
-        elif line.startswith('Parameters:'):
-            finalize_current_section()
-            current_section = 'parameters'
-            inline = line[len('Parameters:'):].strip()
-            if inline:
-                m = re.match(r'-\s*([A-Za-z_][\w]*)\s*\(([^)]+)\)\s*:\s*(.+)', inline)
-                if m:
-                    parsed['parameters'].append({'name': m.group(1), 'type': m.group(2), 'description': m.group(3)})
-                else:
-                    m = re.match(r'([A-Za-z_][\w]*)\s*\(([^)]+)\)\s*:\s*(.+)', inline)
-                    if m:
-                        parsed['parameters'].append({'name': m.group(1), 'type': m.group(2), 'description': m.group(3)})
-                    else:
-                        m = re.match(r'([A-Za-z_][\w]*)\s*-\s*([^:]+):\s*(.+)', inline)
-                        if m:
-                            parsed['parameters'].append({'name': m.group(1), 'type': m.group(2).strip(), 'description': m.group(3)})
-        elif current_section == 'parameters':
-            if line.strip() and not line.startswith('--'):
-                if line.startswith('Returns:'):
-                    finalize_current_section()
-                    if pending_parameter:
-                        parsed['parameters'].append({
-                            'name': pending_parameter['name'],
-                            'type': pending_parameter['type'],
-                            'description': ''
-                        })
-                        pending_parameter = None
-                    current_section = 'returns'
-                    inline_content = line[8:].strip()
-                    if inline_content:
-                        section_content.append(inline_content)
-                elif line.startswith('Realm:'):
-                    finalize_current_section()
-                    if pending_parameter:
-                        parsed['parameters'].append({
-                            'name': pending_parameter['name'],
-                            'type': pending_parameter['type'],
-                            'description': ''
-                        })
-                        pending_parameter = None
-                    current_section = 'realm'
-                    inline_content = line[6:].strip()
-                    if inline_content:
-                        section_content.append(inline_content)
-                elif line.startswith('Category:'):
-                    finalize_current_section()
-                    if pending_parameter:
-                        parsed['parameters'].append({
-                            'name': pending_parameter['name'],
-                            'type': pending_parameter['type'],
-                            'description': ''
-                        })
-                        pending_parameter = None
-                    current_section = 'category'
-                    inline_content = line[len('Category:'):].strip()
-                    if inline_content:
-                        section_content.append(inline_content)
-                elif line.startswith('Example Usage:'):
-                    finalize_current_section()
-                    if pending_parameter:
-                        parsed['parameters'].append({
-                            'name': pending_parameter['name'],
-                            'type': pending_parameter['type'],
-                            'description': ''
-                        })
-                        pending_parameter = None
-                    current_section = 'examples'
-                elif len(original_line) > len(original_line.lstrip()):
-                    m = re.match(r'^\s+([A-Za-z_][\w]*)\s*\(([^)]+)\)\s*$', original_line)
-                    if m:
-                        if pending_parameter:
-                            parsed['parameters'].append({
-                                'name': pending_parameter['name'],
-                                'type': pending_parameter['type'],
-                                'description': ''
-                            })
-                        pending_parameter = {'name': m.group(1).strip(), 'type': m.group(2).strip()}
-                    else:
-                        if pending_parameter:
-                            desc = line.strip()
-                            parsed['parameters'].append({
-                                'name': pending_parameter['name'],
-                                'type': pending_parameter['type'],
-                                'description': desc
-                            })
-                            pending_parameter = None
-                            m = re.match(r'^\s+([A-Za-z_][\w]*)\s*\(([^)]+)\)\s*-\s*(.+)', original_line)
-                            if m:
-                                parsed['parameters'].append({'name': m.group(1).strip(), 'type': m.group(2).strip(), 'description': m.group(3).strip()})
-                            else:
-                                m = re.match(r'^\s+([A-Za-z_][\w]*)\s*-\s*(.+)', original_line)
-                                if m:
-                                    parsed['parameters'].append({'name': m.group(1).strip(), 'type': 'unknown', 'description': m.group(2).strip()})
-                else:
-                    current_section = None
-                    if line.startswith('Returns:'):
-                        finalize_current_section()
-                        current_section = 'returns'
-                        inline_content = line[8:].strip()
-                        if inline_content:
-                            section_content.append(inline_content)
-                    elif line.startswith('Realm:'):
-                        finalize_current_section()
-                        current_section = 'realm'
-                        inline_content = line[6:].strip()
-                        if inline_content:
-                            section_content.append(inline_content)
-                    elif line.startswith('Category:'):
-                        finalize_current_section()
-                        current_section = 'category'
-                        inline_content = line[len('Category:'):].strip()
-                        if inline_content:
-                            section_content.append(inline_content)
-                    elif line.startswith('Example Usage:'):
-                        current_section = 'examples'
-                if current_section == 'parameters':
-                    m = re.match(r'-\s*([A-Za-z_][\w]*)\s*\(([^)]+)\)\s*:\s*(.+)', line)
-                    if m:
-                        parsed['parameters'].append({'name': m.group(1).strip(), 'type': m.group(2).strip(), 'description': m.group(3).strip()})
-                    else:
-                        m = re.match(r'-\s*([A-Za-z_][\w]*)\s*:\s*(.+)', line)
-                        if m:
-                            parsed['parameters'].append({'name': m.group(1).strip(), 'type': 'unknown', 'description': m.group(2).strip()})
-                        else:
-                            m = re.match(r'([A-Za-z_][\w]*)\s*\(([^)]+)\)\s*:\s*(.+)', line)
-                            if m:
-                                parsed['parameters'].append({'name': m.group(1).strip(), 'type': m.group(2).strip(), 'description': m.group(3).strip()})
-                            else:
-                                m = re.match(r'\s*([^\-\s]+)\s*-\s*([^:]+):\s*(.+)', line)
-                                if m:
-                                    parsed['parameters'].append({'name': m.group(1).strip(), 'type': m.group(2).strip(), 'description': m.group(3).strip()})
-                                else:
-                                    m = re.match(r'\s*([^\-\s]+)\s*-\s*(.+)', line)
-                                    if m:
-                                        parsed['parameters'].append({'name': m.group(1).strip(), 'type': 'unknown', 'description': m.group(2).strip()})
-        elif line.startswith('Returns:'):
-            finalize_current_section()
-            current_section = 'returns'
-            inline_content = line[8:].strip()
-            if inline_content:
-                section_content.append(inline_content)
-        # Check if next line might have the return type (new format)
-        # This will be handled in the returns section processing
-        elif line.startswith('Realm:'):
-            finalize_current_section()
-            current_section = 'realm'
-            inline_content = line[6:].strip()
-            if inline_content:
-                section_content.append(inline_content)
-        elif line.startswith('Category:'):
-            finalize_current_section()
-            current_section = 'category'
-            inline_content = line[len('Category:'):].strip()
-            if inline_content:
-                section_content.append(inline_content)
-        elif line.startswith('Explanation of Panel:'):
-            finalize_current_section()
-            current_section = 'explanation'
-            inline_content = line[len('Explanation of Panel:'):].strip()
-            if inline_content:
-                section_content.append(inline_content)
-        elif line.startswith('Example Usage:'):
-            finalize_current_section()
-            current_section = 'examples'
-        elif line.startswith('Example Item:') or line.startswith('Example Class:') or line.startswith('Example Faction:'):
-            finalize_current_section()
-            current_section = 'examples'
-        elif current_section in ['purpose', 'when_called', 'when_used', 'category', 'returns', 'realm', 'explanation']:
-            if line.strip():
-                section_content.append(line)
-        elif current_section == 'examples':
-            if line.strip() in ['Example Item:', 'Example Class:', 'Example Faction:']:
+COMMENT_SECTION_HEADERS = {
+    'Purpose': 'purpose',
+    'When Called': 'when_called',
+    'When Used': 'when_used',
+    'Category': 'category',
+    'Parameters': 'parameters',
+    'Returns': 'returns',
+    'Realm': 'realm',
+    'Explanation of Panel': 'explanation',
+    'Example Usage': 'examples',
+    'Example Item': 'examples',
+    'Example Class': 'examples',
+    'Example Faction': 'examples',
+}
+COMMENT_HEADER_PATTERN = re.compile('(' + '|'.join(re.escape(header) for header in COMMENT_SECTION_HEADERS) + '):')
+COMMENT_TEXT_SECTIONS = frozenset({'purpose', 'when_called', 'when_used', 'category', 'returns', 'realm', 'explanation'})
+# These open their section from any state; inside Parameters they leave a pending parameter pending.
+ALWAYS_OPEN_SECTIONS = frozenset({'purpose', 'when_called', 'when_used', 'category', 'parameters'})
+# The only headers that end a Parameters section (flushing a pending parameter); others there read as parameter text.
+PARAMETER_CLOSING_HEADERS = frozenset({'Returns', 'Realm', 'Example Usage'})
+
+INLINE_PARAMETER_PATTERN = re.compile(r'-?\s*([A-Za-z_][\w]*)\s*\(([^)]+)\)\s*:\s*(.+)')
+INLINE_DASH_PARAMETER_PATTERN = re.compile(r'([A-Za-z_][\w]*)\s*-\s*([^:]+):\s*(.+)')
+INDENTED_PARAMETER_PATTERN = re.compile(r'^\s+([A-Za-z_][\w]*)\s*\(([^)]+)\)\s*$')
+INDENTED_PARAMETER_DESC_PATTERN = re.compile(r'^\s+([A-Za-z_][\w]*)\s*\(([^)]+)\)\s*-\s*(.+)')
+INDENTED_UNTYPED_PARAMETER_PATTERN = re.compile(r'^\s+([A-Za-z_][\w]*)\s*-\s*(.+)')
+# Tried in order on each Parameters line; patterns with two groups have no type.
+PARAMETER_LINE_PATTERNS = (
+    re.compile(r'-\s*([A-Za-z_][\w]*)\s*\(([^)]+)\)\s*:\s*(.+)'),
+    re.compile(r'-\s*([A-Za-z_][\w]*)\s*:\s*(.+)'),
+    re.compile(r'([A-Za-z_][\w]*)\s*\(([^)]+)\)\s*:\s*(.+)'),
+    re.compile(r'\s*([^\-\s]+)\s*-\s*([^:]+):\s*(.+)'),
+    re.compile(r'\s*([^\-\s]+)\s*-\s*(.+)'),
+)
+EXAMPLE_HEADING_PATTERN = re.compile(r'(\w+)(?:\s+Complexity)?(?:\s+Example)?:')
+NAMED_EXAMPLE_HEADING_PATTERN = re.compile(r'(.+?)\s+Example:')
+EXAMPLE_COMPLEXITY_COMMENT_PATTERN = re.compile(r'--\s*(\w+):')
+EXAMPLE_COMPLEXITIES = frozenset({'low', 'medium', 'high'})
+SKIPPED_COMMENT_LINES = frozenset({'[[', ']]'})
+
+
+class CommentBlockParser:
+    """Parse one doc comment block: a header regex picks the section, a state table handles its lines."""
+
+    __slots__ = ('parsed', 'section', 'content', 'pending_parameter', 'example', 'handlers')
+
+    def __init__(self):
+        self.parsed = {
+            'purpose': '',
+            'when_called': '',
+            'category': '',
+            'parameters': [],
+            'returns': '',
+            'realm': '',
+            'examples': [],
+            'explanation': '',
+            'when_used': ''
+        }
+        self.section = None
+        self.content = []
+        self.pending_parameter = None
+        self.example = None
+        self.handlers = {section: self.text_line for section in COMMENT_TEXT_SECTIONS}
+        self.handlers['parameters'] = self.parameter_line
+        self.handlers['examples'] = self.example_line
+
+    def parse(self, comment_text: str) -> dict:
+        for original_line in comment_text.strip().split('\n'):
+            line = original_line.strip()
+            if not line or line.startswith(('--[[', '--]]')) or line in SKIPPED_COMMENT_LINES:
                 continue
-            complexity_match = None
-            if not (current_example and current_example.get('in_code_block', False)):
-                complexity_match = re.match(r'(\w+)(?:\s+Complexity)?(?:\s+Example)?:', line)
-                if not complexity_match and 'Example:' in line:
-                    complexity_match = re.match(r'(.+?)\s+Example:', line)
-            if complexity_match:
-                if current_example:
-                    parsed['examples'].append(current_example)
-
-                example_complexity = complexity_match.group(1).lower()
-                current_example = {
-                    'complexity': example_complexity,
-                    'code': []
-                }
-            elif not current_example and line.strip().startswith('```'):
-                current_example = {
-                    'complexity': 'example',
-                    'code': []
-                }
-                current_example['in_code_block'] = True
-            elif current_example and line.strip().startswith('```'):
-                if not current_example.get('in_code_block', False):
-                    current_example['in_code_block'] = True
+
+            header = COMMENT_HEADER_PATTERN.match(line)
+            if header:
+                name = header.group(1)
+                section = COMMENT_SECTION_HEADERS[name]
+                if section in ALWAYS_OPEN_SECTIONS:
+                    self.open_section(section, line[header.end():].strip())
+                    continue
+                if self.section != 'parameters':
+                    self.open_section(section, line[header.end():].strip())
+                    continue
+                if name in PARAMETER_CLOSING_HEADERS:
+                    self.finalize_section()
+                    self.flush_pending_parameter()
+                    self.section = section
+                    self.add_inline(section, line[header.end():].strip())
+                    continue
+
+            handler = self.handlers.get(self.section)
+            if handler is not None:
+                handler(line, original_line)
+
+        self.finalize_section()
+        self.flush_pending_parameter()
+        if self.example:
+            self.parsed['examples'].append(self.example)
+        return self.parsed
+
+    def finalize_section(self) -> None:
+        if self.section in COMMENT_TEXT_SECTIONS and self.content:
+            self.parsed[self.section] = '\n'.join(self.content).strip()
+        self.content.clear()
+
+    def open_section(self, section: str, inline: str) -> None:
+        self.finalize_section()
+        self.section = section
+        if section == 'parameters':
+            self.add_inline_parameter(inline)
+        else:
+            self.add_inline(section, inline)
+
+    def add_inline(self, section: str, inline: str) -> None:
+        if inline and section in COMMENT_TEXT_SECTIONS:
+            self.content.append(inline)
+
+    def add_parameter(self, name: str, type_name: str, description: str) -> None:
+        self.parsed['parameters'].append({'name': name, 'type': type_name, 'description': description})
+
+    def add_inline_parameter(self, inline: str) -> None:
+        if not inline:
+            return
+        match = INLINE_PARAMETER_PATTERN.match(inline)
+        if match:
+            self.add_parameter(match.group(1), match.group(2), match.group(3))
+            return
+        match = INLINE_DASH_PARAMETER_PATTERN.match(inline)
+        if match:
+            self.add_parameter(match.group(1), match.group(2).strip(), match.group(3))
+
+    def flush_pending_parameter(self) -> None:
+        if self.pending_parameter:
+            self.add_parameter(self.pending_parameter['name'], self.pending_parameter['type'], '')
+            self.pending_parameter = None
+
+    def text_line(self, line: str, original_line: str) -> None:
+        self.content.append(line)
+
+    def parameter_line(self, line: str, original_line: str) -> None:
+        if line.startswith('--'):
+            return
+
+        if len(original_line) <= len(original_line.lstrip()):
+            # An unindented line that is not a section header ends the parameter list.
+            self.section = None
+            return
+
+        match = INDENTED_PARAMETER_PATTERN.match(original_line)
+        if match:
+            self.flush_pending_parameter()
+            self.pending_parameter = {'name': match.group(1).strip(), 'type': match.group(2).strip()}
+        elif self.pending_parameter:
+            pending = self.pending_parameter
+            self.pending_parameter = None
+            self.add_parameter(pending['name'], pending['type'], line)
+            match = INDENTED_PARAMETER_DESC_PATTERN.match(original_line)
+            if match:
+                self.add_parameter(match.group(1).strip(), match.group(2).strip(), match.group(3).strip())
+            else:
+                match = INDENTED_UNTYPED_PARAMETER_PATTERN.match(original_line)
+                if match:
+                    self.add_parameter(match.group(1).strip(), 'unknown', match.group(2).strip())
+
+        for pattern in PARAMETER_LINE_PATTERNS:
+            match = pattern.match(line)
+            if match:
+                groups = match.groups()
+                if len(groups) == 3:
+                    self.add_parameter(groups[0].strip(), groups[1].strip(), groups[2].strip())
                 else:
-                    current_example['in_code_block'] = False
-                    current_example['code'].append('')
-            elif current_example and current_example.get('in_code_block', False):
-                if line.strip().startswith('--') and ':' in line:
-                    complexity_match = re.match(r'--\s*(\w+):', line.strip())
-                    if complexity_match and complexity_match.group(1).lower() in ['low', 'medium', 'high']:
-                        current_example['complexity'] = complexity_match.group(1).lower()
-                current_example['code'].append(original_line.rstrip())
-
-    finalize_current_section()
-
-    if pending_parameter:
-        parsed['parameters'].append({
-            'name': pending_parameter['name'],
-            'type': pending_parameter['type'],
-            'description': ''
-        })
+                    self.add_parameter(groups[0].strip(), 'unknown', groups[1].strip())
+                break
 
-    if current_example:
-        parsed['examples'].append(current_example)
+    def example_line(self, line: str, original_line: str) -> None:
+        example = self.example
+        in_code_block = bool(example and example.get('in_code_block', False))
+        heading = None
+        if not in_code_block:
+            heading = EXAMPLE_HEADING_PATTERN.match(line)
+            if not heading and 'Example:' in line:
+                heading = NAMED_EXAMPLE_HEADING_PATTERN.match(line)
+
+        if heading:
+            if example:
+                self.parsed['examples'].append(example)
+            self.example = {'complexity': heading.group(1).lower(), 'code': []}
+        elif not example and line.startswith('```'):
+            self.example = {'complexity': 'example', 'code': [], 'in_code_block': True}
+        elif example and line.startswith('```'):
+            if not in_code_block:
+                example['in_code_block'] = True
+            else:
+                example['in_code_block'] = False
+                example['code'].append('')
+        elif in_code_block:
+            if line.startswith('--') and ':' in line:
+                match = EXAMPLE_COMPLEXITY_COMMENT_PATTERN.match(line)
+                if match and match.group(1).lower() in EXAMPLE_COMPLEXITIES:
+                    example['complexity'] = match.group(1).lower()
+            example['code'].append(original_line.rstrip())
 
-    return parsed
+
+def parse_comment_block(comment_text):
+    return CommentBlockParser().parse(comment_text)
 
 
 def parse_file_header(header_text):
@@ -503,7 +461,7 @@ def extract_function_name_from_comment(comment_text, file_path):
 
 def get_repo_relative_path(file_path, base_dir):
     try:
-        return Path(file_path).resolve().relative_to(Path(base_dir).resolve()).as_posix()
+        return '/'.join(source_relative_parts(file_path, base_dir))
     except ValueError:
         return Path(file_path).as_posix()
 
@@ -516,56 +474,1119 @@ def build_source_url(file_path, base_dir, line_number=None):
     return url
 
 
-def find_block_line(content, block_text):
-    if not block_text:
-        return None
+@dataclass(slots=True)
+class SourceLocation:
+    path: str
+    line: Optional[int] = None
+
+    @property
+    def url(self) -> str:
+        url = f"{REPO_BLOB_BASE}/{self.path}"
+        if self.line:
+            url += f"#L{self.line}"
+        return url
+
+
+@dataclass(slots=True)
+class Parameter:
+    name: str
+    type: str
+    description: str = ''
+
+
+@dataclass(slots=True)
+class Example:
+    complexity: str
+    code: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Symbol:
+    """One documented function, meta method or hook, parsed once from its comment block."""
+
+    name: str
+    kind: str
+    purpose: str = ''
+    when_called: str = ''
+    when_used: str = ''
+    category: str = ''
+    realm: str = ''
+    returns: str = ''
+    explanation: str = ''
+    parameters: List[Parameter] = field(default_factory=list)
+    examples: List[Example] = field(default_factory=list)
+    location: Optional[SourceLocation] = None
+
+    @classmethod
+    def from_comment(cls, name: str, kind: str, comment_text: str, location: Optional[SourceLocation]=None) -> 'Symbol':
+        parsed = parse_comment_block(comment_text)
+        return cls(
+            name=name,
+            kind=kind,
+            purpose=parsed['purpose'],
+            when_called=parsed['when_called'],
+            when_used=parsed['when_used'],
+            category=parsed['category'],
+            realm=parsed['realm'],
+            returns=parsed['returns'],
+            explanation=parsed['explanation'],
+            parameters=[Parameter(p['name'], p['type'], p.get('description') or '') for p in parsed['parameters']],
+            examples=[Example(e['complexity'], e['code']) for e in parsed['examples']],
+            location=location,
+        )
 
-    start_index = content.find(block_text)
-    if start_index == -1:
-        return None
+    def to_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+    def to_compact(self) -> list:
+        """Positional form of the symbol; field order is given by SYMBOL_FIELDS."""
+        return [
+            self.name, self.kind, self.purpose, self.when_called, self.when_used, self.category,
+            self.realm, self.returns, self.explanation,
+            [[p.name, p.type, p.description] for p in self.parameters],
+            [[e.complexity, e.code] for e in self.examples],
+            [self.location.path, self.location.line] if self.location else None,
+        ]
 
-    return content[:start_index].count('\n') + 1
+    @classmethod
+    def from_compact(cls, row: list) -> 'Symbol':
+        location = row[11]
+        return cls(
+            *row[:9],
+            parameters=[Parameter(*p) for p in row[9]],
+            examples=[Example(*e) for e in row[10]],
+            location=SourceLocation(*location) if location else None,
+        )
 
 
-def find_functions_in_file(file_path, is_library=False):
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except UnicodeDecodeError:
-        print(f"Warning: Could not read {file_path} due to encoding issues")
-        return []
+SYMBOL_FIELDS = tuple(Symbol.__dataclass_fields__)
+
+
+@dataclass(slots=True)
+class Page:
+    """A generated reference page and the symbols rendered onto it."""
+
+    output_path: Path
+    kind: str
+    title: str
+    subtitle: str
+    overview: Optional[str] = None
+    symbols: List[Symbol] = field(default_factory=list)
+    hooks: List[Symbol] = field(default_factory=list)
+    sources: List[str] = field(default_factory=list)
+    location: Optional[SourceLocation] = None
+    append: bool = False
+    is_library: bool = False
+    no_realm: bool = False
+    no_icon: bool = False
+
+    def relative_path(self, root: Optional[Path]=None) -> str:
+        if root is not None:
+            try:
+                return self.output_path.relative_to(root).as_posix()
+            except ValueError:
+                pass
+        return self.output_path.as_posix()
+
+    def to_dict(self, root: Optional[Path]=None) -> Dict[str, object]:
+        return {
+            'path': self.relative_path(root),
+            'kind': self.kind,
+            'title': self.title,
+            'subtitle': self.subtitle,
+            'overview': self.overview,
+            'symbols': [symbol.to_dict() for symbol in self.symbols],
+            'hooks': [symbol.to_dict() for symbol in self.hooks],
+            'sources': list(self.sources),
+            'location': asdict(self.location) if self.location else None,
+            'append': self.append,
+        }
+
+    def to_compact(self, root: Optional[Path]=None) -> list:
+        return [
+            self.relative_path(root), self.kind, self.title, self.subtitle, self.overview,
+            [symbol.to_compact() for symbol in self.symbols],
+            [symbol.to_compact() for symbol in self.hooks],
+            list(self.sources),
+            [self.location.path, self.location.line] if self.location else None,
+            self.append,
+        ]
+
+
+# Per-thread sinks used by PhaseScheduler so concurrently running phases keep their log and page order.
+PHASE_CONTEXT = threading.local()
+
+
+NULL_SPAN = nullcontext()
+TRACE_SLOWEST_FILES = 10
+
+
+class TraceRecorder:
+    """Chrome trace-event spans for phases and per-file steps; a shared no-op context while disabled."""
+
+    def __init__(self):
+        self.recording = False
+        self.output: Optional[Path] = None
+        self.base_dir: Optional[Path] = None
+        self.events: List[dict] = []
+        self._threads: set = set()
+
+    def configure(self, output: Optional[str], base_dir: Path) -> None:
+        self.output = Path(output) if output else None
+        self.base_dir = base_dir
+        self.recording = self.output is not None
+
+    def span(self, name: str, category: str, **args):
+        if not self.recording:
+            return NULL_SPAN
+        return self._record(name, category, args)
+
+    @contextmanager
+    def _record(self, name: str, category: str, args: Dict[str, object]):
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            pid, tid = os.getpid(), threading.get_native_id()
+            if (pid, tid) not in self._threads:
+                self._threads.add((pid, tid))
+                thread_name = threading.current_thread().name if multiprocessing.parent_process() is None else f'worker {pid}'
+                self.events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': thread_name}})
+            self.events.append({
+                'name': name, 'cat': category, 'ph': 'X', 'pid': pid, 'tid': tid,
+                'ts': started // 1000, 'dur': (time.perf_counter_ns() - started) // 1000, 'args': args,
+            })
+
+    def take(self, start: int) -> List[dict]:
+        """Remove and return the events recorded since start, e.g. to ship them from a worker process."""
+        events = self.events[start:]
+        del self.events[start:]
+        return events
+
+    def relative(self, path) -> str:
+        try:
+            return Path(path).relative_to(self.base_dir).as_posix()
+        except ValueError:
+            return os.fspath(path)
+
+    def slowest_files(self, limit: int=TRACE_SLOWEST_FILES) -> List[Tuple[str, float, int, Dict[str, float]]]:
+        """(file, seconds, bytes, seconds per step) for the source files whose steps took longest overall."""
+        totals: Dict[str, Dict[str, float]] = {}
+        sizes: Dict[str, int] = {}
+        for event in self.events:
+            source = event.get('args', {}).get('file') if event['ph'] == 'X' else None
+            if not source or not source.endswith('.lua'):
+                continue
+            steps = totals.setdefault(source, {})
+            steps[event['name']] = steps.get(event['name'], 0.0) + event['dur'] / 1e6
+            if 'bytes' in event['args'] and event['name'] == 'read':
+                sizes[source] = event['args']['bytes']
+        ranked = sorted(totals.items(), key=lambda item: -sum(item[1].values()))[:limit]
+        return [(source, sum(steps.values()), sizes.get(source, 0), steps) for source, steps in ranked]
+
+    def phase_timings(self, command: str) -> Dict[str, float]:
+        timings: Dict[str, float] = {}
+        for event in self.events:
+            if event['ph'] == 'X' and event['cat'] == 'phase':
+                name = f"profile.{command}.{event['name']}_seconds"
+                timings[name] = timings.get(name, 0.0) + event['dur'] / 1e6
+        return timings
+
+    def save(self) -> None:
+        if not self.recording:
+            return
+        for event in self.events:
+            source = event.get('args', {}).get('file')
+            if source:
+                event['args']['file'] = self.relative(source)
+        payload = {'traceEvents': self.events, 'displayTimeUnit': 'ms', 'otherData': {'command': ' '.join(sys.argv[1:])}}
+        OUTPUT_WRITER.write_text(self.output, json.dumps(payload, separators=(',', ':')) + '\n')
+        spans = sum(1 for event in self.events if event['ph'] == 'X')
+        print(f" Wrote {spans} trace spans to {self.output} (open in https://ui.perfetto.dev or chrome://tracing)")
+        slowest = self.slowest_files()
+        if slowest:
+            print(f" Slowest {len(slowest)} source files:")
+            for source, seconds, size, steps in slowest:
+                breakdown = ', '.join(f'{step} {step_seconds * 1000:.1f}' for step, step_seconds in sorted(steps.items(), key=lambda item: -item[1]))
+                print(f"  {seconds * 1000:8.1f} ms  {source} ({size} bytes; {breakdown} ms)")
+
+
+TRACE = TraceRecorder()
+
+
+MEMORY_TRACE_FRAMES = 4
+# Breaking memory down by category walks every live allocation, so it is redone only after this much growth.
+MEMORY_CATEGORIZE_GROWTH = 1024 * 1024
+# Allocations are charged to the innermost generate_docs.py function on their stack that one of these prefixes claims.
+MEMORY_CATEGORIES = (
+    ('source text', ('SourceCache.get', 'SourceFile.raw_text', '_read_file_text')),
+    ('lexed sources', ('LuaSourceIndex.',)),
+    ('parsed blocks', ('CommentBlockParser.', 'parse_comment_block', 'Symbol.', 'SourceFile.symbol', 'SourceFile.folder_directives', 'find_comment_blocks_in_file', 'find_hook_docs_in_file', 'find_functions_in_file', 'collect_hook_file', 'build_documentation_page')),
+    ('rendered sections', ('generate_markdown_for_function', 'render_page_markdown', 'write_page', 'write_split_page', 'DetailFragmentStore.', 'build_hook_group_page', 'format_lua_code', 'LuaStubWriter.')),
+    ('indexes and registry', ('PageRegistry.', 'SymbolIndex.', 'HookCallIndex.', 'BuildManifest.', 'SourceInventory.', 'symbol_index_rows', 'collect_symbol_index_rows', 'write_symbol_index')),
+)
+BYTE_SIZE_PATTERN = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([kmg]?)i?b?\s*$', re.IGNORECASE)
+
+
+def parse_byte_size(text: str) -> int:
+    """argparse type for sizes such as 800000000, 512M, 1.5GiB."""
+    match = BYTE_SIZE_PATTERN.match(text)
+    if not match:
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r} (use e.g. 512M or 2G)")
+    return int(float(match.group(1)) * 1024 ** ' kmg'.index(match.group(2).lower() or ' '))
+
+
+def format_byte_size(size: float) -> str:
+    return f'{size / (1024 * 1024):.1f} MB'
+
+
+@dataclass(slots=True)
+class PhaseMemory:
+    name: str
+    peak: int
+    retained: int
+    delta: int
+    categories: Dict[str, int]
 
-    functions = []
 
-    comment_pattern = r'--\[\[.*?\]\]'
-    comments = []
-    for match in re.finditer(comment_pattern, content, re.DOTALL):
-        comments.append((match.start(), match.end(), match.group(0)))
+class MemoryBudgetExceeded(RuntimeError):
+    """A build phase peaked above --memory-budget."""
 
-    func_pattern = r'(?<!local\s)function\s+([\w\.:]+)\s*\('
-    for match in re.finditer(func_pattern, content):
-        func_name = match.group(1)
-        func_line = content[:match.start()].count('\n') + 1
 
+class MemoryAccountant:
+    """tracemalloc peak and retained memory per build phase, broken down by what the memory holds."""
+
+    def __init__(self):
+        self.report = False
+        self.budget = 0
+        self.phases: List[PhaseMemory] = []
+        self._function_lines: List[Optional[str]] = []
+        self._categorized_at = -MEMORY_CATEGORIZE_GROWTH
+
+    @property
+    def enabled(self) -> bool:
+        return self.report or self.budget > 0
+
+    def configure(self, report: bool, budget: Optional[int]) -> None:
+        self.report = report
+        self.budget = budget or 0
+        if self.enabled and not tracemalloc.is_tracing():
+            self._function_lines = self._map_function_lines()
+            tracemalloc.start(MEMORY_TRACE_FRAMES)
+
+    @staticmethod
+    def _map_function_lines() -> List[Optional[str]]:
+        """Qualified name of the innermost function around each line of this file."""
+        source = Path(__file__).read_text(encoding='utf-8')
+        lines: List[Optional[str]] = [None] * (source.count('\n') + 2)
+
+        def visit(node, prefix: str) -> None:
+            for child in ast.iter_child_nodes(node):
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                    name = f'{prefix}{child.name}'
+                    if not isinstance(child, ast.ClassDef):
+                        lines[child.lineno:child.end_lineno + 1] = [name] * (child.end_lineno + 1 - child.lineno)
+                    visit(child, f'{name}.')
+                else:
+                    visit(child, prefix)
+
+        visit(ast.parse(source), '')
+        return lines
+
+    def category(self, traceback) -> str:
+        for frame in reversed(traceback):
+            if frame.filename != __file__ or frame.lineno >= len(self._function_lines):
+                continue
+            function = self._function_lines[frame.lineno]
+            if function is None:
+                continue
+            for category, prefixes in MEMORY_CATEGORIES:
+                if any(function.startswith(prefix) for prefix in prefixes):
+                    return category
+        return 'other'
+
+    def categorize(self) -> Dict[str, int]:
+        sizes: Dict[str, int] = {}
+        for stat in tracemalloc.take_snapshot().statistics('traceback'):
+            category = self.category(stat.traceback)
+            sizes[category] = sizes.get(category, 0) + stat.size
+        return dict(sorted(sizes.items(), key=lambda item: -item[1]))
+
+    def phase(self, name: str):
+        if not self.enabled:
+            return NULL_SPAN
+        return self._measure(name)
+
+    @contextmanager
+    def _measure(self, name: str):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            retained, peak = tracemalloc.get_traced_memory()
+            exceeded = self.budget and peak > self.budget
+            if (self.report or exceeded) and (exceeded or abs(retained - self._categorized_at) >= MEMORY_CATEGORIZE_GROWTH or not self.phases):
+                categories = self.categorize()
+                self._categorized_at = retained
+            else:
+                categories = self.phases[-1].categories if self.phases else {}
+            self.phases.append(PhaseMemory(name, peak, retained, retained - before, categories))
+        if exceeded:
+            raise MemoryBudgetExceeded(f"Memory budget of {format_byte_size(self.budget)} exceeded: {name} peaked at {format_byte_size(peak)} (--memory-budget)")
+
+    def summary_lines(self) -> List[str]:
+        lines = [f"  {'phase':<28} {'peak':>10} {'retained':>10} {'change':>10}  largest categories retained"]
+        for phase in self.phases:
+            top = ', '.join(f'{category} {format_byte_size(size)}' for category, size in list(phase.categories.items())[:3])
+            lines.append(f"  {phase.name:<28} {format_byte_size(phase.peak):>10} {format_byte_size(phase.retained):>10} {phase.delta / (1024 * 1024):>+7.1f} MB  {top}")
+        return lines
+
+    def print_report(self, jobs: int=1, always: bool=False) -> None:
+        if not (self.report or always) or not self.phases:
+            return
+        peak = max(self.phases, key=lambda phase: phase.peak)
+        budget = f", budget {format_byte_size(self.budget)}" if self.budget else ''
+        print(f" Memory (tracemalloc, Python allocations in the main process): peak {format_byte_size(peak.peak)} during {peak.name}{budget}")
+        if jobs > 1:
+            print("  Phases overlap and files are parsed in worker processes with -j, so per-phase figures are approximate")
+        for line in self.summary_lines():
+            print(line)
+        print("  Retained at the end by category: " + ', '.join(f'{category} {format_byte_size(size)}' for category, size in self.phases[-1].categories.items()))
+
+
+MEMORY = MemoryAccountant()
+
+
+class DocModel:
+    """Pages produced during this run, in the order they were written."""
+
+    def __init__(self):
+        self.pages: List[Page] = []
+
+    def add(self, page: Page) -> None:
+        pending = getattr(PHASE_CONTEXT, 'pages', None)
+        (pending if pending is not None else self.pages).append(page)
+
+    def symbol_count(self) -> int:
+        return sum(len(page.symbols) + len(page.hooks) for page in self.pages)
+
+    def write_json(self, output_path: Path, root: Optional[Path]=None, compact: bool=True) -> None:
+        if compact:
+            payload = {
+                'version': 1,
+                'symbol_fields': list(SYMBOL_FIELDS),
+                'page_fields': ['path', 'kind', 'title', 'subtitle', 'overview', 'symbols', 'hooks', 'sources', 'location', 'append'],
+                'pages': [page.to_compact(root) for page in self.pages],
+            }
+            text = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+        else:
+            payload = {'version': 1, 'pages': [page.to_dict(root) for page in self.pages]}
+            text = json.dumps(payload, ensure_ascii=False, indent=2)
+        OUTPUT_WRITER.write_text(output_path, text + '\n')
+
+
+DOC_MODEL = DocModel()
+
+
+class OutputWriter:
+    """Write generated files only when their bytes differ from what is already on disk."""
+
+    def __init__(self):
+        self.written = 0
+        self.unchanged = 0
+        self.deleted = 0
+        self.touched: set = set()
+        self.changed: set = set()
+        self._digests: Dict[Path, bytes] = {}
+
+    def _matches_disk(self, path: Path, data: bytes, digest: bytes) -> bool:
+        known = self._digests.get(path)
+        if known is not None and known != digest:
+            return False
+        try:
+            if path.stat().st_size != len(data):
+                return False
+            with open(path, 'rb') as f:
+                existing = f.read()
+        except OSError:
+            return False
+        if known is None and hashlib.blake2b(existing, digest_size=16).digest() != digest:
+            return False
+        return existing == data
+
+    def write_bytes(self, path: Path, data: bytes) -> bool:
+        path = Path(path)
+        self.touched.add(path)
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if self._matches_disk(path, data, digest):
+            self._digests[path] = digest
+            self.unchanged += 1
+            return False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f'.{path.name}.tmp')
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        self._digests[path] = digest
+        self.written += 1
+        self.changed.add(path)
+        return True
+
+    def write_text(self, path: Path, text: str) -> bool:
+        return self.write_bytes(path, text.encode('utf-8'))
+
+    @contextmanager
+    def open(self, path: Path):
+        """Collect writes in memory and commit them when the block exits cleanly."""
+        buffer = StringIO()
+        yield buffer
+        self.write_text(path, buffer.getvalue())
+
+    def delete(self, path: Path) -> bool:
+        path = Path(path)
+        self._digests.pop(path, None)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        PAGE_REGISTRY.forget(path)
+        if path.suffix == '.md':
+            remove_split_pages(path)
+            LUA_STUBS.discard(path)
+        self.deleted += 1
+        self.changed.add(path)
+        return True
+
+    def remove_untouched(self, output_dir: Path, pattern: str='*.md', keep: Sequence[str]=('index.md',)) -> int:
+        removed = 0
+        for path in sorted(output_dir.glob(pattern)):
+            if path.name not in keep and path not in self.touched and self.delete(path):
+                print(f" Removed orphaned {path.name}")
+                removed += 1
+        return removed
+
+    def report(self) -> str:
+        return f"Output: {self.written} files written, {self.unchanged} unchanged, {self.deleted} deleted"
+
+
+OUTPUT_WRITER = OutputWriter()
+
+
+DOCGEN_PAGES_NAME = '.docgen-pages.json'
+
+
+class PageRegistry:
+    """Title, summary, realms and symbol index rows of generated pages, recorded as they are written.
+
+    Index and nav generation look pages up here instead of re-reading the markdown. Entries
+    loaded from the sidecar file are trusted only while the page's size and mtime still match.
+    """
+
+    def __init__(self):
+        self.path: Optional[Path] = None
+        self.entries: Dict[str, dict] = {}
+        self._current: set = set()
+        self.lookups = 0
+        self.misses = 0
+
+    def load(self, path: Path) -> None:
+        self.path = path
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get('version') != 1:
+            return
+        for rel, entry in data.get('pages', {}).items():
+            self.entries.setdefault(os.fspath(path.parent / rel), entry)
+
+    def record(self, page: Page, text: str) -> None:
+        key = os.fspath(page.output_path)
+        # Match what reading the file back in text mode would produce.
+        title, summary = parse_title_and_summary(text.replace('\r\n', '\n').replace('\r', '\n'), page.output_path)
+        symbols = len(page.symbols) + len(page.hooks)
+        realms = {symbol.realm for symbol in (*page.symbols, *page.hooks) if symbol.realm}
+        rows = symbol_index_rows(page)
+        previous = self.entries.get(key) if page.append and key in self._current else None
+        if previous is not None:
+            symbols += previous['symbols']
+            realms.update(previous['realms'])
+            rows = previous.get('index', []) + rows
+
+        stat = os.stat(key)
+        self.entries[key] = {
+            'title': title,
+            'summary': summary,
+            'realms': sorted(realms),
+            'symbols': symbols,
+            'index': rows,
+            'stat': [stat.st_mtime_ns, stat.st_size],
+        }
+        self._current.add(key)
+
+    def _verified(self, key: str) -> Optional[dict]:
+        entry = self.entries.get(key)
+        if entry is not None and key not in self._current:
+            try:
+                stat = os.stat(key)
+            except OSError:
+                stat = None
+            if stat is None or [stat.st_mtime_ns, stat.st_size] != entry.get('stat'):
+                del self.entries[key]
+                entry = None
+            else:
+                self._current.add(key)
+        return entry
+
+    def lookup(self, md_file: Path) -> Optional[Tuple[str, str]]:
+        self.lookups += 1
+        entry = self._verified(os.fspath(md_file))
+        if entry is None:
+            self.misses += 1
+            return None
+        return entry['title'], entry['summary']
+
+    def paths(self) -> List[Path]:
+        return [Path(key) for key in sorted(self.entries)]
+
+    def symbol_rows(self, md_file: Path) -> Optional[List[list]]:
+        """Symbol index rows recorded for a page, or None if the page changed since or predates them."""
+        entry = self._verified(os.fspath(md_file))
+        return entry.get('index') if entry is not None else None
+
+    def forget(self, path: Path) -> None:
+        key = os.fspath(path)
+        self.entries.pop(key, None)
+        self._current.discard(key)
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        root = self.path.parent
+        pages = {}
+        for key, entry in sorted(self.entries.items()):
+            try:
+                pages[Path(key).relative_to(root).as_posix()] = entry
+            except ValueError:
+                continue
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        temp_path.write_text(json.dumps({'version': 1, 'pages': pages}, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+        os.replace(temp_path, self.path)
+
+    def report(self) -> str:
+        return f"Page registry: {len(self.entries)} pages, {self.lookups - self.misses} of {self.lookups} title lookups served without reading markdown"
+
+
+PAGE_REGISTRY = PageRegistry()
+
+
+FUNCTION_DOC_HEADERS = (
+    'Purpose:', 'When Called:', 'When Used:', 'Category:', 'Parameters:', 'Returns:', 'Realm:',
+    'Explanation of Panel:', 'Example Usage:'
+)
+
+NON_HEADER_BLOCK_MARKERS = (
+    'Purpose:', 'When Called:', 'When Used:', 'Category:', 'Parameters:', 'Returns:', 'Realm:',
+    'Example Usage:', 'Overview:', 'Improvements Done:', 'Example Item:', 'Folder:', 'File:'
+)
+
+LUA_DOC_TOKEN_PATTERN = re.compile(r'--\[\[|(?<!local\s)function\s+([\w\.:]+)\s*\(')
+LUA_COMMENT_BLOCK_PATTERN = re.compile(r'--\[\[.*?\]\]', re.DOTALL)
+LEADING_WHITESPACE_PATTERN = re.compile(r'\s*')
+NON_WHITESPACE_PATTERN = re.compile(r'\S')
+NEWLINE_PATTERN = re.compile(r'\n')
+
+
+class LuaSourceIndex:
+    """Comment blocks and function declarations of one Lua file, collected in a single pass."""
+
+    __slots__ = ('content', 'newline_offsets', 'blocks', 'functions', '_blocks_by_start', '_first_block_lines')
+
+    def __init__(self, content: str):
+        self.content = content
+        self.newline_offsets = [match.start() for match in NEWLINE_PATTERN.finditer(content)]
+        self.blocks: List[Dict[str, object]] = []
+        self.functions: List[Dict[str, object]] = []
+        self._blocks_by_start: Dict[int, Dict[str, object]] = {}
+        self._first_block_lines: Dict[str, int] = {}
+        self._scan()
+
+    def line_at(self, offset: int) -> int:
+        return bisect_left(self.newline_offsets, offset) + 1
+
+    def _make_block(self, start: int, end: int) -> Dict[str, object]:
+        return {
+            'text': self.content[start:end],
+            'line': self.line_at(start),
+            'start': start,
+            'end': end,
+        }
+
+    def _scan(self) -> None:
+        # Mirrors independent finditer passes for `--[[ ... ]]` blocks and `function name(`
+        # declarations: declarations inside a comment block are still reported, and
+        # `--[[` openers inside an earlier block are not.
+        content = self.content
+        search = LUA_DOC_TOKEN_PATTERN.search
+        comment_floor = 0
+        last_block = None
+        pos = 0
+
+        while True:
+            match = search(content, pos)
+            if match is None:
+                break
+
+            start = match.start()
+            name = match.group(1)
+            if name is None:
+                pos = start + 4
+                if start < comment_floor:
+                    continue
+                close = content.find(']]', pos)
+                if close == -1:
+                    comment_floor = len(content)
+                    continue
+                last_block = self._make_block(start, close + 2)
+                self.blocks.append(last_block)
+                self._blocks_by_start[start] = last_block
+                self._first_block_lines.setdefault(last_block['text'], last_block['line'])
+                comment_floor = close + 2
+                continue
+
+            pos = match.end()
+            self.functions.append({
+                'name': name,
+                'line': self.line_at(start),
+                'start': start,
+                'block': last_block,
+            })
+
+    def block_line(self, block_text: str) -> Optional[int]:
+        return self._first_block_lines.get(block_text)
+
+    def documented_block_for(self, function: Dict[str, object]) -> Optional[Dict[str, object]]:
+        """Return the doc block directly above a declaration, or None."""
+        block = function['block']
+        if block is None or block['line'] >= function['line']:
+            return None
+
+        if 'is_function_doc' not in block:
+            block['is_function_doc'] = any(header in block['text'] for header in FUNCTION_DOC_HEADERS)
+        if not block['is_function_doc']:
+            return None
+
+        if function['start'] < block['end']:
+            return block
+
+        if 'gap_end' not in block:
+            gap_match = NON_WHITESPACE_PATTERN.search(self.content, block['end'])
+            block['gap_end'] = gap_match.start() if gap_match else len(self.content)
+        if block['gap_end'] < function['start']:
+            return None
+        return block
+
+    def top_blocks(self) -> List[Dict[str, object]]:
+        """Return the comment blocks preceding the first line of code."""
+        content = self.content
+        length = len(content)
+        blocks = []
+        index = 0
+
+        while index < length:
+            index = LEADING_WHITESPACE_PATTERN.match(content, index).end()
+            if index >= length:
+                break
+
+            if content.startswith('--[[', index):
+                block = self._blocks_by_start.get(index)
+                if block is None:
+                    match = LUA_COMMENT_BLOCK_PATTERN.match(content, index)
+                    if not match:
+                        break
+                    block = self._make_block(match.start(), match.end())
+                blocks.append(block)
+                index = block['end']
+                continue
+
+            if content.startswith('--', index):
+                newline_index = content.find('\n', index)
+                if newline_index == -1:
+                    break
+                index = newline_index + 1
+                continue
+
+            break
+
+        return blocks
+
+
+class SourceFile:
+    """Decoded contents of one Lua file plus the data parsed from it."""
+
+    __slots__ = ('path', 'mtime_ns', 'size', 'content', 'has_bom', '_index', '_folder_directives', '_symbols')
+
+    def __init__(self, path: str, mtime_ns: int, size: int, content: str, has_bom: bool):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.content = content
+        self.has_bom = has_bom
+        self._index: Optional[LuaSourceIndex] = None
+        self._folder_directives: Optional[Tuple[Optional[str], Optional[str], bool]] = None
+        self._symbols: Dict[Tuple[str, str, Optional[int]], Symbol] = {}
+
+    @property
+    def index(self) -> LuaSourceIndex:
+        if self._index is None:
+            with TRACE.span('lex', 'file', file=self.path, bytes=self.size):
+                self._index = LuaSourceIndex(self.content)
+        return self._index
+
+    @property
+    def folder_directives(self) -> Tuple[Optional[str], Optional[str], bool]:
+        if self._folder_directives is None:
+            self._folder_directives = parse_folder_directives(self.content)
+        return self._folder_directives
+
+    def symbol(self, name: str, kind: str, comment_text: str, line: Optional[int], base_dir: Path) -> Symbol:
+        """Parse a doc block into a Symbol, reusing the result if another phase already did."""
+        key = (kind, name, line)
+        symbol = self._symbols.get(key)
+        if symbol is None:
+            location = SourceLocation(get_repo_relative_path(self.path, base_dir), line)
+            with TRACE.span('parse', 'file', file=self.path, symbol=name, bytes=len(comment_text)):
+                symbol = Symbol.from_comment(name, kind, comment_text, location)
+            self._symbols[key] = symbol
+        return symbol
+
+    @property
+    def raw_text(self) -> str:
+        return '\ufeff' + self.content if self.has_bom else self.content
+
+
+class SourceCache:
+    """Per-process cache so every Lua file is read, decoded and lexed once per build phase.
+
+    Between phases the decoded text and lexed indexes are released; symbols and directives parsed
+    from a file outlive that and are handed to the file again if a later phase re-reads it.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Tuple[int, int], Optional[SourceFile]]] = {}
+        self._parsed: Dict[str, Tuple[Tuple[int, int], Optional[Tuple[Optional[str], Optional[str], bool]], Dict[Tuple[str, str, Optional[int]], Symbol]]] = {}
+        self.reads = 0
+        self.hits = 0
+        self.bytes_read = 0
+
+    def get(self, file_path) -> Optional[SourceFile]:
+        path = os.fspath(file_path)
+        inventory_entry = find_inventory_entry(path)
+        if inventory_entry is not None:
+            key = inventory_entry.stat_key
+        else:
+            stat = os.stat(path)
+            key = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1]
+
+        with TRACE.span('read', 'file', file=path, bytes=key[1]):
+            with open(path, 'rb') as f:
+                data = f.read()
+            self.reads += 1
+            self.bytes_read += len(data)
+
+            has_bom = data.startswith(b'\xef\xbb\xbf')
+            try:
+                content = data.decode('utf-8-sig')
+            except UnicodeDecodeError:
+                print(f"Warning: Could not read {file_path} due to encoding issues")
+                source = None
+            else:
+                source = SourceFile(path, key[0], key[1], content, has_bom)
+                parsed = self._parsed.pop(path, None)
+                if parsed is not None and parsed[0] == key:
+                    source._folder_directives, source._symbols = parsed[1], parsed[2]
+
+        self._entries[path] = (key, source)
+        return source
+
+    def discard(self, file_path) -> None:
+        self._entries.pop(os.fspath(file_path), None)
+        self._parsed.pop(os.fspath(file_path), None)
+
+    def release(self) -> None:
+        """Drop decoded text and lexed indexes, keeping what was parsed from them."""
+        for path, (key, source) in list(self._entries.items()):
+            if source is not None and (source._symbols or source._folder_directives is not None):
+                self._parsed[path] = (key, source._folder_directives, source._symbols)
+        self._entries.clear()
+
+    def clear(self, parsed_only: bool=False) -> None:
+        """Forget every cached file, or with parsed_only just the symbols parsed from them."""
+        if parsed_only:
+            for _, source in self._entries.values():
+                if source is not None:
+                    source._symbols.clear()
+        else:
+            self._entries.clear()
+        self._parsed.clear()
+
+    def report(self) -> str:
+        return f"Source cache: {self.reads} files read ({self.bytes_read} bytes), {self.hits} cache hits"
+
+
+SOURCE_CACHE = SourceCache()
+
+
+REALM_PREFIXES = {'sv_': 'server', 'cl_': 'client', 'sh_': 'shared'}
+REALM_FILENAMES = {'server.lua': 'server', 'client.lua': 'client', 'shared.lua': 'shared'}
+
+
+def classify_source_parts(rel_parts: Tuple[str, ...]) -> str:
+    """Classify a gamemode-relative path by where it sits in the framework layout."""
+    if rel_parts[:3] == ('gamemode', 'core', 'meta'):
+        return 'meta'
+    if rel_parts[:3] == ('gamemode', 'core', 'libraries'):
+        return 'core-library'
+    if len(rel_parts) >= 3 and rel_parts[:2] == ('gamemode', 'modules'):
+        if 'libraries' in rel_parts:
+            return 'module-library'
+        if len(rel_parts) == 4 and rel_parts[3] == 'module.lua':
+            return 'module-entry'
+        if len(rel_parts) >= 4 and (rel_parts[-1] == 'module.lua' or len(rel_parts) == 4):
+            return 'submodule'
+        return 'module'
+    return 'core'
+
+
+def detect_source_realm(filename: str) -> Optional[str]:
+    lowered = filename.lower()
+    if lowered in REALM_FILENAMES:
+        return REALM_FILENAMES[lowered]
+    return REALM_PREFIXES.get(lowered[:3])
+
+
+class InventoryEntry:
+    """One Lua file found by the gamemode inventory walk."""
+
+    __slots__ = ('path', 'rel_parts', 'size', 'mtime_ns', 'realm', 'kind')
+
+    def __init__(self, path: Path, rel_parts: Tuple[str, ...], size: int, mtime_ns: int):
+        self.path = path
+        self.rel_parts = rel_parts
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.realm = detect_source_realm(rel_parts[-1])
+        self.kind = classify_source_parts(rel_parts)
+
+    @property
+    def stat_key(self) -> Tuple[int, int]:
+        return self.mtime_ns, self.size
+
+    @property
+    def rel_posix(self) -> str:
+        return '/'.join(self.rel_parts)
+
+
+class SourceInventory:
+    """Every Lua file under gamemode/, collected with one os.scandir walk.
+
+    Files are listed in the same order Path.rglob('*.lua') yields them, so
+    Append pages keep being assembled in the order they always were.
+    """
+
+    def __init__(self, base_dir: Path):
+        self.base_dir = Path(base_dir)
+        self.resolved_base = self.base_dir.resolve()
+        self.entries: List[InventoryEntry] = []
+        self.by_path: Dict[str, InventoryEntry] = {}
+        self._walk(self.base_dir / 'gamemode', ('gamemode',))
+
+    def _walk(self, directory: Path, rel_parts: Tuple[str, ...]) -> None:
+        try:
+            with os.scandir(directory) as it:
+                dir_entries = list(it)
+        except OSError:
+            return
+
+        subdirs = []
+        for dir_entry in dir_entries:
+            try:
+                is_dir = dir_entry.is_dir()
+            except OSError:
+                continue
+            if is_dir:
+                if not dir_entry.is_symlink():
+                    subdirs.append(dir_entry)
+                continue
+            if not os.path.normcase(dir_entry.name).endswith('.lua'):
+                continue
+            stat = dir_entry.stat()
+            self._add(InventoryEntry(directory / dir_entry.name, rel_parts + (dir_entry.name,), stat.st_size, stat.st_mtime_ns))
+
+        for dir_entry in subdirs:
+            self._walk(directory / dir_entry.name, rel_parts + (dir_entry.name,))
+
+    def _add(self, entry: InventoryEntry) -> None:
+        self.entries.append(entry)
+        self.by_path[os.fspath(entry.path)] = entry
+
+    def files(self, *prefix: str) -> List[InventoryEntry]:
+        """Return entries below gamemode/<prefix...> in walk order."""
+        full_prefix = ('gamemode',) + prefix
+        size = len(full_prefix)
+        return [entry for entry in self.entries if entry.rel_parts[:size] == full_prefix]
+
+    def get(self, file_path) -> Optional[InventoryEntry]:
+        return self.by_path.get(os.fspath(file_path))
+
+
+SOURCE_INVENTORIES: Dict[str, SourceInventory] = {}
+
+
+def get_source_inventory(base_dir: Path) -> SourceInventory:
+    key = os.fspath(base_dir)
+    inventory = SOURCE_INVENTORIES.get(key)
+    if inventory is None:
+        inventory = SourceInventory(base_dir)
+        SOURCE_INVENTORIES[key] = inventory
+    return inventory
+
+
+def refresh_source_inventory(base_dir: Path) -> List[str]:
+    """Re-walk base_dir and return the relative paths that were added, removed or modified."""
+    key = os.fspath(base_dir)
+    old_inventory = SOURCE_INVENTORIES.pop(key, None)
+    inventory = get_source_inventory(base_dir)
+    if old_inventory is None:
+        return [entry.rel_posix for entry in inventory.entries]
+
+    old_keys = {entry.rel_posix: entry.stat_key for entry in old_inventory.entries}
+    changed = [entry.rel_posix for entry in inventory.entries if old_keys.pop(entry.rel_posix, None) != entry.stat_key]
+    for rel in old_keys:
+        SOURCE_CACHE.discard(base_dir / rel)
+    return changed + sorted(old_keys)
+
+
+def find_inventory_entry(file_path) -> Optional[InventoryEntry]:
+    path = os.fspath(file_path)
+    for inventory in SOURCE_INVENTORIES.values():
+        entry = inventory.by_path.get(path)
+        if entry is not None:
+            return entry
+    return None
+
+
+DOC_BLOCK_OPENER = b'--[['
+HOOK_DOC_MARKERS = (b'Hooks:',)
+DIRECTIVE_MARKERS = (b'File:',)
+HOOK_CALL_MARKERS = (b'hook.',)
+
+
+def contains_doc_markers(file_path: Path, markers: Sequence[bytes], size: Optional[int]=None, opener: Optional[bytes]=DOC_BLOCK_OPENER) -> bool:
+    """Check raw bytes for an opener (`--[[` by default, None for anywhere) followed by any of the markers."""
+    if size == 0:
+        return False
+
+    with open(file_path, 'rb') as f:
+        try:
+            view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return False
+        with view:
+            start = 0
+            if opener is not None:
+                start = view.find(opener)
+                if start == -1:
+                    return False
+                start += len(opener)
+            return any(view.find(marker, start) != -1 for marker in markers)
+
+
+class DocPrefilter:
+    """Rejects Lua files that cannot hold the docs a phase needs before they are decoded."""
+
+    def __init__(self, exclude: Sequence[str]=()):
+        self.exclude = tuple(exclude)
+        self.checked = 0
+        self.skipped = 0
+        self.excluded = 0
+        self.bytes_skipped = 0
+
+    def is_excluded(self, entry: InventoryEntry) -> bool:
+        return any(fnmatch.fnmatchcase(entry.rel_posix, pattern) for pattern in self.exclude)
+
+    def accepts(self, entry: InventoryEntry, markers: Sequence[bytes]) -> bool:
+        if self.is_excluded(entry):
+            self.excluded += 1
+            self.bytes_skipped += entry.size
+            return False
+
+        self.checked += 1
+        if contains_doc_markers(entry.path, markers, entry.size):
+            return True
+
+        self.skipped += 1
+        self.bytes_skipped += entry.size
+        return False
+
+    def report(self) -> str:
+        return (
+            f"Prefilter: {self.checked} files checked, {self.skipped} skipped, "
+            f"{self.excluded} excluded ({self.bytes_skipped} bytes not decoded)"
+        )
+
+
+DOC_PREFILTER = DocPrefilter()
+
+
+def source_relative_parts(file_path: Path, base_dir: Path) -> Tuple[str, ...]:
+    for inventory in SOURCE_INVENTORIES.values():
+        entry = inventory.by_path.get(os.fspath(file_path))
+        if entry is not None and (inventory.base_dir == Path(base_dir) or inventory.resolved_base == Path(base_dir).resolve()):
+            return entry.rel_parts
+    return Path(file_path).resolve().relative_to(Path(base_dir).resolve()).parts
+
+
+def read_lua_source(file_path) -> Optional[LuaSourceIndex]:
+    source = SOURCE_CACHE.get(file_path)
+    return source.index if source else None
+
+
+def find_block_line(source: LuaSourceIndex, block_text):
+    if not block_text:
+        return None
+
+    return source.block_line(block_text)
+
+
+def find_functions_in_file(file_path, is_library=False):
+    source = read_lua_source(file_path)
+    if source is None:
+        return []
+
+    functions = []
+    for function in source.functions:
+        func_name = function['name']
         if is_library and not func_name.startswith('lia.'):
             continue
 
-        preceding_comment = None
-        for comment_start, comment_end, comment_text in comments:
-            comment_line = content[:comment_start].count('\n') + 1
-            if comment_line < func_line and (preceding_comment is None or comment_line > preceding_comment[0]):
-                if any(header in comment_text for header in ['Purpose:', 'When Called:', 'When Used:', 'Category:', 'Parameters:', 'Returns:', 'Realm:', 'Explanation of Panel:', 'Example Usage:']):
-                    gap_text = content[comment_end:match.start()]
-                    if gap_text.strip():
-                        continue
-                    preceding_comment = (comment_line, comment_text)
-
-        if preceding_comment:
+        block = source.documented_block_for(function)
+        if block:
             functions.append({
                 'name': func_name,
-                'comment': preceding_comment[1],
-                'line': func_line,
-                'comment_line': preceding_comment[0]
+                'comment': block['text'],
+                'line': function['line'],
+                'comment_line': block['line']
             })
 
     return functions
@@ -578,99 +1599,117 @@ def generate_anchor_from_name(name):
     return anchor
 
 
-def get_type_link(type_name):
-    type_links = {
-        'string': 'https://www.lua.org/manual/5.1/manual.html#2.1',
-        'number': 'https://www.lua.org/manual/5.1/manual.html#2.1',
-        'boolean': 'https://www.lua.org/manual/5.1/manual.html#2.1',
-        'table': 'https://www.lua.org/manual/5.1/manual.html#2.1',
-        'function': 'https://www.lua.org/manual/5.1/manual.html#2.1',
-        'nil': 'https://www.lua.org/manual/5.1/manual.html#2.1',
-        'thread': 'https://www.lua.org/manual/5.1/manual.html#2.1',
-        'userdata': 'https://www.lua.org/manual/5.1/manual.html#2.1',
-        'Player': 'https://wiki.facepunch.com/gmod/Player',
-        'Entity': 'https://wiki.facepunch.com/gmod/Entity',
-        'Vector': 'https://wiki.facepunch.com/gmod/Vector',
-        'Angle': 'https://wiki.facepunch.com/gmod/Angle',
-        'Color': 'https://wiki.facepunch.com/gmod/Color',
-        'Panel': 'https://wiki.facepunch.com/gmod/Panel',
-        'IMaterial': 'https://wiki.facepunch.com/gmod/IMaterial',
-        'ITexture': 'https://wiki.facepunch.com/gmod/ITexture',
-        'ISound': 'https://wiki.facepunch.com/gmod/ISound',
-        'ConVar': 'https://wiki.facepunch.com/gmod/ConVar',
-        'CUserCmd': 'https://wiki.facepunch.com/gmod/CUserCmd',
-        'CMoveData': 'https://wiki.facepunch.com/gmod/CMoveData',
-        'CTakeDamageInfo': 'https://wiki.facepunch.com/gmod/CTakeDamageInfo',
-        'CEffectData': 'https://wiki.facepunch.com/gmod/CEffectData',
-        'CLuaEmitter': 'https://wiki.facepunch.com/gmod/CLuaEmitter',
-        'CLuaEffect': 'https://wiki.facepunch.com/gmod/CLuaEffect',
-        'CLuaParticle': 'https://wiki.facepunch.com/gmod/CLuaParticle',
-        'PhysObj': 'https://wiki.facepunch.com/gmod/PhysObj',
-        'VMatrix': 'https://wiki.facepunch.com/gmod/VMatrix',
-        'IGModAudioChannel': 'https://wiki.facepunch.com/gmod/IGModAudioChannel',
-        'File': 'https://wiki.facepunch.com/gmod/File',
-        'HTTPRequest': 'https://wiki.facepunch.com/gmod/HTTPRequest',
-        'Material': 'https://wiki.facepunch.com/gmod/Material',
-        'Texture': 'https://wiki.facepunch.com/gmod/Texture',
-        'Sound': 'https://wiki.facepunch.com/gmod/Sound',
-        'Weapon': 'https://wiki.facepunch.com/gmod/Weapon',
-        'Vehicle': 'https://wiki.facepunch.com/gmod/Vehicle',
-        'NPC': 'https://wiki.facepunch.com/gmod/NPC',
-        'NextBot': 'https://wiki.facepunch.com/gmod/NextBot',
-        'PathFollower': 'https://wiki.facepunch.com/gmod/PathFollower',
-        'CLuaLocomotion': 'https://wiki.facepunch.com/gmod/CLuaLocomotion',
-        'CSEnt': 'https://wiki.facepunch.com/gmod/CSEnt',
-        'CSoundPatch': 'https://wiki.facepunch.com/gmod/CSoundPatch',
-        'SurfaceInfo': 'https://wiki.facepunch.com/gmod/SurfaceInfo',
-        'TraceResult': 'https://wiki.facepunch.com/gmod/TraceResult',
-        'Trace': 'https://wiki.facepunch.com/gmod/Trace',
-        'any': 'https://www.lua.org/manual/5.1/manual.html#2.1',
-        'vararg': 'https://www.lua.org/manual/5.1/manual.html#5.2.4',
-    }
+TYPE_LINKS = {
+    'string': 'https://www.lua.org/manual/5.1/manual.html#2.1',
+    'number': 'https://www.lua.org/manual/5.1/manual.html#2.1',
+    'boolean': 'https://www.lua.org/manual/5.1/manual.html#2.1',
+    'table': 'https://www.lua.org/manual/5.1/manual.html#2.1',
+    'function': 'https://www.lua.org/manual/5.1/manual.html#2.1',
+    'nil': 'https://www.lua.org/manual/5.1/manual.html#2.1',
+    'thread': 'https://www.lua.org/manual/5.1/manual.html#2.1',
+    'userdata': 'https://www.lua.org/manual/5.1/manual.html#2.1',
+    'Player': 'https://wiki.facepunch.com/gmod/Player',
+    'Entity': 'https://wiki.facepunch.com/gmod/Entity',
+    'Vector': 'https://wiki.facepunch.com/gmod/Vector',
+    'Angle': 'https://wiki.facepunch.com/gmod/Angle',
+    'Color': 'https://wiki.facepunch.com/gmod/Color',
+    'Panel': 'https://wiki.facepunch.com/gmod/Panel',
+    'IMaterial': 'https://wiki.facepunch.com/gmod/IMaterial',
+    'ITexture': 'https://wiki.facepunch.com/gmod/ITexture',
+    'ISound': 'https://wiki.facepunch.com/gmod/ISound',
+    'ConVar': 'https://wiki.facepunch.com/gmod/ConVar',
+    'CUserCmd': 'https://wiki.facepunch.com/gmod/CUserCmd',
+    'CMoveData': 'https://wiki.facepunch.com/gmod/CMoveData',
+    'CTakeDamageInfo': 'https://wiki.facepunch.com/gmod/CTakeDamageInfo',
+    'CEffectData': 'https://wiki.facepunch.com/gmod/CEffectData',
+    'CLuaEmitter': 'https://wiki.facepunch.com/gmod/CLuaEmitter',
+    'CLuaEffect': 'https://wiki.facepunch.com/gmod/CLuaEffect',
+    'CLuaParticle': 'https://wiki.facepunch.com/gmod/CLuaParticle',
+    'PhysObj': 'https://wiki.facepunch.com/gmod/PhysObj',
+    'VMatrix': 'https://wiki.facepunch.com/gmod/VMatrix',
+    'IGModAudioChannel': 'https://wiki.facepunch.com/gmod/IGModAudioChannel',
+    'File': 'https://wiki.facepunch.com/gmod/File',
+    'HTTPRequest': 'https://wiki.facepunch.com/gmod/HTTPRequest',
+    'Material': 'https://wiki.facepunch.com/gmod/Material',
+    'Texture': 'https://wiki.facepunch.com/gmod/Texture',
+    'Sound': 'https://wiki.facepunch.com/gmod/Sound',
+    'Weapon': 'https://wiki.facepunch.com/gmod/Weapon',
+    'Vehicle': 'https://wiki.facepunch.com/gmod/Vehicle',
+    'NPC': 'https://wiki.facepunch.com/gmod/NPC',
+    'NextBot': 'https://wiki.facepunch.com/gmod/NextBot',
+    'PathFollower': 'https://wiki.facepunch.com/gmod/PathFollower',
+    'CLuaLocomotion': 'https://wiki.facepunch.com/gmod/CLuaLocomotion',
+    'CSEnt': 'https://wiki.facepunch.com/gmod/CSEnt',
+    'CSoundPatch': 'https://wiki.facepunch.com/gmod/CSoundPatch',
+    'SurfaceInfo': 'https://wiki.facepunch.com/gmod/SurfaceInfo',
+    'TraceResult': 'https://wiki.facepunch.com/gmod/TraceResult',
+    'Trace': 'https://wiki.facepunch.com/gmod/Trace',
+    'any': 'https://www.lua.org/manual/5.1/manual.html#2.1',
+    'vararg': 'https://www.lua.org/manual/5.1/manual.html#5.2.4',
+}
+
+# Lilia-specific type mappings
+LILIA_TYPE_LINKS = {
+    'inventory': '/developer/libraries/inventory/',
+    'item': '/developer/libraries/item/',
+    'character': '/developer/libraries/char/',
+    'faction': '/developer/libraries/faction/',
+    'factions': '/developer/libraries/faction/',
+    'class': '/developer/libraries/class/',
+    'classes': '/developer/libraries/class/',
+    'attribute': '/developer/libraries/attribs/',
+    'attributes': '/developer/libraries/attribs/',
+    'player': '/developer/meta/player/',
+    'entity': '/developer/meta/entity/',
+    'panel': '/developer/meta/panel/',
+    'Character': '/developer/meta/character/',
+    'ItemDefinition': '/developer/meta/item/',
+    'InventoryType': '/developer/libraries/inventory/',
+}
+
+DEFAULT_TYPE_LINK = 'https://www.lua.org/manual/5.1/manual.html#2.2'
 
+
+def _resolve_type_link(type_name):
     if not type_name:
-        return 'https://www.lua.org/manual/5.1/manual.html#2.2'
+        return DEFAULT_TYPE_LINK
 
     key = type_name.strip()
     lower = key.lower()
 
-    # Lilia-specific type mappings
-    lilia_mappings = {
-        'inventory': '/developer/libraries/inventory/',
-        'item': '/developer/libraries/item/',
-        'character': '/developer/libraries/char/',
-        'faction': '/developer/libraries/faction/',
-        'factions': '/developer/libraries/faction/',
-        'class': '/developer/libraries/class/',
-        'classes': '/developer/libraries/class/',
-        'attribute': '/developer/libraries/attribs/',
-        'attributes': '/developer/libraries/attribs/',
-        'player': '/developer/meta/player/',
-        'entity': '/developer/meta/entity/',
-        'panel': '/developer/meta/panel/',
-        'Character': '/developer/meta/character/',
-        'ItemDefinition': '/developer/meta/item/',
-        'InventoryType': '/developer/libraries/inventory/',
-    }
-
     # Check for lia. prefix
     if lower.startswith('lia.'):
         lib_name = lower[4:]
-        if lib_name in lilia_mappings:
-            return lilia_mappings[lib_name]
+        if lib_name in LILIA_TYPE_LINKS:
+            return LILIA_TYPE_LINKS[lib_name]
         return f'/developer/libraries/{lib_name}/'
 
-    if lower in lilia_mappings:
-        return lilia_mappings[lower]
-    if key in lilia_mappings:
-        return lilia_mappings[key]
+    if lower in LILIA_TYPE_LINKS:
+        return LILIA_TYPE_LINKS[lower]
+    if key in LILIA_TYPE_LINKS:
+        return LILIA_TYPE_LINKS[key]
+
+    if lower in TYPE_LINKS:
+        return TYPE_LINKS[lower]
+    if key in TYPE_LINKS:
+        return TYPE_LINKS[key]
+
+    return DEFAULT_TYPE_LINK
+
+
+# Every spelling of every known type resolved once, so rendering is a single dict lookup per type.
+TYPE_LINK_TABLE = {
+    name: _resolve_type_link(name)
+    for known in (*TYPE_LINKS, *LILIA_TYPE_LINKS)
+    for name in (known, known.lower(), f'lia.{known.lower()}')
+}
 
-    if lower in type_links:
-        return type_links[lower]
-    if key in type_links:
-        return type_links[key]
 
-    return 'https://www.lua.org/manual/5.1/manual.html#2.2'
+def get_type_link(type_name):
+    link = TYPE_LINK_TABLE.get(type_name)
+    if link is None:
+        link = TYPE_LINK_TABLE[type_name] = _resolve_type_link(type_name)
+    return link
 
 
 def _split_optional_type(type_text: str) -> Tuple[str, str, bool]:
@@ -726,132 +1765,205 @@ def _should_render_returns(ret_type: Optional[str], ret_desc: str) -> bool:
 
     return True
 
-def generate_markdown_for_function(function_name, parsed_comment, is_library=False, no_realm=False, no_icon=False, source_url=None):
-    display_name = function_name
-    if is_library and not function_name.startswith('lia.'):
-        display_name = f'lia.{function_name}'
-    elif not is_library and ':' in function_name:
-        display_name = function_name.split(':', 1)[1]
-    elif is_library and function_name.startswith('lia.'):
-        display_name = function_name
-
-    realm_text_raw = (parsed_comment.get('realm') or '').strip()
-    realm_text = realm_text_raw.lower()
-    if realm_text == 'client':
-        realm_class = 'realm-client'
-    elif realm_text == 'server':
-        realm_class = 'realm-server'
-    else:
-        realm_class = 'realm-shared'
+HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+SECTION_HEADING = '<h3 style="margin-bottom: 5px; font-weight: 700;">'
+SECTION_BODY = '<div style="margin-left: 20px; margin-bottom: 20px;">\n'
+SECTION_END = '</div>\n\n'
+TEXT_SECTION_END = '</p>\n' + SECTION_END
+
+# Fixed markup around each section, concatenated once at import.
+TEXT_SECTION_OPEN = {
+    title: f'{SECTION_HEADING}{title}</h3>\n{SECTION_BODY}  <p>'
+    for title in ('When Called', 'Category', 'Realm', 'Explanation')
+}
+LIST_SECTION_OPEN = {
+    title: f'{SECTION_HEADING}{title}</h3>\n{SECTION_BODY}'
+    for title in ('Parameters', 'Returns', 'Example Usage', 'Fired From', 'Listened By')
+}
+HOOK_CALL_SECTIONS = (('fired', 'Fired From'), ('listened', 'Listened By'))
+PURPOSE_SECTION_OPEN = (f'{SECTION_HEADING}<a id="', f'"></a>Purpose</h3>\n{SECTION_BODY}  <p>')
+REALM_CLASSES = {'client': 'realm-client', 'server': 'realm-server'}
+SOURCE_LINK_OPEN = '<a class="source-link-button source-link-button--summary" href="'
+SOURCE_LINK_CLOSE = '" target="_blank" rel="noopener noreferrer" onclick="event.stopPropagation()">View Source</a>'
+
+
+DETAIL_LOADER_SCRIPT = '''<script>
+(function () {
+  if (window.liaLazyDetails) { return; }
+  window.liaLazyDetails = true;
+  document.addEventListener('toggle', function (event) {
+    var details = event.target;
+    if (!details.open || !details.querySelectorAll) { return; }
+    details.querySelectorAll('.lazy-details[data-fragment]').forEach(function (slot) {
+      var src = slot.getAttribute('data-fragment');
+      slot.removeAttribute('data-fragment');
+      fetch(src).then(function (response) { return response.json(); }).then(function (fragment) {
+        slot.innerHTML = fragment.html;
+      }).catch(function () {
+        slot.innerHTML = '<p>This section could not be loaded. Reload the page to try again.</p>';
+      });
+    });
+  }, true);
+})();
+</script>
+'''
+
+
+class DetailFragmentStore:
+    """Content-hashed JSON files holding each symbol's explanation and examples, fetched when it is expanded."""
+
+    def __init__(self):
+        self.enabled = False
+        self.docs_dir: Optional[Path] = None
+        self.output_dir: Optional[Path] = None
+        self.written: set = set()
+
+    def configure(self, docs_dir: Path, enabled: bool) -> None:
+        self.enabled = enabled
+        self.docs_dir = docs_dir
+        self.output_dir = docs_dir / 'assets' / 'details'
+
+    def url_prefix(self, page_path: Path) -> Optional[str]:
+        """Relative URL from a page's directory-style URL to the docs root, or None when fragments are off."""
+        if not self.enabled:
+            return None
+        try:
+            relative = page_path.relative_to(self.docs_dir)
+        except ValueError:
+            return None
+        depth = len(relative.parts) - (1 if relative.stem == 'index' else 0)
+        return '../' * depth
+
+    def placeholder(self, html: str, url_prefix: str, fallback: str='') -> str:
+        """Store html as a fragment; fallback is shown in its place when JavaScript is off."""
+        data = json.dumps({'html': html}, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        name = f'{hashlib.blake2b(data, digest_size=8).hexdigest()}.json'
+        if name not in self.written:
+            OUTPUT_WRITER.write_bytes(self.output_dir / name, data)
+            self.written.add(name)
+        url = f'{url_prefix}assets/details/{name}'
+        noscript = f'<noscript>\n{fallback}</noscript>' if fallback else ''
+        return f'<div class="lazy-details" data-fragment="{url}">{noscript}</div>\n'
+
+    def prune(self) -> int:
+        if self.output_dir is None or not self.output_dir.is_dir():
+            return 0
+        removed = OUTPUT_WRITER.remove_untouched(self.output_dir, '*.json', keep=())
+        if not any(self.output_dir.iterdir()):
+            self.output_dir.rmdir()
+        return removed
+
+
+DETAIL_FRAGMENTS = DetailFragmentStore()
+
+
+def generate_markdown_for_function(symbol: Symbol, is_library=False, no_realm=False, no_icon=False, categories: Optional[Dict[str, List[str]]]=None, fragment_prefix: Optional[str]=None, call_sites: Optional[Dict[str, Dict[str, list]]]=None):
+    display_name = symbol_display_name(symbol, is_library)
 
-    signature_params = ', '.join([p.get('name', '').strip() for p in parsed_comment.get('parameters', []) if p.get('name')])
-    signature = f'({signature_params})' if signature_params else '()'
+    realm_text_raw = (symbol.realm or '').strip()
+    realm_class = REALM_CLASSES.get(realm_text_raw.lower(), 'realm-shared')
+
+    signature_params = ', '.join([p.name.strip() for p in symbol.parameters if p.name])
     slug = generate_anchor_from_name(display_name)
-    classes = []
-    if realm_class:
-        classes.append(realm_class)
-    if no_icon:
-        classes.append('no-icon')
-    
-    realm_attr = f' class="{" ".join(classes)}"' if classes else ''
-    summary_label = f'{display_name}{signature}'
-    md = f'<details{realm_attr} id="function-{slug}">\n'
-    md += '<summary>'
-    md += f'<span class="summary-main"><a id="{display_name}"></a>{summary_label}</span>'
-    if source_url:
-        md += f'<a class="source-link-button source-link-button--summary" href="{source_url}" target="_blank" rel="noopener noreferrer" onclick="event.stopPropagation()">View Source</a>'
-    md += '</summary>\n'
-    md += f'<div class="details-content">\n'
-    if parsed_comment['purpose']:
-        md += f'<h3 style="margin-bottom: 5px; font-weight: 700;"><a id="{slug}"></a>Purpose</h3>\n'
-        md += f'<div style="margin-left: 20px; margin-bottom: 20px;">\n  <p>{parsed_comment["purpose"]}</p>\n</div>\n\n'
-
-    if parsed_comment['when_called']:
-        md += f'<h3 style="margin-bottom: 5px; font-weight: 700;">When Called</h3>\n'
-        md += f'<div style="margin-left: 20px; margin-bottom: 20px;">\n  <p>{parsed_comment["when_called"]}</p>\n</div>\n\n'
-    elif parsed_comment.get('when_used'):
-        md += f'<h3 style="margin-bottom: 5px; font-weight: 700;">When Called</h3>\n'
-        md += f'<div style="margin-left: 20px; margin-bottom: 20px;">\n  <p>{parsed_comment["when_used"]}</p>\n</div>\n\n'
-
-    if parsed_comment.get('category'):
-        md += '<h3 style="margin-bottom: 5px; font-weight: 700;">Category</h3>\n'
-        md += f'<div style="margin-left: 20px; margin-bottom: 20px;">\n  <p>{parsed_comment["category"]}</p>\n</div>\n\n'
+    classes = f'{realm_class} no-icon' if no_icon else realm_class
+
+    parts = [
+        f'<details class="{classes}" id="function-{slug}">\n<summary>',
+        f'<span class="summary-main"><a id="{display_name}"></a>{display_name}({signature_params})</span>',
+    ]
+    add = parts.append
+    if symbol.location:
+        add(f'{SOURCE_LINK_OPEN}{symbol.location.url}{SOURCE_LINK_CLOSE}')
+    add('</summary>\n<div class="details-content">\n')
+
+    if symbol.purpose:
+        add(f'{PURPOSE_SECTION_OPEN[0]}{slug}{PURPOSE_SECTION_OPEN[1]}{symbol.purpose}{TEXT_SECTION_END}')
+
+    when_called = symbol.when_called or symbol.when_used
+    if when_called:
+        add(f'{TEXT_SECTION_OPEN["When Called"]}{when_called}{TEXT_SECTION_END}')
+
+    if symbol.category:
+        category_text = symbol.category
+        add(f'{TEXT_SECTION_OPEN["Category"]}{category_text}{TEXT_SECTION_END}')
+        if categories is not None:
+            # Anchor -> every category emitted under it, in page order, so callers can check the page without parsing it back.
+            categories.setdefault(f'function-{slug}', []).append(category_text.strip())
 
     if realm_text_raw and not no_realm:
-        md += '<h3 style="margin-bottom: 5px; font-weight: 700;">Realm</h3>\n'
-        md += f'<div style="margin-left: 20px; margin-bottom: 20px;">\n  <p>{realm_text_raw}</p>\n</div>\n\n'
-
-    if parsed_comment['parameters']:
-        md += '<h3 style="margin-bottom: 5px; font-weight: 700;">Parameters</h3>\n'
-        md += '<div style="margin-left: 20px; margin-bottom: 20px;">\n'
-        for param in parsed_comment['parameters']:
-            display_type, link_type, is_optional = _split_optional_type(param["type"])
-            type_link = get_type_link(link_type)
-            desc = (param.get("description") or "").strip()
-            md += '<p>'
-            md += f'<span class="types"><a class="type" href="{type_link}">{display_type}</a></span> '
-            md += f'<span class="parameter">{param["name"]}</span>'
+        add(f'{TEXT_SECTION_OPEN["Realm"]}{realm_text_raw}{TEXT_SECTION_END}')
+
+    if symbol.parameters:
+        add(LIST_SECTION_OPEN['Parameters'])
+        for param in symbol.parameters:
+            display_type, link_type, is_optional = _split_optional_type(param.type)
+            add(f'<p><span class="types"><a class="type" href="{get_type_link(link_type)}">{display_type}</a></span> <span class="parameter">{param.name}</span>')
             if is_optional:
-                md += ' <span class="optional">optional</span>'
-            if desc:
-                md += f' {desc}'
-            md += '</p>\n'
-        md += '</div>\n\n'
-
-    if parsed_comment['returns']:
-        ret_type, ret_desc = _split_returns_text(parsed_comment["returns"])
+                add(' <span class="optional">optional</span>')
+            desc = (param.description or "").strip()
+            add(f' {desc}</p>\n' if desc else '</p>\n')
+        add(SECTION_END)
+
+    if symbol.returns:
+        ret_type, ret_desc = _split_returns_text(symbol.returns)
         if _should_render_returns(ret_type, ret_desc):
-            md += '<h3 style="margin-bottom: 5px; font-weight: 700;">Returns</h3>\n'
-            md += '<div style="margin-left: 20px; margin-bottom: 20px;">\n'
+            add(LIST_SECTION_OPEN['Returns'])
             if ret_type:
                 display_type, link_type = _split_type_display_link(ret_type)
-                type_link = get_type_link(link_type)
                 ret_desc = (ret_desc or '').strip()
-                md += f'<p><span class="types"><a class="type" href="{type_link}">{display_type}</a></span>'
-                if ret_desc:
-                    md += f' {ret_desc}'
-                md += '</p>\n'
+                add(f'<p><span class="types"><a class="type" href="{get_type_link(link_type)}">{display_type}</a></span>')
+                add(f' {ret_desc}</p>\n' if ret_desc else '</p>\n')
             else:
-                md += f'<p>{ret_desc}</p>\n'
-            md += '</div>\n\n'
-
-    if parsed_comment.get('explanation'):
-        md += f'<h3 style="margin-bottom: 5px; font-weight: 700;">Explanation</h3>\n'
-        md += f'<div style="margin-left: 20px; margin-bottom: 20px;">\n  <p>{parsed_comment["explanation"]}</p>\n</div>\n\n'
-
-    if parsed_comment['examples']:
-        md += '<h3 style="margin-bottom: 5px; font-weight: 700;">Example Usage</h3>\n'
-        md += '<div style="margin-left: 20px; margin-bottom: 20px;">\n'
-        for example in parsed_comment['examples']:
-            md += '<pre><code class="language-lua">'
-            formatted_code = format_lua_code(example['code'])
-            md += '\n'.join(formatted_code).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-            md += '</code></pre>\n'
-        md += '</div>\n\n'
-
-    md += '</div>\n'
-    md += '</details>\n\n'
-    return md
+                add(f'<p>{ret_desc}</p>\n')
+            add(SECTION_END)
+
+    # With fragments on, the explanation and examples are fetched when the symbol is expanded.
+    deferred = [] if fragment_prefix is not None else parts
+    if symbol.explanation:
+        deferred.append(f'{TEXT_SECTION_OPEN["Explanation"]}{symbol.explanation}{TEXT_SECTION_END}')
+
+    roles = call_sites.get(display_name) if call_sites is not None else None
+    if roles:
+        for role, title in HOOK_CALL_SECTIONS:
+            if role in roles:
+                add(LIST_SECTION_OPEN[title])
+                for rel, line, realm in roles[role]:
+                    realm_note = f' <span class="realm">({realm})</span>' if realm else ''
+                    add(f'<p><a href="{REPO_BLOB_BASE}/{rel}#L{line}" target="_blank" rel="noopener noreferrer">{rel}:{line}</a>{realm_note}</p>\n')
+                add(SECTION_END)
+
+    if symbol.examples:
+        deferred.append(LIST_SECTION_OPEN['Example Usage'])
+        for example in symbol.examples:
+            deferred.append('<pre><code class="language-lua">')
+            deferred.append('\n'.join(format_lua_code(example.code)).translate(HTML_ESCAPE_TABLE))
+            deferred.append('</code></pre>\n')
+        deferred.append(SECTION_END)
+
+    if deferred and deferred is not parts:
+        body = ''.join(deferred)
+        # Without JavaScript the fragment never loads, so the same sections stay inline as a fallback.
+        add(DETAIL_FRAGMENTS.placeholder(body, fragment_prefix, body))
+
+    add('</div>\n</details>\n\n')
+    return ''.join(parts)
 
 
 def find_comment_blocks_in_file(file_path):
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except UnicodeDecodeError:
-        print(f"Warning: Could not read {file_path} due to encoding issues")
+    source = read_lua_source(file_path)
+    if source is None:
         return [], None, None
 
-    comment_pattern = r'--\[\[.*?\]\]'
     all_comment_blocks = []
     file_header = None
     overview_section = None
 
-    for match in re.finditer(comment_pattern, content, re.DOTALL):
-        comment_text = match.group(0)
+    for block in source.blocks:
+        comment_text = block['text']
         all_comment_blocks.append(comment_text)
 
-        if file_header is None and not any(header in comment_text for header in ['Purpose:', 'When Called:', 'When Used:', 'Category:', 'Parameters:', 'Returns:', 'Realm:', 'Example Usage:', 'Overview:', 'Improvements Done:', 'Example Item:', 'Folder:', 'File:']):
+        if file_header is None and not any(header in comment_text for header in NON_HEADER_BLOCK_MARKERS):
             file_header = comment_text
         elif ('Overview:' in comment_text or 'Improvements Done:' in comment_text) and overview_section is None:
             overview_section = comment_text
@@ -860,67 +1972,19 @@ def find_comment_blocks_in_file(file_path):
 
 
 def find_top_comment_blocks_in_file(file_path: Path):
-    try:
-        with open(file_path, 'r', encoding='utf-8-sig') as f:
-            content = f.read()
-    except UnicodeDecodeError:
-        print(f"Warning: Could not read {file_path} due to encoding issues")
+    source = read_lua_source(file_path)
+    if source is None:
         return '', []
 
-    blocks = []
-    index = 0
-    length = len(content)
-    comment_pattern = re.compile(r'--\[\[.*?\]\]', re.DOTALL)
-
-    while index < length:
-        whitespace_match = re.match(r'\s*', content[index:])
-        if whitespace_match:
-            index += whitespace_match.end()
-
-        if index >= length:
-            break
-
-        if content.startswith('--[[', index):
-            match = comment_pattern.match(content, index)
-            if not match:
-                break
-            blocks.append({
-                'text': match.group(0),
-                'line': content[:match.start()].count('\n') + 1
-            })
-            index = match.end()
-            continue
-
-        if content.startswith('--', index):
-            newline_index = content.find('\n', index)
-            if newline_index == -1:
-                break
-            index = newline_index + 1
-            continue
-
-        break
-
-    return content, blocks
+    return source.content, source.top_blocks()
 
 
 def find_all_comment_blocks_in_file(file_path: Path):
-    try:
-        with open(file_path, 'r', encoding='utf-8-sig') as f:
-            content = f.read()
-    except UnicodeDecodeError:
-        print(f"Warning: Could not read {file_path} due to encoding issues")
+    source = read_lua_source(file_path)
+    if source is None:
         return '', []
 
-    comment_pattern = re.compile(r'--\[\[.*?\]\]', re.DOTALL)
-    blocks = []
-
-    for match in comment_pattern.finditer(content):
-        blocks.append({
-            'text': match.group(0),
-            'line': content[:match.start()].count('\n') + 1
-        })
-
-    return content, blocks
+    return source.content, source.blocks
 
 
 def extract_hook_name_from_block(comment_text: str) -> Optional[str]:
@@ -952,11 +2016,16 @@ def extract_hook_name_from_block(comment_text: str) -> Optional[str]:
 
 
 def find_hook_docs_in_file(file_path: Path):
-    file_content, all_blocks = find_all_comment_blocks_in_file(file_path)
+    source = read_lua_source(file_path)
+    if source is None:
+        return '', None, None, []
+
+    file_content = source.content
+    all_blocks = source.blocks
     if not all_blocks:
         return file_content, None, None, []
 
-    _, top_blocks = find_top_comment_blocks_in_file(file_path)
+    top_blocks = source.top_blocks()
     file_header = None
     overview_section = None
     hooks = []
@@ -1003,29 +2072,33 @@ def humanize_identifier(name: str) -> str:
     return re.sub(r'[_\-]+', ' ', name).strip().title()
 
 
-def is_module_library_file(file_path: Path, base_dir: Path, file_content: Optional[str]=None) -> bool:
-    try:
-        rel_parts = file_path.resolve().relative_to(base_dir.resolve()).parts
-    except ValueError:
-        resolved_parts = file_path.resolve().parts
-        lowered_parts = tuple(part.lower() for part in resolved_parts)
+def is_module_library_file(file_path: Path, base_dir: Path, source: Optional[SourceFile]=None) -> bool:
+    inventory_entry = find_inventory_entry(file_path)
+    if inventory_entry is not None:
+        rel_parts = inventory_entry.rel_parts
+    else:
         try:
-            gamemode_index = lowered_parts.index('gamemode')
+            rel_parts = file_path.resolve().relative_to(base_dir.resolve()).parts
         except ValueError:
-            return False
-        rel_parts = resolved_parts[gamemode_index:]
+            resolved_parts = file_path.resolve().parts
+            lowered_parts = tuple(part.lower() for part in resolved_parts)
+            try:
+                gamemode_index = lowered_parts.index('gamemode')
+            except ValueError:
+                return False
+            rel_parts = resolved_parts[gamemode_index:]
     if len(rel_parts) < 3 or rel_parts[:2] != ('gamemode', 'modules'):
         return False
 
     custom_filename = None
-    if file_content is not None:
-        _, custom_filename, _ = parse_folder_directives(file_content)
+    if source is not None:
+        _, custom_filename, _ = source.folder_directives
 
     return 'libraries' in rel_parts or bool(custom_filename and custom_filename.strip().lower().startswith('lia.'))
 
 
-def classify_hook_group(file_path: Path, base_dir: Path, file_content: str) -> Dict[str, str]:
-    rel_parts = file_path.resolve().relative_to(base_dir.resolve()).parts
+def classify_hook_group(file_path: Path, base_dir: Path, source: SourceFile) -> Dict[str, str]:
+    rel_parts = source_relative_parts(file_path, base_dir)
 
     if len(rel_parts) == 4 and rel_parts[:3] == ('gamemode', 'core', 'libraries') and rel_parts[-1].endswith('.lua'):
         library_name = file_path.stem
@@ -1037,7 +2110,7 @@ def classify_hook_group(file_path: Path, base_dir: Path, file_content: str) -> D
             'subtitle': f'This page documents the hooks defined by the {humanize_identifier(library_name).lower()} library.'
         }
 
-    if is_module_library_file(file_path, base_dir, file_content):
+    if is_module_library_file(file_path, base_dir, source):
         library_name = file_path.stem
         return {
             'section': 'library',
@@ -1145,8 +2218,8 @@ def classify_hook_category_group(category_name: str) -> Dict[str, str]:
     }
 
 
-def should_include_hook_file(file_path: Path, group_info: Dict[str, str], file_content: str) -> bool:
-    custom_folder, custom_filename, _ = parse_folder_directives(file_content)
+def should_include_hook_file(file_path: Path, group_info: Dict[str, str], source: SourceFile) -> bool:
+    custom_folder, custom_filename, _ = source.folder_directives
     if not custom_filename:
         return True
 
@@ -1161,13 +2234,6 @@ def is_library_hook_group(group_info: Dict[str, str]) -> bool:
     return group_info['section'] == 'library'
 
 
-def clear_generated_markdown(output_dir: Path) -> None:
-    output_dir.mkdir(parents=True, exist_ok=True)
-    for md_file in output_dir.glob('*.md'):
-        if md_file.name != 'index.md':
-            md_file.unlink()
-
-
 def remove_legacy_generated_docs(docs_dir: Path) -> None:
     legacy_modules_dir = docs_dir / 'developer' / 'modules'
     if legacy_modules_dir.exists():
@@ -1175,15 +2241,12 @@ def remove_legacy_generated_docs(docs_dir: Path) -> None:
         print(" Removed legacy developer/modules docs")
 
 
-def get_documented_output_filename(file_path: Path, file_content: str) -> str:
-    _, custom_filename, _ = parse_folder_directives(file_content)
+def get_documented_output_filename(file_path: Path, source: SourceFile) -> str:
+    _, custom_filename, _ = source.folder_directives
     return custom_filename or f'{file_path.stem}.md'
 
 
-def write_hook_group_page(group: Dict[str, object], output_dir: Path, base_dir: Path) -> None:
-    output_path = output_dir / group['filename']
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
+def build_hook_group_page(group: Dict[str, object], output_dir: Path) -> Page:
     title = group['title']
     subtitle = group['subtitle']
     file_header = group.get('file_header')
@@ -1196,55 +2259,588 @@ def write_hook_group_page(group: Dict[str, object], output_dir: Path, base_dir:
             if len(parts) > 1 and parts[1].strip():
                 subtitle = parts[1].strip()
 
-    css_block = '''<style>
-details > summary {
-    position: relative;
-    display: flex;
-    align-items: center;
-    min-height: 70px;
-    padding-right: 180px;
-}
+    hooks = group['hooks']
+    return Page(
+        output_path=output_dir / group['filename'],
+        kind='hooks',
+        title=title,
+        subtitle=subtitle,
+        overview=parse_overview_section(overview_section) if overview_section else None,
+        symbols=hooks,
+        sources=sorted({hook.location.path for hook in hooks if hook.location}),
+    )
 
-details > summary .summary-main {
-    min-width: 0;
-}
 
-details > summary .source-link-button--summary {
-    position: absolute;
-    right: 56px;
-    top: 50%;
-    transform: translateY(-50%);
-    white-space: nowrap;
-    z-index: 2;
-}
-</style>\n\n'''
+def render_page_markdown(page: Page, categories: Optional[Dict[str, List[str]]]=None) -> str:
+    parts = []
+    if not page.append:
+        parts.append(PAGE_CSS_BLOCK)
+        parts.append(f'# {page.title}\n\n')
+        parts.append(f'{page.subtitle}\n\n')
+        parts.append('---\n\n')
+
+        if page.overview is not None:
+            parts.append('<h3 style="margin-bottom: 5px;">Overview</h3>\n')
+            parts.append('<div style="margin-left: 20px; margin-bottom: 20px;">\n')
+            parts.append(page.overview + '\n')
+            parts.append('</div>\n\n')
+            parts.append('---\n\n')
+
+    fragment_prefix = DETAIL_FRAGMENTS.url_prefix(page.output_path)
+    call_sites = HOOK_CALL_INDEX.sites if page.kind == 'hooks' else None
+    for symbol in page.symbols:
+        parts.append(generate_markdown_for_function(symbol, page.is_library, no_realm=page.no_realm, no_icon=page.no_icon, categories=categories, fragment_prefix=fragment_prefix, call_sites=call_sites))
+        parts.append('---\n\n')
+
+    if page.hooks:
+        parts.append('<h2 style="margin-bottom: 5px;">Hooks</h2>\n')
+        parts.append('<div style="margin-left: 20px; margin-bottom: 20px;">\n')
+        parts.append('<p>Library-specific hooks documented for this library.</p>\n')
+        parts.append('</div>\n\n')
+        parts.append('---\n\n')
+        for symbol in page.hooks:
+            parts.append(generate_markdown_for_function(symbol, is_library=False, no_realm=page.no_realm, no_icon=page.no_icon, categories=categories, fragment_prefix=fragment_prefix))
+            parts.append('---\n\n')
+
+    if fragment_prefix is not None and (page.symbols or page.hooks):
+        parts.append(DETAIL_LOADER_SCRIPT)
+
+    return ''.join(parts)
+
+
+class PageBudget:
+    """Symbol and byte limits above which a rendered page is split into sub-pages (0 disables a limit)."""
+
+    def __init__(self, max_symbols: int=48, max_bytes: int=100_000):
+        self.max_symbols = max_symbols
+        self.max_bytes = max_bytes
+        self.split_pages = 0
+
+    def exceeded(self, symbol_count: int, size: int) -> bool:
+        return bool(
+            (self.max_symbols and symbol_count > self.max_symbols)
+            or (self.max_bytes and size > self.max_bytes)
+        )
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(css_block)
-        f.write(f'# {title}\n\n')
-        f.write(f'{subtitle}\n\n')
-        f.write('---\n\n')
-
-        if overview_section:
-            f.write('<h3 style="margin-bottom: 5px;">Overview</h3>\n')
-            f.write('<div style="margin-left: 20px; margin-bottom: 20px;">\n')
-            f.write(parse_overview_section(overview_section) + '\n')
-            f.write('</div>\n\n')
-            f.write('---\n\n')
-
-        for hook in group['hooks']:
-            parsed = parse_comment_block(hook['comment'])
-            f.write(
-                generate_markdown_for_function(
-                    hook['name'],
-                    parsed,
-                    is_library=False,
-                    source_url=build_source_url(hook['file_path'], base_dir, hook['line'])
-                )
-            )
-            f.write('---\n\n')
+    def symbols_per_page(self, symbol_count: int, size: int) -> int:
+        limit = self.max_symbols or symbol_count
+        if self.max_bytes and size > self.max_bytes:
+            limit = min(limit, symbol_count * self.max_bytes // size)
+        return max(1, limit)
+
+
+PAGE_BUDGET = PageBudget()
+
+SPLIT_NAME_PREFIX_PATTERN = re.compile(r'^_*[A-Z]?[a-z0-9]+')
+
+
+def symbol_display_name(symbol: Symbol, is_library: bool=False) -> str:
+    if is_library and not symbol.name.startswith('lia.'):
+        return f'lia.{symbol.name}'
+    if not is_library and ':' in symbol.name:
+        return symbol.name.split(':', 1)[1]
+    return symbol.name
+
+
+def symbol_name_prefix(symbol: Symbol) -> str:
+    short_name = re.split(r'[.:]', symbol.name)[-1]
+    match = SPLIT_NAME_PREFIX_PATTERN.match(short_name)
+    return (match.group(0).strip('_') if match else short_name).capitalize() or 'General'
+
+
+def group_page_symbols(symbols: List[Symbol], per_page: int) -> List[Tuple[str, List[Symbol]]]:
+    """Group symbols by Category, or by name prefix when a page has a single category, then chunk big groups."""
+    groups: Dict[str, List[Symbol]] = {}
+    for symbol in symbols:
+        groups.setdefault((symbol.category or '').strip() or 'General', []).append(symbol)
+    if len(groups) < 2:
+        prefixes: Dict[str, List[Symbol]] = {}
+        for symbol in symbols:
+            prefixes.setdefault(symbol_name_prefix(symbol), []).append(symbol)
+        # Name prefixes are fine-grained, so pack neighbouring ones until a page is full.
+        runs: List[Tuple[str, str, List[Symbol]]] = []
+        for prefix in sorted(prefixes, key=str.lower):
+            members = prefixes[prefix]
+            if runs and len(runs[-1][2]) + len(members) <= per_page:
+                runs[-1] = (runs[-1][0], prefix, runs[-1][2] + members)
+            else:
+                runs.append((prefix, prefix, members))
+        groups = {first if first == last else f'{first} to {last}': members for first, last, members in runs}
+
+    chunks: List[Tuple[str, List[Symbol]]] = []
+    for title in sorted(groups, key=str.lower):
+        members = groups[title]
+        parts = [members[start:start + per_page] for start in range(0, len(members), per_page)]
+        for index, part in enumerate(parts, 1):
+            chunks.append((title if len(parts) == 1 else f'{title} ({index})', part))
+    return chunks
+
+
+def remove_split_pages(page_path: Path) -> int:
+    """Delete the sub-pages of a previously split page; directories without a .pages file are left alone."""
+    split_dir = page_path.with_suffix('')
+    if not (split_dir / '.pages').is_file():
+        return 0
+    removed = 0
+    for path in sorted(split_dir.iterdir()):
+        if path.is_file() and OUTPUT_WRITER.delete(path):
+            removed += 1
+    try:
+        split_dir.rmdir()
+    except OSError:
+        pass
+    return removed
+
+
+def write_split_page(page: Page, text: str, categories: Optional[Dict[str, List[str]]]=None) -> None:
+    """Write an oversized page as a landing page plus one sub-page per symbol group."""
+    split_dir = page.output_path.with_suffix('')
+    per_page = PAGE_BUDGET.symbols_per_page(len(page.symbols) + len(page.hooks), len(text.encode('utf-8')))
+    groups = group_page_symbols(page.symbols, per_page)
+    sub_pages: List[Tuple[str, Page]] = []
+    for title, symbols in groups:
+        sub_pages.append((title, replace(page, symbols=symbols, hooks=[], overview=None)))
+    if page.hooks:
+        sub_pages.append(('Hooks', replace(page, symbols=page.hooks, hooks=[], overview=None, is_library=False)))
+
+    cards = []
+    redirects: Dict[str, str] = {}
+    used_slugs: set = set()
+    arrange = []
+    for title, sub_page in sub_pages:
+        slug = generate_anchor_from_name(title) or 'general'
+        while slug in used_slugs:
+            slug += '-'
+        used_slugs.add(slug)
+        sub_page.output_path = split_dir / f'{slug}.md'
+        sub_page.title = title
+        sub_page.subtitle = f'Part of the [{page.title}](../{page.output_path.name}) reference.'
+        sub_text = render_page_markdown(sub_page, categories)
+        OUTPUT_WRITER.write_text(sub_page.output_path, sub_text)
+        PAGE_REGISTRY.record(sub_page, sub_text)
+        arrange.append(f' - {slug}.md')
+
+        count = len(sub_page.symbols)
+        noun = 'hook' if page.kind == 'hooks' or (page.hooks and sub_page is sub_pages[-1][1]) else 'function'
+        cards.append((title, f'./{slug}.md', f"{count} documented {noun}{'s' if count != 1 else ''}"))
+        for symbol in sub_page.symbols:
+            display_name = symbol_display_name(symbol, sub_page.is_library)
+            anchor = generate_anchor_from_name(display_name)
+            target = f'./{slug}/#function-{anchor}'
+            for key in (f'function-{anchor}', display_name, anchor):
+                redirects.setdefault(key, target)
+
+    OUTPUT_WRITER.write_text(split_dir / '.pages', '\n'.join([f'title: {page.title}', 'arrange:', *arrange]) + '\n')
+    OUTPUT_WRITER.remove_untouched(split_dir, '*.md', keep=())
+
+    landing = StringIO()
+    landing.write(render_page_markdown(replace(page, symbols=[], hooks=[])))
+    landing.write('<h3 style="margin-bottom: 5px;">Sections</h3>\n\n')
+    write_cards(landing, cards)
+    landing.write('<noscript>\n<ul>\n')
+    for title, link, summary in cards:
+        landing.write(f'  <li><a href="{link[:-3]}/">{title}</a> ({summary})</li>\n')
+    landing.write('</ul>\n</noscript>\n\n')
+    landing.write('<script>\n(function () {\n')
+    landing.write(f'  var targets = {json.dumps(redirects, ensure_ascii=True)};\n')
+    landing.write('  var target = targets[decodeURIComponent(window.location.hash.slice(1))];\n')
+    landing.write('  if (target) { window.location.replace(target); }\n')
+    landing.write('})();\n</script>\n')
+    landing_text = landing.getvalue()
+    OUTPUT_WRITER.write_text(page.output_path, landing_text)
+    PAGE_REGISTRY.record(replace(page, symbols=[], hooks=[]), landing_text)
+    PAGE_BUDGET.split_pages += 1
+    print(f" Split {page.output_path.name} into {len(sub_pages)} pages under {split_dir.name}/")
+
+
+def merge_appended_pages(pages: Sequence[Page]) -> List[Page]:
+    """Fold `Append:` pages into the page they extend, so the page budget sees the combined page."""
+    merged: Dict[Path, Page] = {}
+    for page in pages:
+        base = merged.get(page.output_path)
+        if base is None or not page.append:
+            merged[page.output_path] = page
+            continue
+        merged[page.output_path] = replace(
+            base,
+            symbols=base.symbols + page.symbols,
+            hooks=base.hooks + page.hooks,
+            sources=base.sources + [source for source in page.sources if source not in base.sources],
+        )
+    return list(merged.values())
+
+
+def write_page(page: Page, categories: Optional[Dict[str, List[str]]]=None) -> None:
+    # Pages built from one file count towards that file in the profile; hook group pages stand alone.
+    source = page.sources[0] if len(page.sources) == 1 else None
+    # Categories are recorded for the text that is written; a split page records its sub-pages instead.
+    rendered: Optional[Dict[str, List[str]]] = {} if categories is not None else None
+    with TRACE.span('render', 'page', file=source, page=page.output_path.name, symbols=len(page.symbols) + len(page.hooks)):
+        text = render_page_markdown(page, rendered)
+    if page.append and page.output_path.exists():
+        text = page.output_path.read_text(encoding='utf-8') + text
+    with TRACE.span('write', 'page', file=source, page=page.output_path.name, bytes=len(text)):
+        # An append whose base page was not built alongside it extends whatever is on disk, split or not.
+        if page.append:
+            OUTPUT_WRITER.write_text(page.output_path, text)
+            PAGE_REGISTRY.record(page, text)
+        elif PAGE_BUDGET.exceeded(len(page.symbols) + len(page.hooks), len(text.encode('utf-8'))):
+            write_split_page(page, text, categories)
+            rendered = None
+        else:
+            remove_split_pages(page.output_path)
+            OUTPUT_WRITER.write_text(page.output_path, text)
+            PAGE_REGISTRY.record(page, text)
+    if rendered:
+        for anchor, emitted in rendered.items():
+            categories.setdefault(anchor, []).extend(emitted)
+    LUA_STUBS.write(page)
+    DOC_MODEL.add(page)
+    print(f" Generated {page.output_path.name}")
+
+
+LUA_IDENTIFIER_PATTERN = re.compile(r'^(?:[A-Za-z_][A-Za-z0-9_]*|\.\.\.)$')
+RETURN_TYPE_LINE_PATTERN = re.compile(r'^[\w|.]+(?:\s*,\s*[\w|.]+)*$')
+
+
+def lua_meta_class(table_name: str) -> str:
+    """LuaLS class for a meta table variable: playerMeta -> Player, ITEM -> Item."""
+    if table_name.endswith('Meta') and len(table_name) > 4:
+        table_name = table_name[:-4]
+    elif table_name.isupper():
+        table_name = table_name.lower()
+    return table_name[:1].upper() + table_name[1:]
+
+
+def parse_return_values(returns_text: Optional[str]) -> List[Tuple[str, str]]:
+    """(type, description) per returned value; each type line owns the description lines below it."""
+    groups: List[List[str]] = []
+    for line in (returns_text or '').splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if RETURN_TYPE_LINE_PATTERN.match(line):
+            groups.append([line, ''])
+        elif groups:
+            groups[-1][1] = f'{groups[-1][1]} {line}'.strip()
+    values = []
+    for types, description in groups:
+        names = [name.strip() for name in types.split(',')]
+        if all(name.lower() in ('nil', 'none') for name in names):
+            continue
+        values.extend((name, description if index == len(names) - 1 else '') for index, name in enumerate(names))
+    return values
+
+
+def lua_return_annotations(returns_text: Optional[str]) -> List[str]:
+    return [f'---@return {name}{f" # {description}" if description else ""}' for name, description in parse_return_values(returns_text)]
+
+
+def lua_stub_function(symbol: Symbol, declared_name: str) -> List[str]:
+    lines = [f'--- {line.strip()}' for line in (symbol.purpose or '').splitlines() if line.strip()]
+    realm = (symbol.realm or '').strip().lower()
+    if realm:
+        lines.append(f'---@realm {realm}')
+    arguments = []
+    for param in symbol.parameters:
+        name = param.name.strip()
+        if not LUA_IDENTIFIER_PATTERN.match(name):
+            continue
+        display_type, _, is_optional = _split_optional_type(param.type)
+        description = ' '.join((param.description or '').split())
+        optional = '?' if is_optional and name != '...' else ''
+        lines.append(f"---@param {name}{optional} {display_type or 'any'}{f' {description}' if description else ''}")
+        arguments.append(name)
+    lines.extend(lua_return_annotations(symbol.returns))
+    lines.append(f"function {declared_name}({', '.join(arguments)}) end")
+    return lines
+
+
+class LuaStubWriter:
+    """Writes a LuaLS `---@meta` stub per library and meta table page from the symbols rendered on it."""
 
-    print(f" Generated {output_path.name}")
+    ROOT_STUB = 'lia.lua'
+
+    def __init__(self):
+        self.output_dir: Optional[Path] = None
+        self.written: set = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.output_dir is not None
+
+    def stub_path(self, page_path: Path) -> Path:
+        return self.output_dir / f'{page_path.stem}.lua'
+
+    def render(self, page: Page, header: bool=True) -> str:
+        lines = []
+        if header:
+            lines += ['---@meta', f'-- {page.title}: generated by generate_docs.py from {", ".join(page.sources)}. Do not edit.', '']
+        if page.is_library:
+            names = [symbol_display_name(symbol, True) for symbol in page.symbols]
+            tables = set()
+            for name in names:
+                parts = re.split(r'[.:]', name)[:-1]
+                tables.update('.'.join(parts[:depth]) for depth in range(2, len(parts) + 1))
+            for table in sorted(tables):
+                lines += [f'---@class {table}', f'{table} = {{}}', '']
+        else:
+            names = []
+            classes = []
+            for symbol in page.symbols:
+                table, separator, method = symbol.name.partition(':')
+                if not separator:
+                    table, separator, method = symbol.name.rpartition('.')
+                class_name = lua_meta_class(table) if separator else ''
+                if class_name and class_name not in classes:
+                    classes.append(class_name)
+                names.append(f'{class_name}{":" if separator == ":" else "."}{method}' if class_name else symbol.name)
+            for class_name in classes:
+                lines += [f'---@class {class_name}', f'local {class_name} = {{}}', '']
+        for symbol, name in zip(page.symbols, names):
+            lines += lua_stub_function(symbol, name)
+            lines.append('')
+        return '\n'.join(lines)
+
+    def write(self, page: Page) -> None:
+        if not self.enabled or page.kind not in ('library', 'meta') or not page.symbols:
+            return
+        path = self.stub_path(page.output_path)
+        text = self.render(page, header=not (page.append and path.exists()))
+        if page.append and path.exists():
+            text = path.read_text(encoding='utf-8') + text
+        OUTPUT_WRITER.write_text(path, text)
+        self.written.add(path)
+        if page.is_library:
+            root = self.output_dir / self.ROOT_STUB
+            if root not in self.written:
+                OUTPUT_WRITER.write_text(root, '---@meta\n-- Root of the Lilia library stubs, generated by generate_docs.py. Do not edit.\n\n---@class lia\nlia = {}\n')
+                self.written.add(root)
+
+    def discard(self, page_path: Path) -> None:
+        if self.enabled and page_path.suffix == '.md':
+            OUTPUT_WRITER.delete(self.stub_path(page_path))
+
+
+LUA_STUBS = LuaStubWriter()
+
+
+SYMBOL_INDEX_NAME = 'symbol-index.json'
+SYMBOL_INDEX_SECTIONS = ('developer/meta', 'developer/libraries', 'developer/hooks')
+SYMBOL_INDEX_ROW_KINDS = {'meta': 'method', 'library': 'function', 'hooks': 'hook'}
+SYMBOL_INDEX_PURPOSE_LIMIT = 120
+SYMBOL_INDEX_MAX_BYTES = 400_000
+SYMBOL_TOKEN_PATTERN = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z0-9]+')
+
+
+def summarize_purpose(purpose: Optional[str]) -> str:
+    """First sentence of a purpose, on one line and capped at SYMBOL_INDEX_PURPOSE_LIMIT characters."""
+    text = ' '.join((purpose or '').split())
+    end = text.find('. ')
+    if end != -1:
+        text = text[:end + 1]
+    if len(text) > SYMBOL_INDEX_PURPOSE_LIMIT:
+        text = text[:SYMBOL_INDEX_PURPOSE_LIMIT - 1].rstrip() + '…'
+    return text
+
+
+def symbol_index_rows(page: Page) -> List[list]:
+    """[name, anchor, realm, category, kind, purpose] for every symbol rendered on a page."""
+    rows = []
+    for symbols, is_library, kind in (
+        (page.symbols, page.is_library, SYMBOL_INDEX_ROW_KINDS.get(page.kind, page.kind)),
+        (page.hooks, False, 'hook'),
+    ):
+        for symbol in symbols:
+            display_name = symbol_display_name(symbol, is_library)
+            rows.append([
+                display_name,
+                f'function-{generate_anchor_from_name(display_name)}',
+                (symbol.realm or '').strip(),
+                (symbol.category or '').strip(),
+                kind,
+                summarize_purpose(symbol.purpose),
+            ])
+    return rows
+
+
+def symbol_search_terms(name: str) -> List[str]:
+    """Lowercase words a name can be found by: its dotted parts and their camelCase pieces."""
+    terms = []
+    for part in re.split(r'[.:_]+', name):
+        if not part:
+            continue
+        terms.append(part.lower())
+        pieces = SYMBOL_TOKEN_PATTERN.findall(part)
+        if len(pieces) > 1:
+            terms.extend(piece.lower() for piece in pieces)
+    return terms
+
+
+def _delta_encode(values: List[int]) -> List[int]:
+    return [value - previous for value, previous in zip(values, [0, *values])]
+
+
+def _delta_decode(values: List[int]) -> List[int]:
+    return list(accumulate(values))
+
+
+class SymbolIndex:
+    """Columnar symbol table with prefix and trigram posting lists for search-as-you-type.
+
+    The JSON form stores one array per column and interns pages, realms, categories and
+    kinds. Anchors are not stored: each is `function-` plus the name run through
+    generate_anchor_from_name. Queries shorter than three characters read the prefix table,
+    whose lists (one per one- or two-letter term prefix) are stored already ranked, so a
+    lookup is a slice. Longer queries intersect the delta-encoded trigram lists of the
+    lowercased names, confirm the substring and rank what is left.
+    """
+
+    COLUMNS = ('name', 'page', 'anchor', 'realm', 'category', 'kind', 'purpose')
+    INTERNED = {'page': 'pages', 'realm': 'realms', 'category': 'categories', 'kind': 'kinds'}
+
+    def __init__(self, columns: Dict[str, list], prefix: Dict[str, List[int]], trigram: Dict[str, List[int]]):
+        self.columns = columns
+        self.prefix = prefix
+        self.trigram = trigram
+        self.lowered = [name.lower() for name in columns['name']]
+        self.terms = [symbol_search_terms(name) for name in columns['name']]
+
+    @classmethod
+    def build(cls, rows: Sequence[Tuple[str, str, str, str, str, str, str]]) -> 'SymbolIndex':
+        """rows are (name, page_url, anchor, realm, category, kind, purpose) in any order."""
+        rows = sorted(rows, key=lambda row: (row[0].lower(), row[1]))
+        columns = {column: [row[index] for row in rows] for index, column in enumerate(cls.COLUMNS)}
+        prefix: Dict[str, List[int]] = {}
+        trigram: Dict[str, List[int]] = {}
+        for row_id, name in enumerate(columns['name']):
+            for key in {term[:length] for term in symbol_search_terms(name) for length in (1, 2)}:
+                prefix.setdefault(key, []).append(row_id)
+            lowered = name.lower()
+            for gram in {lowered[start:start + 3] for start in range(len(lowered) - 2)}:
+                trigram.setdefault(gram, []).append(row_id)
+        index = cls(columns, prefix, trigram)
+        for key, ids in prefix.items():
+            ids.sort(key=partial(index.rank, key))
+        return index
+
+    def to_payload(self) -> Dict[str, object]:
+        payload: Dict[str, object] = {'version': 1, 'count': len(self.columns['name'])}
+        for column, table in self.INTERNED.items():
+            values = sorted(set(self.columns[column]))
+            lookup = {value: index for index, value in enumerate(values)}
+            payload[table] = values
+            payload[column] = [lookup[value] for value in self.columns[column]]
+        for column in ('name', 'purpose'):
+            payload[column] = self.columns[column]
+        payload['prefix'] = dict(sorted(self.prefix.items()))
+        payload['trigram'] = {key: _delta_encode(ids) for key, ids in sorted(self.trigram.items())}
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, object]) -> 'SymbolIndex':
+        columns = {'anchor': [f'function-{generate_anchor_from_name(name)}' for name in payload['name']]}
+        for column in cls.COLUMNS:
+            if column != 'anchor':
+                table = cls.INTERNED.get(column)
+                columns[column] = [payload[table][value] for value in payload[column]] if table else list(payload[column])
+        trigram = {key: _delta_decode(ids) for key, ids in payload['trigram'].items()}
+        return cls(columns, payload['prefix'], trigram)
+
+    def rank(self, query: str, row_id: int) -> Tuple[int, int, int]:
+        """Exact name or last-term matches first, then last-term prefixes, other term prefixes and substrings."""
+        lowered = self.lowered[row_id]
+        terms = self.terms[row_id]
+        if lowered == query or terms[-1] == query:
+            tier = 0
+        elif terms[-1].startswith(query):
+            tier = 1
+        elif any(term.startswith(query) for term in terms):
+            tier = 2
+        else:
+            tier = 3
+        return tier, len(lowered), row_id
+
+    def lookup(self, query: str, limit: int=20) -> List[int]:
+        query = query.strip().lower()
+        if not query:
+            return []
+        if len(query) < 3:
+            return self.prefix.get(query, [])[:limit]
+
+        postings = []
+        for start in range(len(query) - 2):
+            ids = self.trigram.get(query[start:start + 3])
+            if ids is None:
+                return []
+            postings.append(ids)
+        postings.sort(key=len)
+        matches = set(postings[0])
+        for ids in postings[1:]:
+            matches.intersection_update(ids)
+            if not matches:
+                return []
+        lowered = self.lowered
+        return heapq.nsmallest(limit, (row_id for row_id in matches if query in lowered[row_id]), key=partial(self.rank, query))
+
+    def search(self, query: str, limit: int=20) -> List[Dict[str, str]]:
+        """Best matches for a query as column dicts."""
+        return [{column: self.columns[column][row_id] for column in self.COLUMNS} for row_id in self.lookup(query, limit)]
+
+
+def collect_symbol_index_rows(docs_dir: Path, manifest: 'BuildManifest') -> Tuple[List[tuple], int]:
+    """Rows for every reference page in the page registry, and how many generated pages it has no rows for."""
+    sections = tuple(f'{section}/' for section in SYMBOL_INDEX_SECTIONS)
+    rows = []
+    for page_path in PAGE_REGISTRY.paths():
+        try:
+            relative = page_path.relative_to(docs_dir)
+        except ValueError:
+            continue
+        page_rows = PAGE_REGISTRY.symbol_rows(page_path) if relative.as_posix().startswith(sections) else None
+        if page_rows:
+            url = relative.with_suffix('').as_posix() + '/'
+            rows.extend((name, url, anchor, realm, category, kind, purpose) for name, anchor, realm, category, kind, purpose in page_rows)
+
+    unindexed = 0
+    for page_path in manifest.generated_pages():
+        if page_path.is_relative_to(docs_dir) and page_path.relative_to(docs_dir).as_posix().startswith(sections):
+            if page_path.exists() and PAGE_REGISTRY.symbol_rows(page_path) is None:
+                unindexed += 1
+    return rows, unindexed
+
+
+def write_symbol_index(docs_dir: Path, manifest: 'BuildManifest', max_bytes: int=SYMBOL_INDEX_MAX_BYTES) -> None:
+    """Write the compact symbol search index for every documented function, meta method and hook (max_bytes 0 disables the budget)."""
+    rows, unindexed = collect_symbol_index_rows(docs_dir, manifest)
+    index = SymbolIndex.build(rows)
+    text = json.dumps(index.to_payload(), ensure_ascii=False, separators=(',', ':'))
+    size = len(text.encode('utf-8'))
+    if max_bytes and size > max_bytes:
+        raise RuntimeError(f"Symbol index is {size} bytes, over the {max_bytes} byte budget (--max-index-bytes)")
+    OUTPUT_WRITER.write_text(docs_dir / 'assets' / SYMBOL_INDEX_NAME, text + '\n')
+    print(f" Generated {SYMBOL_INDEX_NAME} ({len(rows)} symbols, {size} bytes of {max_bytes or 'unlimited'})")
+    if unindexed:
+        print(f" Warning: {unindexed} generated pages have no recorded symbols; run with --force to index them")
+
+
+def write_hook_group_page(group: Dict[str, object], output_dir: Path, verify_output: bool=False) -> Page:
+    page = build_hook_group_page(group, output_dir)
+    categories: Dict[str, List[str]] = {}
+    write_page(page, categories)
+    validate_hook_group_categories(page, categories)
+    if verify_output:
+        verify_hook_group_output(page)
+    return page
+
+
+def read_generated_page_text(output_path: Path) -> str:
+    """A written page's markdown, followed by its sub-pages' if the page budget split it."""
+    text = output_path.read_text(encoding='utf-8')
+    split_dir = output_path.with_suffix('')
+    if (split_dir / '.pages').is_file():
+        text += ''.join(path.read_text(encoding='utf-8') for path in sorted(split_dir.glob('*.md')))
+    return text
 
 
 def extract_generated_hook_category(markdown_text: str, hook_name: str) -> Optional[str]:
@@ -1253,14 +2849,17 @@ def extract_generated_hook_category(markdown_text: str, hook_name: str) -> Optio
     if anchor_index == -1:
         return None
 
-    category_header_index = markdown_text.find('>Category</h3>', anchor_index)
+    block_end = markdown_text.find('</details>', anchor_index)
+    block = markdown_text[anchor_index:block_end if block_end != -1 else len(markdown_text)]
+
+    category_header_index = block.find('>Category</h3>')
     if category_header_index == -1:
         return None
 
-    next_section_index = markdown_text.find('<h3', category_header_index + 1)
+    next_section_index = block.find('<h3', category_header_index + 1)
     if next_section_index == -1:
-        next_section_index = len(markdown_text)
-    category_section = markdown_text[category_header_index:next_section_index]
+        next_section_index = len(block)
+    category_section = block[category_header_index:next_section_index]
 
     match = re.search(r'<p>(.*?)</p>', category_section, re.DOTALL)
     if not match:
@@ -1268,47 +2867,289 @@ def extract_generated_hook_category(markdown_text: str, hook_name: str) -> Optio
     return match.group(1).strip()
 
 
-def validate_hook_group_categories(group: Dict[str, object], output_dir: Path) -> None:
-    output_path = output_dir / group['filename']
+def report_hook_category_mismatches(output_path: Path, mismatches: List[str]) -> None:
+    if mismatches:
+        mismatch_text = '\n'.join(f" - {item}" for item in mismatches)
+        raise RuntimeError(f"Generated hook categories did not match source comments in {output_path}:\n{mismatch_text}")
+
+
+def validate_hook_group_categories(page: Page, categories: Dict[str, List[str]]) -> None:
+    """Check each hook's rendered category against its source comment using the renderer's anchor map."""
+    mismatches = []
+    consumed: Dict[str, int] = {}
+    for hook in page.symbols:
+        expected_category = hook.category.strip()
+        anchor = f'function-{generate_anchor_from_name(symbol_display_name(hook, page.is_library))}'
+        # Hooks sharing an anchor are rendered in page order, so each takes the next category emitted under it.
+        index = consumed.get(anchor, 0)
+        consumed[anchor] = index + 1
+        emitted = categories.get(anchor, [])
+        actual_category = emitted[index] if index < len(emitted) else None
+        if actual_category is None:
+            mismatches.append(f"{hook.name}: missing generated category block")
+        elif actual_category != expected_category:
+            mismatches.append(f"{hook.name}: expected '{expected_category}' but found '{actual_category}'")
+    report_hook_category_mismatches(page.output_path, mismatches)
+
+
+def verify_hook_group_output(page: Page) -> None:
+    """Deep check for --verify-output: re-read the written page and its sub-pages and scrape each hook's category."""
+    output_path = page.output_path
     if not output_path.exists():
         raise RuntimeError(f"Hook documentation page was not generated: {output_path}")
 
-    markdown_text = output_path.read_text(encoding='utf-8')
+    markdown_text = read_generated_page_text(output_path)
     mismatches = []
-    for hook in group['hooks']:
-        parsed = parse_comment_block(hook['comment'])
-        expected_category = (parsed.get('category') or '').strip()
-        actual_category = extract_generated_hook_category(markdown_text, hook['name'])
+    for hook in page.symbols:
+        expected_category = hook.category.strip()
+        actual_category = extract_generated_hook_category(markdown_text, hook.name)
         if actual_category is None:
-            mismatches.append(f"{hook['name']}: missing generated category block")
+            mismatches.append(f"{hook.name}: missing generated category block")
         elif actual_category != expected_category:
-            mismatches.append(f"{hook['name']}: expected '{expected_category}' but found '{actual_category}'")
+            mismatches.append(f"{hook.name}: expected '{expected_category}' but found '{actual_category}'")
+    report_hook_category_mismatches(output_path, mismatches)
 
-    if mismatches:
-        mismatch_text = '\n'.join(f" - {item}" for item in mismatches)
-        raise RuntimeError(f"Generated hook categories did not match source comments in {output_path}:\n{mismatch_text}")
 
+DOCGEN_MANIFEST_NAME = '.docgen-cache.json'
+DOCGEN_MANIFEST_VERSION = 1
+
+
+def compute_generator_fingerprint(options: Sequence[str]=()) -> str:
+    """Hash of this script plus the options that change its output."""
+    digest = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16)
+    for option in options:
+        digest.update(b'\0' + option.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """Source content hashes behind every generated page, kept between runs.
+
+    Pages are keyed by their path relative to the manifest's directory. Each
+    phase records, per Lua source, the hash it was generated from and the
+    pages it contributed to, so an unchanged source is neither re-read nor
+    re-parsed on the next run.
+    """
+
+    def __init__(self, path: Path, fingerprint: str, force: bool=False):
+        self.path = path
+        self.root = path.parent
+        self.fingerprint = fingerprint
+        self.hashes: Dict[str, List[object]] = {}
+        self.phases: Dict[str, Dict[str, dict]] = {}
+        self.loaded = False
+
+        data = None
+        if not force and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                data = None
+
+        if isinstance(data, dict) and data.get('version') == DOCGEN_MANIFEST_VERSION:
+            self.hashes = data.get('hashes', {})
+            if data.get('generator') == fingerprint:
+                self.phases = data.get('phases', {})
+                self.loaded = True
 
-def validate_no_duplicate_documented_hooks(grouped_hooks: Dict[str, Dict[str, object]], base_dir: Path) -> None:
-    hooks_by_name: Dict[str, List[Dict[str, object]]] = {}
+        self._previous = {name: phase for name, phase in self.phases.items()}
 
-    for group in grouped_hooks.values():
-        for hook in group['hooks']:
-            hooks_by_name.setdefault(hook['name'], []).append(hook)
+    def start_next_run(self) -> None:
+        """Treat the phases recorded so far as the previous run, for long-lived processes."""
+        self._previous = dict(self.phases)
+        self.loaded = True
 
+    def previous_phase(self, phase: str) -> Dict[str, dict]:
+        previous = self._previous.get(phase) or {}
+        return {'sources': previous.get('sources', {}), 'pages': previous.get('pages', {})}
+
+    def page_key(self, output_path: Path) -> str:
+        try:
+            return Path(output_path).relative_to(self.root).as_posix()
+        except ValueError:
+            return Path(output_path).as_posix()
+
+    def page_path(self, page_key: str) -> Path:
+        return self.root / page_key
+
+    def generated_pages(self) -> List[Path]:
+        """Every page the recorded phases generated, in key order."""
+        return [self.page_path(key) for key in sorted({key for phase in self.phases.values() for key in phase.get('pages', {})})]
+
+    def source_digest(self, entry: InventoryEntry) -> str:
+        rel = entry.rel_posix
+        cached = self.hashes.get(rel)
+        if cached and cached[0] == entry.mtime_ns and cached[1] == entry.size:
+            return cached[2]
+
+        with open(entry.path, 'rb') as f:
+            digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        self.hashes[rel] = [entry.mtime_ns, entry.size, digest]
+        return digest
+
+    def update_phase(self, phase: str, sources: Dict[str, dict], pages: Dict[str, List[str]]) -> None:
+        self.phases[phase] = {'sources': sources, 'pages': pages}
+
+    def save(self) -> None:
+        payload = {
+            'version': DOCGEN_MANIFEST_VERSION,
+            'generator': self.fingerprint,
+            'hashes': self.hashes,
+            'phases': self.phases,
+        }
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        temp_path.write_text(json.dumps(payload, separators=(',', ':'), sort_keys=True), encoding='utf-8')
+        os.replace(temp_path, self.path)
+
+
+def _run_job(job):
+    """Run one pool job, capturing its log so the parent can replay it in input order."""
+    func, item, tracing = job
+    before = (SOURCE_CACHE.reads, SOURCE_CACHE.hits, SOURCE_CACHE.bytes_read)
+    TRACE.recording = tracing
+    trace_start = len(TRACE.events)
+    log = StringIO()
+    with redirect_stdout(log):
+        result = func(item)
+    counters = (SOURCE_CACHE.reads - before[0], SOURCE_CACHE.hits - before[1], SOURCE_CACHE.bytes_read - before[2])
+    return result, log.getvalue(), counters, TRACE.take(trace_start)
+
+
+def map_jobs(func, items: Sequence, jobs: int=1) -> list:
+    """Apply func to items in order, spreading the calls over a process pool when jobs > 1."""
+    items = list(items)
+    if jobs <= 1 or len(items) < 2:
+        return [func(item) for item in items]
+
+    workers = min(jobs, len(items))
+    results = []
+    # Forking a process that is running phases in threads can deadlock, so fork from a clean server instead.
+    mp_context = None
+    if threading.active_count() > 1 and 'forkserver' in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context('forkserver')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+        chunksize = max(1, len(items) // (workers * 4))
+        for result, log, counters, events in executor.map(_run_job, [(func, item, TRACE.recording) for item in items], chunksize=chunksize):
+            if log:
+                sys.stdout.write(log)
+            SOURCE_CACHE.reads += counters[0]
+            SOURCE_CACHE.hits += counters[1]
+            SOURCE_CACHE.bytes_read += counters[2]
+            TRACE.events.extend(events)
+            results.append(result)
+    return results
+
+
+def collect_page_contributors(records: Dict[str, dict], page_field: str) -> Dict[str, List[str]]:
+    contributors: Dict[str, List[str]] = {}
+    for rel, record in records.items():
+        pages = record.get(page_field) or []
+        if isinstance(pages, str):
+            pages = [pages]
+        for page_key in pages:
+            rels = contributors.setdefault(page_key, [])
+            if not rels or rels[-1] != rel:
+                rels.append(rel)
+    return contributors
+
+
+def find_dirty_pages(manifest: BuildManifest, previous: Dict[str, dict], contributors: Dict[str, List[str]], changed: Sequence[str]) -> set:
+    changed_set = set(changed)
+    dirty = set()
+    for page_key, rels in contributors.items():
+        if (
+            not manifest.loaded
+            or previous['pages'].get(page_key) != rels
+            or any(rel in changed_set for rel in rels)
+            or not manifest.page_path(page_key).exists()
+        ):
+            dirty.add(page_key)
+    return dirty
+
+
+def remove_orphaned_pages(manifest: BuildManifest, previous: Dict[str, dict], contributors: Dict[str, List[str]]) -> int:
+    removed = 0
+    for page_key in previous['pages']:
+        if page_key in contributors:
+            continue
+        if OUTPUT_WRITER.delete(manifest.page_path(page_key)):
+            print(f" Removed {page_key} (its sources no longer exist)")
+            removed += 1
+    return removed
+
+
+def generate_file_pages(phase: str, entries: List[InventoryEntry], build_page, manifest: BuildManifest, jobs: int=1) -> None:
+    """Write the pages built from individual Lua files, skipping pages whose sources are unchanged.
+
+    build_page must be picklable (a module-level function or partial) so it can run in a worker pool.
+    """
+    started = time.perf_counter()
+    previous = manifest.previous_phase(phase)
+    records: Dict[str, dict] = {}
+    changed: List[InventoryEntry] = []
+
+    for entry in entries:
+        rel = entry.rel_posix
+        digest = manifest.source_digest(entry)
+        record = previous['sources'].get(rel)
+        if record is not None and record.get('hash') == digest:
+            records[rel] = record
+            continue
+        records[rel] = {'hash': digest}
+        changed.append(entry)
+
+    built: Dict[str, Optional[Page]] = {}
+    for entry, page in zip(changed, map_jobs(build_page, changed, jobs)):
+        built[entry.rel_posix] = page
+        records[entry.rel_posix]['page'] = manifest.page_key(page.output_path) if page else None
+
+    contributors = collect_page_contributors(records, 'page')
+    dirty = find_dirty_pages(manifest, previous, contributors, list(built))
+
+    # Pages shared through `Append:` need their unchanged contributors rebuilt as well.
+    dirty_entries = [entry for entry in entries if records[entry.rel_posix].get('page') in dirty]
+    missing = [entry for entry in dirty_entries if entry.rel_posix not in built]
+    for entry, page in zip(missing, map_jobs(build_page, missing, jobs)):
+        built[entry.rel_posix] = page
+
+    pages = [built[entry.rel_posix] for entry in dirty_entries if built[entry.rel_posix] is not None]
+    for page in merge_appended_pages(pages):
+        write_page(page)
+    written = len(pages)
+
+    removed = remove_orphaned_pages(manifest, previous, contributors)
+    manifest.update_phase(phase, records, contributors)
+    elapsed = time.perf_counter() - started
+    print(f" {phase}: {len(dirty)} pages regenerated from {written} sources, {len(contributors) - len(dirty)} unchanged, {removed} removed ({elapsed:.2f}s, {jobs} job{'s' if jobs != 1 else ''})")
+
+
+def index_hook_records(records: Dict[str, dict]) -> Tuple[Dict[str, List[Tuple[str, int]]], Dict[str, List[str]]]:
+    """Single pass over the hook records: where each hook is documented and which sources feed each page."""
+    hooks_by_name: Dict[str, List[Tuple[str, int]]] = {}
+    contributors: Dict[str, List[str]] = {}
+    for rel, record in records.items():
+        for hook_name, line, page_key in record['hooks']:
+            hooks_by_name.setdefault(hook_name, []).append((rel, line))
+            rels = contributors.setdefault(page_key, [])
+            if not rels or rels[-1] != rel:
+                rels.append(rel)
+    return hooks_by_name, contributors
+
+
+def validate_no_duplicate_documented_hooks(hooks_by_name: Dict[str, List[Tuple[str, int]]]) -> None:
+    """Fail when a hook name is documented in more than one place.
+
+    hooks_by_name maps each hook name to its (repository-relative path, line) locations.
+    """
     duplicates = []
     for hook_name, entries in sorted(hooks_by_name.items(), key=lambda item: item[0].lower()):
         if len(entries) < 2:
             continue
 
-        locations = []
-        for entry in sorted(entries, key=lambda item: (str(item['file_path']).lower(), item['line'])):
-            try:
-                relative_path = entry['file_path'].resolve().relative_to(base_dir.resolve())
-            except ValueError:
-                relative_path = entry['file_path']
-            locations.append(f"{relative_path}:{entry['line']}")
-
+        locations = [
+            f"{path}:{line}"
+            for path, line in sorted(entries, key=lambda item: (item[0].lower(), item[1]))
+        ]
         duplicates.append(f" - {hook_name}\n   " + "\n   ".join(locations))
 
     if duplicates:
@@ -1319,77 +3160,243 @@ def validate_no_duplicate_documented_hooks(grouped_hooks: Dict[str, Dict[str, ob
         )
 
 
-def generate_hook_documentation(core_output_dir: Path, module_output_dir: Path, base_dir: Path) -> None:
-    gamemode_dir = base_dir / 'gamemode'
-    grouped_hooks: Dict[str, Dict[str, object]] = {}
+def collect_hook_file(inventory_entry: InventoryEntry, base_dir: Path) -> Optional[Dict[str, object]]:
+    """Parse the documented hooks of one file along with the page group they default to."""
+    file_path = inventory_entry.path
+    _, file_header, overview_section, hooks = find_hook_docs_in_file(file_path)
+    if not hooks:
+        return None
 
-    for file_path in gamemode_dir.rglob('*.lua'):
-        file_content, file_header, overview_section, hooks = find_hook_docs_in_file(file_path)
-        if not hooks:
-            continue
+    source = SOURCE_CACHE.get(file_path)
+    group_info = classify_hook_group(file_path, base_dir, source)
+    if not should_include_hook_file(file_path, group_info, source):
+        return None
 
-        group_info = classify_hook_group(file_path, base_dir, file_content)
-        if not should_include_hook_file(file_path, group_info, file_content):
+    return {
+        'file_header': file_header,
+        'overview_section': overview_section,
+        'group_info': group_info,
+        'hooks': [source.symbol(hook['name'], 'hook', hook['comment'], hook['line'], base_dir) for hook in hooks],
+    }
+
+
+def hook_source_entries(base_dir: Path) -> List[InventoryEntry]:
+    return [
+        inventory_entry
+        for inventory_entry in get_source_inventory(base_dir).entries
+        if DOC_PREFILTER.accepts(inventory_entry, HOOK_DOC_MARKERS)
+    ]
+
+
+def hook_group_info_for(symbol: Symbol, group_info: Dict[str, str]) -> Dict[str, str]:
+    category_name = symbol.category.strip()
+    return classify_hook_category_group(category_name) if category_name else group_info
+
+
+def add_hook_file_to_groups(grouped_hooks: Dict[str, Dict[str, object]], collected: Dict[str, object], include=None) -> None:
+    file_header = collected['file_header']
+    overview_section = collected['overview_section']
+
+    for symbol in collected['hooks']:
+        category_name = symbol.category.strip()
+        hook_group_info = hook_group_info_for(symbol, collected['group_info'])
+        if include is not None and not include(hook_group_info):
             continue
 
-        for hook in hooks:
-            parsed = parse_comment_block(hook['comment'])
-            category_name = (parsed.get('category') or '').strip()
-            hook_group_info = classify_hook_category_group(category_name) if category_name else group_info
-            group = grouped_hooks.setdefault(hook_group_info['key'], {
-                'key': hook_group_info['key'],
-                'section': hook_group_info['section'],
-                'filename': hook_group_info['filename'],
-                'title': hook_group_info['title'],
-                'subtitle': hook_group_info['subtitle'],
-                'hooks': [],
-                'file_header': None,
-                'overview_section': None,
-            })
+        group = grouped_hooks.setdefault(hook_group_info['key'], {
+            'key': hook_group_info['key'],
+            'section': hook_group_info['section'],
+            'filename': hook_group_info['filename'],
+            'title': hook_group_info['title'],
+            'subtitle': hook_group_info['subtitle'],
+            'hooks': [],
+            'file_header': None,
+            'overview_section': None,
+        })
 
-            if category_name:
-                group['file_header'] = None
-                group['overview_section'] = None
-            else:
-                if group['key'] != 'module-uncategorized' and group['file_header'] is None and file_header:
-                    group['file_header'] = file_header
-                if group['key'] != 'module-uncategorized' and group['overview_section'] is None and overview_section:
-                    group['overview_section'] = overview_section
-
-            group['hooks'].append({
-                'name': hook['name'],
-                'comment': hook['comment'],
-                'line': hook['line'],
-                'file_path': file_path
-            })
+        if category_name:
+            group['file_header'] = None
+            group['overview_section'] = None
+        else:
+            if group['key'] != 'module-uncategorized' and group['file_header'] is None and file_header:
+                group['file_header'] = file_header
+            if group['key'] != 'module-uncategorized' and group['overview_section'] is None and overview_section:
+                group['overview_section'] = overview_section
+
+        group['hooks'].append(symbol)
+
+
+# Comments are matched first so calls quoted in `--` lines and `--[[ ]]` blocks are skipped.
+# The scan runs over raw bytes so files that are only searched for calls are never decoded.
+HOOK_CALL_SCAN_PATTERN = re.compile(
+    rb'--\[(=*)\[.*?\]\1\]|--[^\n]*|\bhook\.(Run|Call|Add)\s*\(\s*(["\'])([^"\'\n]+)\3',
+    re.DOTALL,
+)
+HOOK_CALL_ROLES = {'Run': 'fired', 'Call': 'fired', 'Add': 'listened'}
+
+
+def scan_hook_calls(data: bytes) -> List[list]:
+    """[hook_name, method, line] for every hook.Run/Call/Add with a literal name, in one pass over the file."""
+    calls = []
+    line = 1
+    last = 0
+    for match in HOOK_CALL_SCAN_PATTERN.finditer(data):
+        method = match.group(2)
+        if method is None:
+            continue
+        start = match.start()
+        line += data.count(b'\n', last, start)
+        last = start
+        calls.append([match.group(4).decode('utf-8', 'replace'), method.decode('ascii'), line])
+    return calls
+
+
+class HookCallIndex:
+    """Inverted index from hook name to the hook.Run/Call/Add sites that fire or listen to it."""
+
+    def __init__(self):
+        self.sites: Dict[str, Dict[str, List[Tuple[str, int, str]]]] = {}
+        self.records: Dict[str, dict] = {}
+        self.files = 0
+        self.scanned = 0
+        self._previous: Dict[str, dict] = {}
+
+    def begin(self, manifest: BuildManifest) -> None:
+        """Start a rebuild; sources whose hash matches the manifest's last run are not rescanned."""
+        self._previous = manifest.previous_phase('hook-calls')['sources']
+        self.sites = {}
+        self.records = {}
+        self.files = self.scanned = 0
+
+    def add(self, entry: InventoryEntry, digest: str) -> None:
+        rel = entry.rel_posix
+        record = self._previous.get(rel)
+        if record is None or record.get('hash') != digest:
+            calls = []
+            if contains_doc_markers(entry.path, HOOK_CALL_MARKERS, entry.size, opener=None):
+                with open(entry.path, 'rb') as f:
+                    calls = scan_hook_calls(f.read())
+            record = {'hash': digest, 'calls': calls}
+            self.scanned += 1
+        self.records[rel] = record
+        self.files += 1
+        for hook_name, method, line in record['calls']:
+            self.sites.setdefault(hook_name, {}).setdefault(HOOK_CALL_ROLES[method], []).append((rel, line, entry.realm or ''))
+
+    def page_digests(self, hook_records: Dict[str, dict]) -> Dict[str, List[str]]:
+        """Digest of the call sites shown on each hook page, so a page is rebuilt when only its callers move."""
+        names_by_page: Dict[str, set] = {}
+        for record in hook_records.values():
+            for hook_name, _, page_key in record['hooks']:
+                names_by_page.setdefault(page_key, set()).add(hook_name.split(':', 1)[-1])
+        digests = {}
+        for page_key, names in names_by_page.items():
+            payload = json.dumps([[name, self.sites.get(name)] for name in sorted(names)], separators=(',', ':'))
+            digests[page_key] = [hashlib.blake2b(payload.encode('utf-8'), digest_size=8).hexdigest()]
+        return digests
+
+    def report(self) -> str:
+        count = sum(len(calls) for roles in self.sites.values() for calls in roles.values())
+        return f"Hook call sites: {count} calls to {len(self.sites)} hooks in {self.files} files ({self.scanned} rescanned)"
+
+
+HOOK_CALL_INDEX = HookCallIndex()
+
+
+def generate_hook_documentation(core_output_dir: Path, module_output_dir: Path, base_dir: Path, manifest: Optional[BuildManifest]=None, jobs: int=1, verify_output: bool=False) -> None:
+    started = time.perf_counter()
+    if manifest is None:
+        manifest = BuildManifest(base_dir / DOCGEN_MANIFEST_NAME, compute_generator_fingerprint(), force=True)
+
+    def group_page_key(group_info: Dict[str, str]) -> str:
+        target_dir = module_output_dir if group_info['section'] == 'module' else core_output_dir
+        return manifest.page_key(target_dir / group_info['filename'])
+
+    previous = manifest.previous_phase('hooks')
+    entries: Dict[str, InventoryEntry] = {}
+    records: Dict[str, dict] = {}
+    changed: List[InventoryEntry] = []
+
+    # One walk feeds both the call site index, which covers every file, and the documented hooks.
+    HOOK_CALL_INDEX.begin(manifest)
+    for inventory_entry in get_source_inventory(base_dir).entries:
+        if not DOC_PREFILTER.is_excluded(inventory_entry):
+            HOOK_CALL_INDEX.add(inventory_entry, manifest.source_digest(inventory_entry))
+        if not DOC_PREFILTER.accepts(inventory_entry, HOOK_DOC_MARKERS):
+            continue
+        rel = inventory_entry.rel_posix
+        entries[rel] = inventory_entry
+        digest = manifest.source_digest(inventory_entry)
+        record = previous['sources'].get(rel)
+        if record is not None and record.get('hash') == digest:
+            records[rel] = record
+            continue
+        records[rel] = {'hash': digest}
+        changed.append(inventory_entry)
+
+    collect = partial(collect_hook_file, base_dir=base_dir)
+    collected_files: Dict[str, Optional[Dict[str, object]]] = {}
+    for inventory_entry, collected in zip(changed, map_jobs(collect, changed, jobs)):
+        rel = inventory_entry.rel_posix
+        collected_files[rel] = collected
+        hooks = []
+        if collected:
+            for symbol in collected['hooks']:
+                hooks.append([symbol.name, symbol.location.line, group_page_key(hook_group_info_for(symbol, collected['group_info']))])
+        records[rel].update(hooks=hooks, pages=[hook[2] for hook in hooks])
+
+    hooks_by_name, contributors = index_hook_records(records)
+    validate_no_duplicate_documented_hooks(hooks_by_name)
+    dirty = find_dirty_pages(manifest, previous, contributors, list(collected_files))
+
+    previous_calls = manifest.previous_phase('hook-calls')['pages']
+    call_digests = HOOK_CALL_INDEX.page_digests(records)
+    dirty.update(page_key for page_key, digest in call_digests.items() if previous_calls.get(page_key) != digest)
+
+    removed = remove_orphaned_pages(manifest, previous, contributors) if manifest.loaded else 0
 
-    validate_no_duplicate_documented_hooks(grouped_hooks, base_dir)
+    grouped_hooks: Dict[str, Dict[str, object]] = {}
+    dirty_sources = [rel for rel, record in records.items() if any(page_key in dirty for page_key in record['pages'])]
+    missing = [entries[rel] for rel in dirty_sources if rel not in collected_files]
+    for inventory_entry, collected in zip(missing, map_jobs(collect, missing, jobs)):
+        collected_files[inventory_entry.rel_posix] = collected
 
-    clear_generated_markdown(core_output_dir)
-    clear_generated_markdown(module_output_dir)
+    for rel in dirty_sources:
+        collected = collected_files[rel]
+        if collected:
+            add_hook_file_to_groups(grouped_hooks, collected, include=lambda info: group_page_key(info) in dirty)
 
     for group in sorted(grouped_hooks.values(), key=lambda item: item['title'].lower()):
-        group['hooks'].sort(key=lambda hook: hook['name'].lower())
+        group['hooks'].sort(key=lambda hook: hook.name.lower())
         target_dir = module_output_dir if group['section'] == 'module' else core_output_dir
-        write_hook_group_page(group, target_dir, base_dir)
-        validate_hook_group_categories(group, target_dir)
+        write_hook_group_page(group, target_dir, verify_output)
 
+    if not manifest.loaded:
+        # A full rebuild owns every hook page, so anything not written above is orphaned.
+        removed += OUTPUT_WRITER.remove_untouched(core_output_dir)
+        if module_output_dir != core_output_dir:
+            removed += OUTPUT_WRITER.remove_untouched(module_output_dir)
 
-def generate_documentation_for_file(file_path, output_dir, is_library=False, base_docs_dir=None, force=False, no_realm=False, no_icon=False):
+    manifest.update_phase('hooks', records, contributors)
+    manifest.update_phase('hook-calls', HOOK_CALL_INDEX.records, call_digests)
+    elapsed = time.perf_counter() - started
+    print(f" hooks: {len(dirty)} pages regenerated, {len(contributors) - len(dirty)} unchanged, {removed} removed ({elapsed:.2f}s, {jobs} job{'s' if jobs != 1 else ''})")
+    print(f" {HOOK_CALL_INDEX.report()}")
+
+
+def build_documentation_page(file_path, output_dir, is_library=False, base_docs_dir=None, no_realm=False, no_icon=False) -> Optional[Page]:
     print(f"Processing {file_path}")
 
-    try:
-        with open(file_path, 'r', encoding='utf-8-sig') as f:
-            file_content = f.read()
-    except UnicodeDecodeError:
-        print(f"Warning: Could not read {file_path} due to encoding issues")
-        return
+    source_file = SOURCE_CACHE.get(file_path)
+    if source_file is None:
+        return None
 
-    custom_folder, custom_filename, append = parse_folder_directives(file_content)
+    source = source_file.index
+    custom_folder, custom_filename, append = source_file.folder_directives
     custom_folder = normalize_doc_folder(custom_folder)
     custom_filename = normalize_doc_filename(custom_filename, is_library=is_library)
     # For module libraries prefer the main developer/libraries area (do not use developer/modules)
-    if is_library and base_docs_dir and is_module_library_file(file_path, base_docs_dir.parent, file_content):
+    if is_library and base_docs_dir and is_module_library_file(file_path, base_docs_dir.parent, source_file):
         if custom_folder == 'developer/modules/libraries':
             custom_folder = 'developer/libraries'
     comment_blocks, file_header, overview_section = find_comment_blocks_in_file(file_path)
@@ -1401,16 +3408,13 @@ def generate_documentation_for_file(file_path, output_dir, is_library=False, bas
                 break
 
     functions = find_functions_in_file(file_path, is_library)
-    file_hook_content = None
-    file_hook_header = None
-    file_hook_overview = None
     file_hooks = []
     if is_library:
-        file_hook_content, file_hook_header, file_hook_overview, file_hooks = find_hook_docs_in_file(file_path)
+        _, _, _, file_hooks = find_hook_docs_in_file(file_path)
 
     if not functions and not file_header and not overview_section:
         print(f" No structured functions or documentation content found in {file_path}")
-        return
+        return None
 
     if custom_folder and custom_filename and base_docs_dir:
         output_path = base_docs_dir / custom_folder / custom_filename
@@ -1436,12 +3440,11 @@ def generate_documentation_for_file(file_path, output_dir, is_library=False, bas
 
         output_path = Path(output_dir) / output_filename
 
-    sections = []
-    function_names = []
-
+    repo_dir = Path(__file__).parent
+    symbols = []
     for func in functions:
-        parsed = parse_comment_block(func['comment'])
-        if parsed['purpose']:
+        symbol = source_file.symbol(func['name'], 'function', func['comment'], func.get('line'), repo_dir)
+        if symbol.purpose:
             if is_library and 'modules' in str(file_path):
                 func_name = func['name']
                 if ':' in func_name:
@@ -1450,145 +3453,80 @@ def generate_documentation_for_file(file_path, output_dir, is_library=False, bas
                         print(f" Skipping hook implementation: {func_name} (documented centrally)")
                         continue
 
-            display_name = func['name']
-            if is_library and not func['name'].startswith('lia.'):
-                display_name = f'lia.{func["name"]}'
-            elif not is_library and ':' in func['name']:
-                display_name = func['name'].split(':', 1)[1]
-            elif is_library and func['name'].startswith('lia.'):
-                display_name = func['name']
-            
-            function_names.append(display_name)
-            section = generate_markdown_for_function(
-                func['name'],
-                parsed,
-                is_library,
-                no_realm=no_realm,
-                no_icon=no_icon,
-                source_url=build_source_url(file_path, Path(__file__).parent, func.get('line'))
-            )
-            sections.append(section)
+            symbols.append(symbol)
 
-    hook_sections = []
+    hook_symbols = []
     if is_library and file_hooks:
-        hook_sections = [
-            generate_markdown_for_function(
-                hook['name'],
-                parse_comment_block(hook['comment']),
-                is_library=False,
-                no_realm=no_realm,
-                no_icon=no_icon,
-                source_url=build_source_url(file_path, Path(__file__).parent, hook.get('line'))
-            )
+        hook_symbols = [
+            source_file.symbol(hook['name'], 'hook', hook['comment'], hook.get('line'), repo_dir)
             for hook in sorted(file_hooks, key=lambda item: item['name'].lower())
         ]
 
-    if not sections and not hook_sections and not file_header and not overview_section:
+    if not symbols and not hook_symbols and not file_header and not overview_section:
         print(f" No valid function documentation or content found in {file_path}")
-        return
+        return None
+
+    if custom_filename:
+        display_name = custom_filename.replace('.md', '').title()
+    else:
+        display_name = Path(file_path).stem.title()
+
+    title = display_name
+    subtitle = f'This page documents the functions and methods in the { "Lilia library" if is_library else "meta table" }.'
+
+    if file_header:
+        parsed_header = parse_file_header(file_header)
+        if '\n\n' in parsed_header:
+            parts = parsed_header.split('\n\n', 1)
+            title = parts[0].replace('**', '').replace('*', '').strip()
+            if len(parts) > 1 and parts[1].strip():
+                subtitle = parts[1].strip()
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_filename = output_path.name
     page_source_line = (
-        find_block_line(file_content, overview_section)
-        or find_block_line(file_content, file_header)
+        find_block_line(source, overview_section)
+        or find_block_line(source, file_header)
         or (functions[0].get('comment_line') if functions else None)
         or (functions[0].get('line') if functions else None)
         or 1
     )
-    page_source_url = build_source_url(file_path, Path(__file__).parent, page_source_line)
-
-    file_mode = 'a' if append else 'w'
-    with open(output_path, file_mode, encoding='utf-8') as f:
-        if not append:
-            if custom_filename:
-                display_name = custom_filename.replace('.md', '').title()
-            else:
-                display_name = Path(file_path).stem.title()
-
-            title = display_name
-            subtitle = f'This page documents the functions and methods in the { "Lilia library" if is_library else "meta table" }.'
-
-            if file_header:
-                parsed_header = parse_file_header(file_header)
-                if '\n\n' in parsed_header:
-                    parts = parsed_header.split('\n\n', 1)
-                    title = parts[0].replace('**', '').replace('*', '').strip()
-                    if len(parts) > 1 and parts[1].strip():
-                        subtitle = parts[1].strip()
-
-            css_block = '''<style>
-details > summary {
-    position: relative;
-    display: flex;
-    align-items: center;
-    min-height: 70px;
-    padding-right: 180px;
-}
+    source_path = get_repo_relative_path(file_path, repo_dir)
+
+    return Page(
+        output_path=output_path,
+        kind='library' if is_library else 'meta',
+        title=title,
+        subtitle=subtitle,
+        overview=parse_overview_section(overview_section) if overview_section else None,
+        symbols=symbols,
+        hooks=hook_symbols,
+        sources=[source_path],
+        location=SourceLocation(source_path, page_source_line),
+        append=append,
+        is_library=is_library,
+        no_realm=no_realm,
+        no_icon=no_icon,
+    )
 
-details > summary .summary-main {
-    min-width: 0;
-}
 
-details > summary .source-link-button--summary {
-    position: absolute;
-    right: 56px;
-    top: 50%;
-    transform: translateY(-50%);
-    white-space: nowrap;
-    z-index: 2;
-}
-</style>\n\n'''
-            f.write(css_block)
-            f.write(f'# {title}\n\n')
-            f.write(f'{subtitle}\n\n')
-            f.write('---\n\n')
-
-            if overview_section:
-                f.write('<h3 style="margin-bottom: 5px;">Overview</h3>\n')
-                f.write('<div style="margin-left: 20px; margin-bottom: 20px;">\n')
-                overview_content = parse_overview_section(overview_section)
-                f.write(overview_content)
-                f.write('\n</div>\n\n')
-                f.write('---\n\n')
-
-        for section in sections:
-            f.write(section)
-            f.write('---\n\n')
-
-        if hook_sections:
-            f.write('<h2 style="margin-bottom: 5px;">Hooks</h2>\n')
-            f.write('<div style="margin-left: 20px; margin-bottom: 20px;">\n')
-            f.write('<p>Library-specific hooks documented for this library.</p>\n')
-            f.write('</div>\n\n')
-            f.write('---\n\n')
-            for section in hook_sections:
-                f.write(section)
-                f.write('---\n\n')
-
-    print(f" Generated {output_path.name}")
+def generate_documentation_for_file(file_path, output_dir, is_library=False, base_docs_dir=None, force=False, no_realm=False, no_icon=False):
+    page = build_documentation_page(file_path, output_dir, is_library=is_library, base_docs_dir=base_docs_dir, no_realm=no_realm, no_icon=no_icon)
+    if page is not None:
+        write_page(page)
 
 
 def _read_file_text(file_path: Path) -> str:
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
-    except UnicodeDecodeError:
-        print(f"Warning: Could not read {file_path} due to encoding issues")
-        return ''
+    source_file = SOURCE_CACHE.get(file_path)
+    return source_file.raw_text if source_file else ''
 
 
 def generate_documentation_for_hooks_file(file_path: Path, output_dir: Path, base_docs_dir: Path) -> None:
     print(f"Processing {file_path}")
 
-    try:
-        with open(file_path, 'r', encoding='utf-8-sig') as f:
-            file_content = f.read()
-    except UnicodeDecodeError:
-        print(f"Warning: Could not read {file_path} due to encoding issues")
+    source_file = SOURCE_CACHE.get(file_path)
+    if source_file is None:
         return
 
-    custom_folder, custom_filename, append = parse_folder_directives(file_content)
+    custom_folder, custom_filename, append = source_file.folder_directives
 
     if custom_folder and custom_filename:
         output_path = base_docs_dir / custom_folder / custom_filename
@@ -1606,24 +3544,11 @@ def generate_documentation_for_hooks_file(file_path: Path, output_dir: Path, bas
         print(f" No hooks or documentation content found in {file_path}")
         return
 
-    sections: List[str] = []
-    function_names = []
-    for func in functions:
-        parsed = parse_comment_block(func['comment'])
-        func_name = func['name']
-        if ':' in func_name:
-            display_name = func_name.split(':', 1)[1]
-        else:
-            display_name = func_name
-        function_names.append(display_name)
-        sections.append(
-            generate_markdown_for_function(
-                func['name'],
-                parsed,
-                is_library=False,
-                source_url=build_source_url(file_path, Path(__file__).parent, func.get('line'))
-            )
-        )
+    repo_dir = Path(__file__).parent
+    symbols = [
+        source_file.symbol(func['name'], 'function', func['comment'], func.get('line'), repo_dir)
+        for func in functions
+    ]
 
     if custom_filename:
         display_name = custom_filename.replace('.md', '').title()
@@ -1640,55 +3565,26 @@ def generate_documentation_for_hooks_file(file_path: Path, output_dir: Path, bas
             if len(parts) > 1 and parts[1].strip():
                 subtitle = parts[1].strip()
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    file_mode = 'a' if append else 'w'
     page_source_line = (
-        find_block_line(file_content, overview_section)
-        or find_block_line(file_content, file_header)
+        find_block_line(source_file.index, overview_section)
+        or find_block_line(source_file.index, file_header)
         or (functions[0].get('comment_line') if functions else None)
         or (functions[0].get('line') if functions else None)
         or 1
     )
-    page_source_url = build_source_url(file_path, Path(__file__).parent, page_source_line)
-
-    with open(output_path, file_mode, encoding='utf-8') as f:
-        if not append:
-            css_block = '''<style>
-details > summary {
-    position: relative;
-    display: flex;
-    align-items: center;
-    min-height: 70px;
-    padding-right: 180px;
-}
-
-details > summary .summary-main {
-    min-width: 0;
-}
+    source_path = get_repo_relative_path(file_path, repo_dir)
 
-details > summary .source-link-button--summary {
-    position: absolute;
-    right: 56px;
-    top: 50%;
-    transform: translateY(-50%);
-    white-space: nowrap;
-    z-index: 2;
-}
-</style>\n\n'''
-            f.write(css_block)
-            f.write(f'# {title}\n\n')
-            f.write(subtitle + '\n\n')
-            f.write('---\n\n')
-            if overview_section:
-                f.write('<h3 style="margin-bottom: 5px;">Overview</h3>\n')
-                f.write('<div style="margin-left: 20px; margin-bottom: 20px;">\n')
-                f.write(parse_overview_section(overview_section) + '\n')
-                f.write('</div>\n\n')
-                f.write('---\n\n')
-        for section in sections:
-            f.write(section)
-            f.write('---\n\n')
-    print(f" Generated {output_path.name}")
+    write_page(Page(
+        output_path=output_path,
+        kind='hooks',
+        title=title,
+        subtitle=subtitle,
+        overview=parse_overview_section(overview_section) if overview_section else None,
+        symbols=symbols,
+        sources=[source_path],
+        location=SourceLocation(source_path, page_source_line),
+        append=append,
+    ))
 
 
 def generate_about_page(output_path, force=False):
@@ -1772,55 +3668,85 @@ def generate_about_page(output_path, force=False):
 
     # 5. Write back
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with OUTPUT_WRITER.open(output_path) as f:
             f.write(new_content)
         print(f" Successfully updated {output_path} with {len(modules)} modules.")
     except Exception as e:
         print(f" Error writing {output_path}: {e}")
 
 
-def run_meta_generation(base_dir: Path, docs_dir: Path, force: bool) -> None:
-    meta_dir = base_dir / 'gamemode' / 'core' / 'meta'
+def build_meta_page(entry: InventoryEntry, output_dir: Path, docs_dir: Path) -> Optional[Page]:
+    return build_documentation_page(entry.path, output_dir, is_library=False, base_docs_dir=docs_dir, no_realm=False, no_icon=False)
+
+
+def build_library_page(entry: InventoryEntry, output_dir: Path, docs_dir: Path, base_dir: Path) -> Optional[Page]:
+    if entry.rel_parts[:2] == ('gamemode', 'modules'):
+        source_file = SOURCE_CACHE.get(entry.path)
+        if source_file is None or not is_module_library_file(entry.path, base_dir, source_file):
+            return None
+    return build_documentation_page(entry.path, output_dir, is_library=True, base_docs_dir=docs_dir, no_realm=False, no_icon=False)
+
+
+def meta_source_entries(base_dir: Path) -> List[InventoryEntry]:
+    return [
+        inventory_entry
+        for inventory_entry in get_source_inventory(base_dir).files('core', 'meta')
+        if not DOC_PREFILTER.is_excluded(inventory_entry)
+    ]
+
+
+def library_source_entries(base_dir: Path) -> List[InventoryEntry]:
+    inventory = get_source_inventory(base_dir)
+    entries = [
+        inventory_entry
+        for inventory_entry in inventory.files('core', 'libraries')
+        if not DOC_PREFILTER.is_excluded(inventory_entry)
+    ]
+    # Also process module library files but write them into the main libraries directory
+    for inventory_entry in inventory.files('modules'):
+        # Outside libraries/ folders only a `File: lia.*` directive makes a module library.
+        if inventory_entry.kind == 'module-library':
+            if not DOC_PREFILTER.is_excluded(inventory_entry):
+                entries.append(inventory_entry)
+        elif DOC_PREFILTER.accepts(inventory_entry, DIRECTIVE_MARKERS):
+            entries.append(inventory_entry)
+    return entries
+
+
+def run_meta_generation(base_dir: Path, docs_dir: Path, force: bool, manifest: Optional[BuildManifest]=None, jobs: int=1, write_index: bool=True) -> None:
+    if manifest is None:
+        manifest = BuildManifest(base_dir / DOCGEN_MANIFEST_NAME, compute_generator_fingerprint(), force=True)
+
     output_dir = docs_dir / 'developer' / 'meta'
-    if meta_dir.exists():
-        for file_path in meta_dir.rglob('*.lua'):
-            generate_documentation_for_file(file_path, output_dir, is_library=False, base_docs_dir=docs_dir, force=force, no_realm=False, no_icon=False)
-    generate_index_file(output_dir, 'meta')
+    entries = meta_source_entries(base_dir)
+    generate_file_pages('meta', entries, partial(build_meta_page, output_dir=output_dir, docs_dir=docs_dir), manifest, jobs)
+    if write_index:
+        generate_index_file(output_dir, 'meta')
 
 
-def run_library_generation(base_dir: Path, docs_dir: Path, force: bool) -> None:
+def run_library_generation(base_dir: Path, docs_dir: Path, force: bool, manifest: Optional[BuildManifest]=None, jobs: int=1, write_index: bool=True) -> None:
+    if manifest is None:
+        manifest = BuildManifest(base_dir / DOCGEN_MANIFEST_NAME, compute_generator_fingerprint(), force=True)
+
     core_output_dir = docs_dir / 'developer' / 'libraries'
-    core_lib_dir = base_dir / 'gamemode' / 'core' / 'libraries'
-    if core_lib_dir.exists():
-        for file_path in core_lib_dir.rglob('*.lua'):
-            generate_documentation_for_file(file_path, core_output_dir, is_library=True, base_docs_dir=docs_dir, force=force, no_realm=False, no_icon=False)
-    generate_index_file(core_output_dir, 'library')
-    # Also process module library files but write them into the main libraries directory
-    module_lib_dir = base_dir / 'gamemode' / 'modules'
-    if module_lib_dir.exists():
-        for file_path in module_lib_dir.rglob('*.lua'):
-            try:
-                with open(file_path, 'r', encoding='utf-8-sig') as f:
-                    file_content = f.read()
-            except UnicodeDecodeError:
-                print(f"Warning: Could not read {file_path} due to encoding issues")
-                continue
-            if is_module_library_file(file_path, base_dir, file_content):
-                # Generate module library docs into the main libraries folder
-                generate_documentation_for_file(file_path, core_output_dir, is_library=True, base_docs_dir=docs_dir, force=force, no_realm=False, no_icon=False)
-    # Index for libraries already generated above
+    entries = library_source_entries(base_dir)
+    build_page = partial(build_library_page, output_dir=core_output_dir, docs_dir=docs_dir, base_dir=base_dir)
+    generate_file_pages('library', entries, build_page, manifest, jobs)
+    if write_index:
+        generate_index_file(core_output_dir, 'library')
 
 
-def run_hooks_generation(base_dir: Path, docs_dir: Path) -> None:
+def run_hooks_generation(base_dir: Path, docs_dir: Path, manifest: Optional[BuildManifest]=None, jobs: int=1, write_index: bool=True, verify_output: bool=False) -> None:
     core_output_dir = docs_dir / 'developer' / 'hooks'
     # Generate module hooks into the same hooks directory (no separate modules section)
-    generate_hook_documentation(core_output_dir, core_output_dir, base_dir)
-    generate_index_file(core_output_dir, 'hooks')
+    generate_hook_documentation(core_output_dir, core_output_dir, base_dir, manifest, jobs, verify_output)
+    if write_index:
+        generate_index_file(core_output_dir, 'hooks')
 
 
-def run_compatibility_generation(base_dir: Path, docs_dir: Path) -> None:
+def run_compatibility_generation(base_dir: Path, docs_dir: Path, manifest: Optional[BuildManifest]=None, jobs: int=1, verify_output: bool=False) -> None:
     """Legacy alias for compatibility hook docs generation."""
-    run_hooks_generation(base_dir, docs_dir)
+    run_hooks_generation(base_dir, docs_dir, manifest, jobs, verify_output=verify_output)
 
 
 def run_generators_generation(docs_dir: Path) -> None:
@@ -1834,86 +3760,1216 @@ def run_about_generation(docs_dir: Path, force: bool) -> None:
         generate_about_page(legacy_about_path, force=force)
 
 
+@dataclass
+class BuildPhase:
+    """One step of a documentation build; inputs and outputs are docs-relative paths."""
+    name: str
+    run: Callable[[], None]
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+
+
+class _PhaseStdout:
+    """Route print() output to the running phase's buffer, or to the real stream outside phases."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text: str) -> int:
+        buffer = getattr(PHASE_CONTEXT, 'log', None)
+        return (buffer if buffer is not None else self.stream).write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+class PhaseScheduler:
+    """Run build phases as soon as every phase producing one of their inputs has finished."""
+
+    def __init__(self, phases: Sequence[BuildPhase], jobs: int=1):
+        self.phases = {phase.name: phase for phase in phases}
+        producers: Dict[str, List[str]] = {}
+        for phase in phases:
+            for output in phase.outputs:
+                producers.setdefault(output, []).append(phase.name)
+        self.dependencies = {
+            phase.name: {producer for artifact in phase.inputs for producer in producers.get(artifact, ()) if producer != phase.name}
+            for phase in phases
+        }
+        self.order = self._topological_order()
+        self.jobs = max(1, jobs)
+
+    def _topological_order(self) -> List[str]:
+        order: List[str] = []
+        remaining = list(self.phases)
+        while remaining:
+            ready = [name for name in remaining if self.dependencies[name].issubset(order)]
+            if not ready:
+                raise RuntimeError(f"Build phases have a dependency cycle: {', '.join(remaining)}")
+            order.append(ready[0])
+            remaining.remove(ready[0])
+        return order
+
+    def run(self) -> None:
+        if self.jobs <= 1 or len(self.order) < 2:
+            for name in self.order:
+                self._run_phase(name)
+            return
+
+        # Phases run in threads; their logs and pages are replayed in topological order so
+        # the output matches a serial run.
+        real_stdout = sys.stdout
+        sys.stdout = _PhaseStdout(real_stdout)
+        results: Dict[str, Tuple[str, List[Page]]] = {}
+        flushed = 0
+        try:
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                running = {}
+                while flushed < len(self.order):
+                    for name in self.order:
+                        if name not in results and name not in running.values() and self.dependencies[name].issubset(results):
+                            running[executor.submit(self._run_captured, name)] = name
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results[running.pop(future)] = future.result()
+                    while flushed < len(self.order) and self.order[flushed] in results:
+                        log, pages = results[self.order[flushed]]
+                        real_stdout.write(log)
+                        DOC_MODEL.pages.extend(pages)
+                        flushed += 1
+        finally:
+            sys.stdout = real_stdout
+
+    def _run_phase(self, name: str) -> None:
+        phase = self.phases[name]
+        function_name = getattr(phase.run, 'func', phase.run).__name__
+        with TRACE.span(function_name, 'phase', phase=name), MEMORY.phase(function_name):
+            phase.run()
+            SOURCE_CACHE.release()
+
+    def _run_captured(self, name: str) -> Tuple[str, List[Page]]:
+        PHASE_CONTEXT.log = StringIO()
+        PHASE_CONTEXT.pages = []
+        try:
+            self._run_phase(name)
+            return PHASE_CONTEXT.log.getvalue(), PHASE_CONTEXT.pages
+        finally:
+            PHASE_CONTEXT.log = None
+            PHASE_CONTEXT.pages = None
+
+
+COMMAND_PHASES = {
+    'meta': ('meta',),
+    'library': ('library',),
+    'hooks': ('hooks',),
+    'compatibility': ('compatibility',),
+    'generators': ('generators',),
+    'about': ('about',),
+    'all': ('meta', 'library', 'hooks', 'generators', 'about'),
+}
+
+DEVELOPER_SECTION_DIRS = ('developer/meta', 'developer/libraries', 'developer/hooks')
+
+
+def build_phase_plan(phase_names: Sequence[str], base_dir: Path, docs_dir: Path, force: bool, manifest: BuildManifest, jobs: int, sync_definitions: bool=False, verify_output: bool=False, max_index_bytes: int=SYMBOL_INDEX_MAX_BYTES) -> List[BuildPhase]:
+    """Return the phases a command runs, with index and nav steps limited to the sections it touches."""
+    generation = {
+        'meta': BuildPhase('meta', partial(run_meta_generation, base_dir, docs_dir, force, manifest, jobs), outputs=('developer/meta',)),
+        'library': BuildPhase('library', partial(run_library_generation, base_dir, docs_dir, force, manifest, jobs), outputs=('developer/libraries',)),
+        'hooks': BuildPhase('hooks', partial(run_hooks_generation, base_dir, docs_dir, manifest, jobs, verify_output=verify_output), outputs=('developer/hooks',)),
+        'compatibility': BuildPhase('compatibility', partial(run_compatibility_generation, base_dir, docs_dir, manifest, jobs, verify_output), outputs=('developer/hooks',)),
+        'generators': BuildPhase('generators', partial(run_generators_generation, docs_dir), outputs=('generators',)),
+        'about': BuildPhase('about', partial(run_about_generation, docs_dir, force), outputs=('about',)),
+    }
+    phases = [generation[name] for name in phase_names]
+    touched = {artifact for phase in phases for artifact in phase.outputs}
+    if sync_definitions:
+        # Item definitions are written by hand, but a full build keeps their nav in sync too.
+        touched.add('definitions/items')
+
+    developer_sections = tuple(directory for directory in DEVELOPER_SECTION_DIRS if directory in touched)
+    if developer_sections:
+        # The developer index only links sections that exist, so it waits for every section being rebuilt.
+        phases.append(BuildPhase(
+            'developer-index',
+            partial(generate_development_index, docs_dir / 'developer'),
+            inputs=developer_sections,
+            outputs=('developer/index.md',),
+        ))
+    indexed_sections = tuple(directory for directory in SYMBOL_INDEX_SECTIONS if directory in touched)
+    if indexed_sections:
+        phases.append(BuildPhase(
+            'symbol-index',
+            partial(write_symbol_index, docs_dir, manifest, max_index_bytes),
+            inputs=indexed_sections,
+            outputs=(f'assets/{SYMBOL_INDEX_NAME}',),
+        ))
+    if developer_sections or 'generators' in touched:
+        phases.append(BuildPhase('pages', partial(generate_pages_file, docs_dir), outputs=('.pages', 'developer/.pages')))
+
+    nav_directories = tuple(directory for directory in (*DEVELOPER_SECTION_DIRS, 'definitions/items') if directory in touched)
+    if nav_directories:
+        phases.append(BuildPhase(
+            'nav',
+            partial(sync_mkdocs_nav, base_dir / 'documentation' / 'mkdocs.yml', docs_dir, nav_directories),
+            inputs=nav_directories,
+            outputs=('mkdocs.yml',),
+        ))
+    return phases
+
+
+WATCH_PHASES = ('meta', 'library', 'hooks')
+
+WATCH_SECTIONS = {
+    'developer/meta': 'meta',
+    'developer/libraries': 'library',
+    'developer/hooks': 'hooks',
+}
+
+
+def snapshot_page_titles(docs_dir: Path) -> Dict[Path, Tuple[str, str]]:
+    """Title and summary of every generated page, as shown by the section indexes and nav."""
+    titles = {}
+    for directory in WATCH_SECTIONS:
+        for md_file in (docs_dir / directory).glob('*.md'):
+            if md_file.name != 'index.md':
+                titles[md_file] = extract_title_and_summary(md_file)
+    return titles
+
+
+def run_watch_cycle(base_dir: Path, docs_dir: Path, manifest: BuildManifest, jobs: int, titles: Dict[Path, Tuple[str, str]]) -> None:
+    """Regenerate the pages behind changed sources, then refresh indexes and nav whose entries changed."""
+    OUTPUT_WRITER.changed.clear()
+    DOC_MODEL.pages.clear()
+    run_meta_generation(base_dir, docs_dir, False, manifest, jobs, write_index=False)
+    run_library_generation(base_dir, docs_dir, False, manifest, jobs, write_index=False)
+    run_hooks_generation(base_dir, docs_dir, manifest, jobs, write_index=False)
+    SOURCE_CACHE.release()
+    manifest.save()
+    manifest.start_next_run()
+    if OUTPUT_WRITER.changed:
+        write_symbol_index(docs_dir, manifest)
+    PAGE_REGISTRY.save()
+
+    stale_sections = set()
+    for path in sorted(OUTPUT_WRITER.changed):
+        directory = path.parent.relative_to(docs_dir).as_posix() if path.is_relative_to(docs_dir) else None
+        if directory not in WATCH_SECTIONS or path.name == 'index.md':
+            continue
+        entry = extract_title_and_summary(path) if path.exists() else None
+        if titles.get(path) != entry:
+            stale_sections.add(directory)
+            if entry is None:
+                titles.pop(path, None)
+            else:
+                titles[path] = entry
+
+    if not stale_sections:
+        print(" Page titles and summaries unchanged; indexes and nav left as they are")
+        return
+
+    nav_directories = tuple(directory for directory in WATCH_SECTIONS if directory in stale_sections)
+    for directory in nav_directories:
+        generate_index_file(docs_dir / directory, WATCH_SECTIONS[directory])
+    generate_development_index(docs_dir / 'developer')
+    sync_mkdocs_nav(base_dir / 'documentation' / 'mkdocs.yml', docs_dir, nav_directories)
+
+
+def watch_documentation(base_dir: Path, docs_dir: Path, manifest: BuildManifest, jobs: int=1, interval: float=0.5, debounce: float=0.3) -> None:
+    """Poll gamemode/ and rebuild only what each batch of saves affects, until interrupted."""
+    PhaseScheduler(build_phase_plan(WATCH_PHASES, base_dir, docs_dir, False, manifest, jobs), jobs=jobs).run()
+    manifest.save()
+    manifest.start_next_run()
+    PAGE_REGISTRY.save()
+    titles = snapshot_page_titles(docs_dir)
+    print(f" Watching {base_dir / 'gamemode'} for changes (Ctrl+C to stop)")
+
+    try:
+        while True:
+            time.sleep(interval)
+            changed = refresh_source_inventory(base_dir)
+            if not changed:
+                continue
+
+            # Editors often save in several steps; wait until the tree has been quiet for the debounce window.
+            pending = set(changed)
+            while True:
+                time.sleep(debounce)
+                more = refresh_source_inventory(base_dir)
+                if not more:
+                    break
+                pending.update(more)
+
+            started = time.perf_counter()
+            print(f"\n Detected changes in {len(pending)} file{'s' if len(pending) != 1 else ''}: {', '.join(sorted(pending)[:5])}{' ...' if len(pending) > 5 else ''}")
+            try:
+                run_watch_cycle(base_dir, docs_dir, manifest, jobs, titles)
+            except Exception as exc:
+                print(f" Error: {exc}")
+                continue
+            print(f" Rebuilt in {time.perf_counter() - started:.2f}s ({len(OUTPUT_WRITER.changed)} files changed)")
+    except KeyboardInterrupt:
+        print(" Stopped watching")
+
+
+def collect_render_corpus(base_dir: Path, docs_dir: Path) -> List[Tuple[Symbol, bool, bool, bool]]:
+    """Every library and hook symbol with the flags render_page_markdown renders it with."""
+    calls = []
+    library_dir = docs_dir / 'developer' / 'libraries'
+    with redirect_stdout(StringIO()):
+        for entry in library_source_entries(base_dir):
+            page = build_library_page(entry, library_dir, docs_dir, base_dir)
+            if page is None:
+                continue
+            calls.extend((symbol, page.is_library, page.no_realm, page.no_icon) for symbol in page.symbols)
+            calls.extend((symbol, False, page.no_realm, page.no_icon) for symbol in page.hooks)
+        for entry in hook_source_entries(base_dir):
+            collected = collect_hook_file(entry, base_dir)
+            if collected:
+                calls.extend((symbol, False, False, False) for symbol in collected['hooks'])
+    return calls
+
+
+def iter_corpus_pages(base_dir: Path, docs_dir: Path) -> Iterator[Page]:
+    """Build every meta, library and per-file hook page in memory, one source file at a time, writing nothing."""
+    builders = (
+        (meta_source_entries, lambda entry: build_meta_page(entry, docs_dir / 'developer' / 'meta', docs_dir)),
+        (library_source_entries, lambda entry: build_library_page(entry, docs_dir / 'developer' / 'libraries', docs_dir, base_dir)),
+        (hook_source_entries, lambda entry: build_hook_file_page(entry, docs_dir, base_dir)),
+    )
+    for source_entries, build in builders:
+        for entry in source_entries(base_dir):
+            with redirect_stdout(StringIO()):
+                page = build(entry)
+            if page is not None:
+                yield page
+
+
+def build_hook_file_page(entry: InventoryEntry, docs_dir: Path, base_dir: Path) -> Optional[Page]:
+    collected = collect_hook_file(entry, base_dir)
+    if not collected:
+        return None
+    return Page(docs_dir / 'developer' / 'hooks' / f'{entry.path.stem}.md', 'hooks', '', '', symbols=collected['hooks'])
+
+
+def best_time(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_render(base_dir: Path, docs_dir: Path, repeat: int) -> Dict[str, float]:
+    """Render the whole library and hook corpus with generate_markdown_for_function."""
+    calls = collect_render_corpus(base_dir, docs_dir)
+
+    def render_all() -> int:
+        return sum(len(generate_markdown_for_function(symbol, is_library, no_realm=no_realm, no_icon=no_icon)) for symbol, is_library, no_realm, no_icon in calls)
+
+    chars = render_all()
+    elapsed = best_time(render_all, repeat)
+    print(f" render: {len(calls)} symbols ({chars} chars) per pass, best of {repeat}: {elapsed * 1000:.2f} ms ({len(calls) / elapsed:,.0f} symbols/s)")
+    return {'symbols': len(calls), 'chars': chars, 'seconds': elapsed, 'per_second': len(calls) / elapsed}
+
+
+def collect_comment_blocks(base_dir: Path) -> List[Tuple[str, int, str]]:
+    """(relative path, line, text) of every `--[[ ]]` block under gamemode/."""
+    blocks = []
+    for entry in get_source_inventory(base_dir).entries:
+        source = SOURCE_CACHE.get(entry.path)
+        if source is not None:
+            blocks.extend((entry.rel_posix, block['line'], block['text']) for block in source.index.blocks)
+    return blocks
+
+
+def bench_parse(base_dir: Path, docs_dir: Path, repeat: int) -> Dict[str, float]:
+    """Parse every `--[[ ]]` block under gamemode/ with parse_comment_block."""
+    blocks = [text for _, _, text in collect_comment_blocks(base_dir)]
+
+    def parse_all() -> None:
+        for block in blocks:
+            parse_comment_block(block)
+
+    elapsed = best_time(parse_all, repeat)
+    print(f" parse: {len(blocks)} comment blocks per pass, best of {repeat}: {elapsed * 1000:.2f} ms ({len(blocks) / elapsed:,.0f} blocks/s)")
+    return {'blocks': len(blocks), 'seconds': elapsed, 'per_second': len(blocks) / elapsed}
+
+
+PARSE_SNAPSHOT_PATH = Path('documentation') / 'scripts' / 'parse-snapshot.json'
+PARSE_SNAPSHOT_VERSION = 1
+
+
+def _short_digest(text: str) -> str:
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def verify_parse_snapshot(base_dir: Path, update: bool=False) -> bool:
+    """Check parse_comment_block against the committed digest of its output for every block in gamemode/.
+
+    The snapshot maps a digest of each block's text to a digest of the dict parsed from it, so
+    blocks keep matching when they move. Blocks added or edited since are counted, not failed;
+    update rewrites the snapshot from the current parser.
+    """
+    snapshot_path = base_dir / PARSE_SNAPSHOT_PATH
+    results: Dict[str, str] = {}
+    locations: Dict[str, Tuple[str, int]] = {}
+    for rel, line, text in collect_comment_blocks(base_dir):
+        block_digest = _short_digest(text)
+        results[block_digest] = _short_digest(json.dumps(parse_comment_block(text), ensure_ascii=False, sort_keys=True, separators=(',', ':')))
+        locations.setdefault(block_digest, (rel, line))
+
+    if update:
+        payload = {'version': PARSE_SNAPSHOT_VERSION, 'blocks': dict(sorted(results.items()))}
+        OUTPUT_WRITER.write_text(snapshot_path, json.dumps(payload, indent=0, separators=(',', ':')) + '\n')
+        print(f" Wrote parse snapshot of {len(results)} comment blocks to {PARSE_SNAPSHOT_PATH.as_posix()}")
+        return True
+
+    try:
+        snapshot = json.loads(snapshot_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError) as error:
+        print(f" Could not read parse snapshot {PARSE_SNAPSHOT_PATH.as_posix()}: {error}")
+        return False
+    if snapshot.get('version') != PARSE_SNAPSHOT_VERSION:
+        print(f" Parse snapshot {PARSE_SNAPSHOT_PATH.as_posix()} has an unknown version; rewrite it with --update-snapshot")
+        return False
+
+    expected = snapshot['blocks']
+    mismatched = [block_digest for block_digest, result in results.items() if block_digest in expected and expected[block_digest] != result]
+    unknown = sum(1 for block_digest in results if block_digest not in expected)
+    print(
+        f" Parse snapshot: {len(results) - unknown} comment blocks checked, {len(mismatched)} changed, "
+        f"{unknown} not in the snapshot{' (refresh it with --update-snapshot)' if unknown else ''}"
+    )
+    for block_digest in mismatched[:20]:
+        rel, line = locations[block_digest]
+        print(f"  {rel}:{line}: parse_comment_block output differs from the snapshot")
+    if len(mismatched) > 20:
+        print(f"  ... {len(mismatched) - 20} more")
+    return not mismatched
+
+
+def bench_search(base_dir: Path, docs_dir: Path, repeat: int) -> Dict[str, float]:
+    """Search-as-you-type lookups against a symbol index built from the whole corpus."""
+    rows = []
+    for page in iter_corpus_pages(base_dir, docs_dir):
+        url = page.output_path.relative_to(docs_dir).with_suffix('').as_posix() + '/'
+        rows.extend((name, url, anchor, realm, category, kind, purpose) for name, anchor, realm, category, kind, purpose in symbol_index_rows(page))
+
+    text = json.dumps(SymbolIndex.build(rows).to_payload(), ensure_ascii=False, separators=(',', ':'))
+    load_seconds = best_time(lambda: SymbolIndex.from_payload(json.loads(text)), max(1, repeat // 4))
+    index = SymbolIndex.from_payload(json.loads(text))
+
+    # What a reader types on the way to each name: growing prefixes of its last term, then the full name.
+    queries = []
+    for name in index.columns['name']:
+        term = symbol_search_terms(name)[-1]
+        queries.extend(term[:length] for length in (1, 2, 3, 5, 8) if length <= len(term))
+        queries.append(name)
+
+    def search_all() -> int:
+        return sum(len(index.lookup(query)) for query in queries)
+
+    hits = search_all()
+    elapsed = best_time(search_all, repeat)
+    per_query = elapsed / len(queries)
+    print(f" search: {len(rows)} symbols, index {len(text.encode('utf-8'))} bytes, load {load_seconds * 1000:.2f} ms")
+    print(f" search: {len(queries)} queries ({hits} results) per pass, best of {repeat}: {elapsed * 1000:.2f} ms ({per_query * 1e6:.1f} us/query)")
+    return {'symbols': len(rows), 'bytes': len(text.encode('utf-8')), 'queries': len(queries), 'seconds': elapsed, 'per_query': per_query, 'load_seconds': load_seconds}
+
+
+BENCHMARKS = {
+    'render': bench_render,
+    'parse': bench_parse,
+    'search': bench_search,
+}
+
+
+BENCH_RESULTS_VERSION = 1
+BENCH_REGRESSION_THRESHOLD = 0.2
+# Timings this small are mostly scheduler noise, so they never count as regressions on their own.
+BENCH_NOISE_FLOOR_SECONDS = 0.001
+
+
+def benchmark_timings(results: Dict[str, object], prefix: str='') -> Dict[str, float]:
+    """Flatten every `seconds` / `*_seconds` value of a results tree into dotted metric names."""
+    timings = {}
+    for key, value in results.items():
+        name = f'{prefix}{key}'
+        if isinstance(value, dict):
+            timings.update(benchmark_timings(value, f'{name}.'))
+        elif isinstance(value, (int, float)) and (key == 'seconds' or key.endswith('_seconds')):
+            timings[name] = float(value)
+    return timings
+
+
+def compare_benchmark_results(current: Dict[str, object], baseline: Dict[str, object], threshold: float) -> List[str]:
+    """Print current timings against the baseline's and return the metrics slower by more than threshold."""
+    before = benchmark_timings(baseline.get('results', {}))
+    after = benchmark_timings(current.get('results', {}))
+    regressions = []
+    for name, seconds in after.items():
+        if name not in before:
+            continue
+        previous = before[name]
+        change = (seconds - previous) / previous if previous else 0.0
+        regressed = change > threshold and seconds - previous > BENCH_NOISE_FLOOR_SECONDS
+        print(f"  {name}: {previous * 1000:.2f} ms -> {seconds * 1000:.2f} ms ({change:+.1%}){'  REGRESSION' if regressed else ''}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def run_benchmarks(base_dir: Path, docs_dir: Path, names: Sequence[str], repeat: int, output: Optional[str]=None, baseline: Optional[str]=None, threshold: float=BENCH_REGRESSION_THRESHOLD, history: bool=True, label: Optional[str]=None) -> bool:
+    """Run the named benchmarks, log them to the history, optionally save them as JSON and check them against a saved baseline."""
+    results = {name: BENCHMARKS[name](base_dir, docs_dir, repeat) for name in names}
+    if history:
+        BENCH_HISTORY.record(base_dir, f"bench {' '.join(names)}", benchmark_timings(results), label)
+    payload = {
+        'version': BENCH_RESULTS_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'cpus': os.cpu_count(),
+        'repeat': repeat,
+        'results': results,
+    }
+    if output:
+        OUTPUT_WRITER.write_text(Path(output), json.dumps(payload, indent=2) + '\n')
+        print(f" Wrote benchmark results to {output}")
+    if not baseline:
+        return True
+
+    try:
+        baseline_payload = json.loads(Path(baseline).read_text(encoding='utf-8'))
+    except (OSError, ValueError) as exc:
+        raise RuntimeError(f"Could not read benchmark baseline {baseline}: {exc}") from exc
+    print(f" Compared with {baseline} ({baseline_payload.get('created', 'unknown date')}), threshold {threshold:.0%}:")
+    regressions = compare_benchmark_results(payload, baseline_payload, threshold)
+    if regressions:
+        print(f" {len(regressions)} regression{'s' if len(regressions) != 1 else ''} over {threshold:.0%}: {', '.join(regressions)}")
+        return False
+    print(" No regressions")
+    return True
+
+
+BENCH_HISTORY_NAME = '.docgen-bench.sqlite'
+BENCH_HISTORY_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created TEXT NOT NULL,
+    command TEXT NOT NULL,
+    label TEXT,
+    git_commit TEXT,
+    corpus TEXT NOT NULL,
+    python TEXT NOT NULL,
+    cpus INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    metric TEXT NOT NULL,
+    seconds REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_commit ON runs(git_commit);
+CREATE INDEX IF NOT EXISTS samples_run ON samples(run_id);
+'''
+# Two-sided 95% Student t quantiles by degrees of freedom; larger samples use the normal value.
+T_QUANTILES_95 = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228, 2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086, 2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042)
+
+
+def current_git_commit(base_dir: Path) -> Optional[str]:
+    """HEAD of the checkout, with a -dirty suffix when tracked files have local changes."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=base_dir, capture_output=True, text=True, timeout=10, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=base_dir, capture_output=True, text=True, timeout=30, check=True).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return f'{commit}-dirty' if dirty else commit
+
+
+def corpus_fingerprint(base_dir: Path) -> str:
+    """Digest of the gamemode/ file list and sizes, so runs over different trees are not compared blindly."""
+    digest = hashlib.blake2b(digest_size=8)
+    for entry in sorted(get_source_inventory(base_dir).entries, key=lambda entry: entry.rel_posix):
+        digest.update(f'{entry.rel_posix}\0{entry.size}\n'.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def mean_and_variance(values: Sequence[float]) -> Tuple[float, float]:
+    mean = sum(values) / len(values)
+    variance = sum((value - mean) ** 2 for value in values) / (len(values) - 1) if len(values) > 1 else 0.0
+    return mean, variance
+
+
+def difference_interval(before: Sequence[float], after: Sequence[float]) -> Optional[Tuple[float, float]]:
+    """95% Welch interval for mean(after) - mean(before); None without two samples on each side."""
+    if len(before) < 2 or len(after) < 2:
+        return None
+    mean_before, variance_before = mean_and_variance(before)
+    mean_after, variance_after = mean_and_variance(after)
+    a, b = variance_before / len(before), variance_after / len(after)
+    delta = mean_after - mean_before
+    if a + b == 0:
+        return delta, delta
+    freedom = (a + b) ** 2 / ((a * a / (len(before) - 1) if a else 0.0) + (b * b / (len(after) - 1) if b else 0.0))
+    quantile = T_QUANTILES_95[int(freedom) - 1] if int(freedom) <= len(T_QUANTILES_95) else 1.96
+    margin = quantile * (a + b) ** 0.5
+    return delta - margin, delta + margin
+
+
+class BenchHistory:
+    """SQLite log of benchmarked and profiled runs, keyed by commit, corpus, Python version and CPU count."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path)
+            self._connection.row_factory = sqlite3.Row
+            self._connection.executescript(BENCH_HISTORY_SCHEMA)
+        return self._connection
+
+    def record(self, base_dir: Path, command: str, timings: Dict[str, float], label: Optional[str]=None) -> int:
+        with self.connection:
+            cursor = self.connection.execute(
+                'INSERT INTO runs (created, command, label, git_commit, corpus, python, cpus) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (time.strftime('%Y-%m-%dT%H:%M:%S%z'), command, label, current_git_commit(base_dir), corpus_fingerprint(base_dir), sys.version.split()[0], os.cpu_count() or 1),
+            )
+            run_id = cursor.lastrowid
+            self.connection.executemany('INSERT INTO samples (run_id, metric, seconds) VALUES (?, ?, ?)', [(run_id, metric, seconds) for metric, seconds in sorted(timings.items())])
+        print(f" Recorded run {run_id} ({len(timings)} timings) in {self.path.name}")
+        return run_id
+
+    def resolve(self, base_dir: Path, reference: str) -> List[sqlite3.Row]:
+        """Runs matching a run id, a --label, a commit prefix or any git revision."""
+        queries = [('label = ?', reference), ('git_commit LIKE ?', f'{reference}%')]
+        if reference.isdigit():
+            queries.insert(0, ('id = ?', int(reference)))
+        try:
+            revision = subprocess.run(['git', 'rev-parse', '--verify', '--quiet', f'{reference}^{{commit}}'], cwd=base_dir, capture_output=True, text=True, timeout=10).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            revision = ''
+        if revision:
+            queries.append(('git_commit LIKE ?', f'{revision}%'))
+        for condition, value in queries:
+            rows = self.connection.execute(f'SELECT * FROM runs WHERE {condition} ORDER BY id', (value,)).fetchall()
+            if rows:
+                return rows
+        return []
+
+    def samples(self, run_ids: Sequence[int]) -> Dict[str, List[float]]:
+        values: Dict[str, List[float]] = {}
+        placeholders = ', '.join('?' * len(run_ids))
+        for metric, seconds in self.connection.execute(f'SELECT metric, seconds FROM samples WHERE run_id IN ({placeholders}) ORDER BY run_id', tuple(run_ids)):
+            values.setdefault(metric, []).append(seconds)
+        return values
+
+    def recent(self, limit: int=20) -> List[tuple]:
+        return self.connection.execute(
+            'SELECT runs.id, created, command, label, git_commit, python, cpus, COUNT(samples.metric) FROM runs '
+            'LEFT JOIN samples ON samples.run_id = runs.id GROUP BY runs.id ORDER BY runs.id DESC LIMIT ?',
+            (limit,),
+        ).fetchall()
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+BENCH_HISTORY = BenchHistory(Path(__file__).parent / BENCH_HISTORY_NAME)
+
+
+def describe_runs(rows: Sequence[sqlite3.Row]) -> str:
+    keys = sorted({(row['git_commit'] or 'no commit')[:12] for row in rows})
+    return f"{len(rows)} run{'s' if len(rows) != 1 else ''} of {', '.join(keys)}"
+
+
+def compare_history_runs(base_dir: Path, reference_a: str, reference_b: str) -> bool:
+    """Print per-metric mean deltas of B against A with 95% confidence intervals; False if either side is unknown."""
+    runs_a = BENCH_HISTORY.resolve(base_dir, reference_a)
+    runs_b = BENCH_HISTORY.resolve(base_dir, reference_b)
+    for reference, rows in ((reference_a, runs_a), (reference_b, runs_b)):
+        if not rows:
+            print(f" No recorded runs match {reference!r} (a run id, --label, commit prefix or git revision)")
+    if not runs_a or not runs_b:
+        return False
+
+    print(f" A = {reference_a}: {describe_runs(runs_a)}")
+    print(f" B = {reference_b}: {describe_runs(runs_b)}")
+    for key in ('corpus', 'python', 'cpus'):
+        values = {row[key] for row in (*runs_a, *runs_b)}
+        if len(values) > 1:
+            print(f" Warning: runs differ in {key} ({', '.join(sorted(map(str, values)))}); deltas mix that change in")
+
+    samples_a = BENCH_HISTORY.samples([row['id'] for row in runs_a])
+    samples_b = BENCH_HISTORY.samples([row['id'] for row in runs_b])
+    shared = sorted(set(samples_a) & set(samples_b))
+    if not shared:
+        print(" The two sides have no timings in common")
+        return True
+    width = max(len(metric) for metric in shared)
+    print(f"  {'metric':<{width}} {'A mean':>10} {'B mean':>10} {'delta':>9}  95% interval of B - A")
+    for metric in shared:
+        before, after = samples_a[metric], samples_b[metric]
+        mean_before, _ = mean_and_variance(before)
+        mean_after, _ = mean_and_variance(after)
+        change = (mean_after - mean_before) / mean_before if mean_before else 0.0
+        interval = difference_interval(before, after)
+        if interval is None:
+            verdict = f'n={len(before)}/{len(after)}, record at least 2 runs per side'
+        else:
+            low, high = interval
+            verdict = f'[{low * 1000:+.2f}, {high * 1000:+.2f}] ms'
+            if low > 0:
+                verdict += '  slower'
+            elif high < 0:
+                verdict += '  faster'
+        print(f"  {metric:<{width}} {mean_before * 1000:>7.2f} ms {mean_after * 1000:>7.2f} ms {change:>+8.1%}  {verdict}")
+    return True
+
+
+# One pass per page: fenced code is matched first and skipped, then links, headings and ids.
+# The leading lookahead lets the scan reject most positions on their first character.
+# Fenced code and <script> bodies are matched first so the links quoted in them are skipped.
+DOC_LINK_SCAN_PATTERN = re.compile(
+    r'(?=[`<hs\]#ind])(?:^```.*?^```[^\n]*$'
+    r'|<script\b[^>]*>.*?</script>'
+    r'|(?:href|src)="([^"]*)"'
+    r'|\]\(\s*<?([^()\s>]+)>?(?:\s+"[^"]*")?\s*\)'
+    r'|^#{1,6}[ \t]+(.+?)[ \t]*$'
+    r'|\b(?:id|name)="([^"]*)"'
+    r'|\bdata-fragment="([^"]*)")',
+    re.MULTILINE | re.DOTALL,
+)
+HTML_ID_PATTERN = re.compile(r'\b(?:id|name)="([^"]*)"')
+HEADING_ATTR_ID_PATTERN = re.compile(r'\{[^}]*#([\w-]+)[^}]*\}\s*$')
+REDIRECT_TARGETS_PATTERN = re.compile(r'var targets = (\{.*?\});')
+URL_SCHEME_PATTERN = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*:|^//')
+SOURCE_LINE_FRAGMENT_PATTERN = re.compile(r'^L(\d+)(?:-L(\d+))?$')
+
+
+def heading_anchor(text: str) -> str:
+    """The id MkDocs' toc extension gives a heading, or its explicit attr_list id."""
+    explicit = HEADING_ATTR_ID_PATTERN.search(text)
+    if explicit:
+        return explicit.group(1)
+    text = re.sub(r'<[^>]+>', '', text)
+    return generate_anchor_from_name(text).strip('-')
+
+
+def iter_doc_link_matches(content: str) -> Iterator[Tuple[int, int, str]]:
+    """(line, DOC_LINK_SCAN_PATTERN group, value) for every link, heading, id and fragment reference in content."""
+    line = 1
+    last = 0
+    for match in DOC_LINK_SCAN_PATTERN.finditer(content):
+        group = match.lastindex
+        if group is None:
+            continue
+        start = match.start()
+        line += content.count('\n', last, start)
+        last = start
+        yield line, group, match.group(group)
+
+
+def scan_doc_links(path: Path, docs_dir: Optional[Path]=None) -> Tuple[List[str], List[Tuple[int, str, str]]]:
+    """Anchors a page defines and (line, target, syntax) for every link in it, syntax being 'html' or 'md'.
+
+    With docs_dir, the lazy detail fragments a page loads are scanned as part of it.
+    """
+    content = path.read_text(encoding='utf-8', errors='replace')
+    anchors = []
+    links = []
+    for line, group, value in iter_doc_link_matches(content):
+        if group == 1:
+            links.append((line, value, 'html'))
+        elif group == 2:
+            links.append((line, value, 'md'))
+        elif group == 3:
+            anchors.append(heading_anchor(value))
+            anchors.extend(HTML_ID_PATTERN.findall(value))
+        elif group == 4:
+            anchors.append(value)
+        elif docs_dir is not None:
+            # The fragment itself must exist, and its HTML lands in this page, so its links resolve from here.
+            links.append((line, value, 'html'))
+            page_url = doc_page_url(path.relative_to(docs_dir).as_posix())
+            try:
+                fragment = json.loads((docs_dir / posixpath.normpath(posixpath.join(page_url, value))).read_text(encoding='utf-8'))['html']
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+            for _, fragment_group, fragment_value in iter_doc_link_matches(fragment):
+                if fragment_group == 1:
+                    links.append((line, fragment_value, 'html'))
+                elif fragment_group == 4:
+                    anchors.append(fragment_value)
+    for match in REDIRECT_TARGETS_PATTERN.finditer(content):
+        # Split landing pages forward their old anchors from a script.
+        anchors.extend(json.loads(match.group(1)))
+    return anchors, links
+
+
+def read_mkdocs_excludes(mkdocs_path: Path) -> List[str]:
+    """Patterns under `exclude_docs: |` in mkdocs.yml, as fnmatch globs."""
+    try:
+        lines = mkdocs_path.read_text(encoding='utf-8').splitlines()
+    except OSError:
+        return []
+    patterns = []
+    inside = False
+    for line in lines:
+        if line.startswith('exclude_docs:'):
+            inside = True
+            continue
+        if inside:
+            if line and not line[0].isspace():
+                break
+            if line.strip():
+                patterns.append(line.strip().lstrip('/').replace('**', '*'))
+    return patterns
+
+
+def doc_page_url(rel: str) -> str:
+    """Directory-style URL MkDocs serves a docs-relative file at."""
+    if not rel.endswith('.md'):
+        return rel
+    stem = rel[:-3]
+    name = stem.rsplit('/', 1)[-1]
+    if name in ('index', 'README'):
+        return stem[:-len(name)]
+    return stem + '/'
+
+
+class LinkChecker:
+    """Validates internal links, anchors and GitHub source links of the docs tree against a set index."""
+
+    def __init__(self, base_dir: Path, docs_dir: Path):
+        self.base_dir = base_dir
+        self.docs_dir = docs_dir
+        excludes = read_mkdocs_excludes(docs_dir.parent / 'mkdocs.yml')
+        self.files: List[str] = []
+        for root, dirs, filenames in os.walk(docs_dir):
+            dirs[:] = [name for name in dirs if not name.startswith('.')]
+            for filename in filenames:
+                rel = Path(root, filename).relative_to(docs_dir).as_posix()
+                if not filename.startswith('.') and not any(fnmatch.fnmatchcase(rel, pattern) for pattern in excludes):
+                    self.files.append(rel)
+        self.files.sort()
+        self.pages = [rel for rel in self.files if rel.endswith('.md')]
+        self.urls: Dict[str, str] = {doc_page_url(rel): rel for rel in self.files}
+        self.file_set = set(self.files)
+        self.anchors: Dict[str, set] = {}
+        self.line_counts: Dict[str, Optional[int]] = {}
+        self.counts = {'internal': 0, 'anchor': 0, 'source': 0, 'external': 0}
+
+    def resolve(self, rel: str, path: str, syntax: str) -> Optional[str]:
+        """Docs-relative file a link path points at, or None."""
+        if path.startswith('/'):
+            candidates = [path.lstrip('/')]
+        else:
+            candidates = [posixpath.join(doc_page_url(rel), path)]
+            if syntax == 'md':
+                # MkDocs rewrites Markdown links relative to the source file before the browser sees them.
+                candidates.insert(0, posixpath.join(posixpath.dirname(rel), path))
+        for candidate in candidates:
+            normalized = posixpath.normpath(candidate)
+            if normalized.startswith('..'):
+                continue
+            normalized = '' if normalized == '.' else normalized
+            for file_rel in (normalized, posixpath.join(normalized, 'index.html')):
+                if file_rel in self.file_set:
+                    return file_rel
+            for url in (normalized, normalized + '/'):
+                if url in self.urls:
+                    return self.urls[url]
+        return None
+
+    def source_line_count(self, rel_path: str) -> Optional[int]:
+        if rel_path not in self.line_counts:
+            path = self.base_dir / rel_path
+            count = None
+            # Lua sources must be in the inventory; anything else only has to exist.
+            if not rel_path.endswith('.lua') or get_source_inventory(self.base_dir).get(path) is not None:
+                try:
+                    count = path.read_bytes().count(b'\n') + 1
+                except OSError:
+                    pass
+            self.line_counts[rel_path] = count
+        return self.line_counts[rel_path]
+
+    def check_source(self, target: str) -> Optional[str]:
+        path, _, fragment = target[len(REPO_BLOB_BASE) + 1:].partition('#')
+        count = self.source_line_count(urllib.parse.unquote(path))
+        if count is None:
+            return 'missing-source'
+        match = SOURCE_LINE_FRAGMENT_PATTERN.match(fragment)
+        if match and int(match.group(2) or match.group(1)) > count:
+            return 'source-line-out-of-range'
+        return None
+
+    def check_link(self, rel: str, target: str, syntax: str) -> Optional[str]:
+        if URL_SCHEME_PATTERN.match(target):
+            if target.startswith(REPO_BLOB_BASE + '/'):
+                self.counts['source'] += 1
+                return self.check_source(target)
+            self.counts['external'] += 1
+            return None
+
+        path, _, fragment = target.partition('#')
+        path = urllib.parse.unquote(path.partition('?')[0])
+        self.counts['internal'] += 1
+        page = rel if not path else self.resolve(rel, path, syntax)
+        if page is None:
+            return 'missing-page'
+        if fragment and page.endswith('.md'):
+            self.counts['anchor'] += 1
+            if urllib.parse.unquote(fragment) not in self.anchors.get(page, ()):
+                return 'missing-anchor'
+        return None
+
+    def run(self, jobs: int=1) -> Dict[str, object]:
+        started = time.perf_counter()
+        scanned = map_jobs(partial(scan_doc_links, docs_dir=self.docs_dir), [self.docs_dir / rel for rel in self.pages], jobs)
+        for rel, (anchors, _) in zip(self.pages, scanned):
+            self.anchors[rel] = set(anchors)
+
+        broken = []
+        total = 0
+        for rel, (_, links) in zip(self.pages, scanned):
+            total += len(links)
+            for line, target, syntax in links:
+                reason = self.check_link(rel, target, syntax)
+                if reason is not None:
+                    broken.append({'page': rel, 'line': line, 'target': target, 'reason': reason})
+        return {
+            'version': 1,
+            'pages': len(self.pages),
+            'files': len(self.files),
+            'links': total,
+            'checked': dict(self.counts),
+            'broken_count': len(broken),
+            'broken': broken,
+            'seconds': round(time.perf_counter() - started, 4),
+        }
+
+
+def check_documentation_links(base_dir: Path, docs_dir: Path, jobs: int=1, report_path: Optional[str]=None) -> bool:
+    """Validate every link in the docs tree; returns True when nothing is broken."""
+    report = LinkChecker(base_dir, docs_dir).run(jobs)
+    # With the JSON report on stdout, keep the human summary out of its way.
+    with redirect_stdout(sys.stderr if report_path == '-' else sys.stdout):
+        checked = report['checked']
+        print(
+            f" Checked {report['links']} links in {report['pages']} pages in {report['seconds']:.2f}s: "
+            f"{checked['internal']} internal ({checked['anchor']} with anchors), {checked['source']} source, "
+            f"{checked['external']} external skipped"
+        )
+        reasons: Dict[str, int] = {}
+        for item in report['broken']:
+            reasons[item['reason']] = reasons.get(item['reason'], 0) + 1
+        if reasons:
+            print(f" Broken: {report['broken_count']} ({', '.join(f'{count} {reason}' for reason, count in sorted(reasons.items()))})")
+            for item in report['broken'][:20]:
+                print(f"  {item['page']}:{item['line']}: {item['reason']} {item['target']}")
+            if report['broken_count'] > 20:
+                print(f"  ... {report['broken_count'] - 20} more")
+        else:
+            print(" No broken links found")
+
+    if report_path:
+        text = json.dumps(report, ensure_ascii=False, indent=2) + '\n'
+        if report_path == '-':
+            sys.stdout.write(text)
+        else:
+            Path(report_path).write_text(text, encoding='utf-8')
+            print(f" Wrote link report to {report_path}")
+    return not report['broken']
+
+
+DUMP_FORMATS = ('ndjson',)
+DUMP_INDEX_SUFFIX = '.idx.json'
+
+
+def symbol_dump_record(symbol: Symbol, kind: str, name: str) -> Dict[str, object]:
+    location = symbol.location
+    return {
+        'name': name,
+        'kind': kind,
+        'realm': symbol.realm.strip().lower() or None,
+        'category': symbol.category.strip() or None,
+        'purpose': symbol.purpose,
+        'parameters': [
+            {'name': param.name, 'type': param.type, 'optional': _split_optional_type(param.type)[2], 'description': param.description}
+            for param in symbol.parameters
+        ],
+        'returns': [{'type': type_name, 'description': description} for type_name, description in parse_return_values(symbol.returns)],
+        'examples': [{'complexity': example.complexity, 'code': textwrap.dedent('\n'.join(example.code)).strip('\n')} for example in symbol.examples],
+        'source': location.path if location else None,
+        'line': location.line if location else None,
+    }
+
+
+def iter_dump_records(base_dir: Path, docs_dir: Path) -> Iterator[Dict[str, object]]:
+    # Hooks documented in a library file show up on its library page and on its hook page; emit them once.
+    seen = set()
+    for page in iter_corpus_pages(base_dir, docs_dir):
+        kind = SYMBOL_INDEX_ROW_KINDS[page.kind]
+        for symbol, symbol_kind in [*((symbol, kind) for symbol in page.symbols), *((symbol, 'hook') for symbol in page.hooks)]:
+            location = symbol.location
+            key = (symbol_kind, location.path, location.line) if location else (symbol_kind, symbol.name)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield symbol_dump_record(symbol, symbol_kind, symbol_display_name(symbol, True) if page.is_library and symbol_kind != 'hook' else symbol.name)
+
+
+def dump_symbols(base_dir: Path, docs_dir: Path, output: str='-', index_path: Optional[str]=None) -> int:
+    """Stream one JSON line per documented symbol to output and record each line's byte span for seeking."""
+    if output != '-' and index_path is None:
+        index_path = output + DUMP_INDEX_SUFFIX
+    started = time.perf_counter()
+    rows = []
+    offset = 0
+    temp_path = None
+    if output == '-':
+        stream = sys.stdout.buffer
+    else:
+        output_path = Path(output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = output_path.with_name(f'.{output_path.name}.tmp')
+        stream = open(temp_path, 'wb')
+    try:
+        for record in iter_dump_records(base_dir, docs_dir):
+            line = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+            stream.write(line)
+            rows.append([record['name'], record['kind'], record['source'], record['line'], offset, len(line)])
+            offset += len(line)
+        stream.flush()
+    except BaseException as error:
+        if temp_path is not None:
+            stream.close()
+            temp_path.unlink(missing_ok=True)
+        if temp_path is not None or not isinstance(error, BrokenPipeError):
+            raise
+        # The reader stopped early (`dump | head`); point stdout at devnull so the exit-time flush stays quiet.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return len(rows)
+    if temp_path is not None:
+        stream.close()
+        os.replace(temp_path, output_path)
+
+    with redirect_stdout(sys.stderr if output == '-' else sys.stdout):
+        if index_path:
+            # Realm-specific definitions share a name, so source and line are part of each key.
+            payload = {'version': 2, 'file': Path(output).name if output != '-' else None, 'bytes': offset, 'fields': ['name', 'kind', 'source', 'line', 'offset', 'length'], 'symbols': rows}
+            OUTPUT_WRITER.write_text(Path(index_path), json.dumps(payload, ensure_ascii=False, separators=(',', ':')) + '\n')
+        print(
+            f" Dumped {len(rows)} symbols ({offset} bytes) to {'stdout' if output == '-' else output}"
+            f"{f' with offset index {index_path}' if index_path else ''} in {time.perf_counter() - started:.2f}s"
+        )
+    return len(rows)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Lilia Documentation Generator')
     subparsers = parser.add_subparsers(dest='command', help='Command to run')
 
+    # Option groups; each subcommand takes only the groups it honours.
+    source_options = argparse.ArgumentParser(add_help=False)
+    source_options.add_argument('--exclude', action='append', default=[], metavar='PATTERN', help='Skip gamemode Lua files whose repository-relative path matches this glob (repeatable)')
+
+    jobs_options = argparse.ArgumentParser(add_help=False)
+    jobs_options.add_argument('--jobs', '-j', type=int, default=1, metavar='N', help='Parse and render Lua files in N worker processes (0 uses every CPU core)')
+
+    # Options that change how pages are written, shared by the generation commands and watch
+    page_options = argparse.ArgumentParser(add_help=False)
+    page_options.add_argument('--max-page-symbols', type=int, default=PAGE_BUDGET.max_symbols, metavar='N', help='Split a page into per-category sub-pages when it documents more than N symbols (0 disables)')
+    page_options.add_argument('--max-page-bytes', type=int, default=PAGE_BUDGET.max_bytes, metavar='N', help='Split a page into per-category sub-pages when its markdown exceeds N bytes (0 disables)')
+    page_options.add_argument('--lazy-details', action='store_true', help='Load each symbol\'s explanation and examples from content-hashed JSON fragments when it is expanded; they stay inline in <noscript> for readers without JavaScript')
+    page_options.add_argument('--stubs', metavar='DIR', help='Also write a LuaLS ---@meta stub per library and meta table page to DIR for editor completion')
+
+    history_options = argparse.ArgumentParser(add_help=False)
+    history_options.add_argument('--no-history', action='store_true', help=f'Do not append benchmarked or profiled runs to the {BENCH_HISTORY_NAME} history')
+    history_options.add_argument('--label', metavar='NAME', help='Tag this run in the benchmark history so bench compare can refer to it by name')
+
+    # Options of the one-shot generation commands
+    build_options = argparse.ArgumentParser(add_help=False, parents=[source_options, jobs_options, page_options, history_options])
+    build_options.add_argument('--max-index-bytes', type=int, default=SYMBOL_INDEX_MAX_BYTES, metavar='N', help=f'Fail when the symbol search index grows past N bytes (0 disables; default {SYMBOL_INDEX_MAX_BYTES})')
+    build_options.add_argument('--profile', metavar='PATH', help='Record phase and per-file spans as a Chrome trace (Perfetto, chrome://tracing) to PATH and list the slowest source files')
+    build_options.add_argument('--memory-report', action='store_true', help='Trace allocations with tracemalloc and report peak and retained memory per phase and by category')
+    build_options.add_argument('--memory-budget', type=parse_byte_size, metavar='SIZE', help='Fail the build with a memory breakdown when a phase peaks above SIZE of traced Python allocations (e.g. 512M)')
+    build_options.add_argument('--ir-output', metavar='PATH', help='Also write the pages generated in this run and their symbols as compact JSON (combine with --force for the whole corpus)')
+
+    # Commands whose output includes hook pages
+    hook_options = argparse.ArgumentParser(add_help=False)
+    hook_options.add_argument('--verify-output', action='store_true', help='Also re-read every generated hook page and check its categories against the source comments')
+
     # Meta command
-    meta_parser = subparsers.add_parser('meta', help='Generate meta documentation')
-    meta_parser.add_argument('--force', action='store_true', help='Force regeneration of existing files')
+    meta_parser = subparsers.add_parser('meta', help='Generate meta documentation', parents=[build_options])
+    meta_parser.add_argument('--force', action='store_true', help='Ignore the incremental build manifest and regenerate every page')
 
     # Library command
-    library_parser = subparsers.add_parser('library', help='Generate library documentation')
-    library_parser.add_argument('--force', action='store_true', help='Force regeneration of existing files')
+    library_parser = subparsers.add_parser('library', help='Generate library documentation', parents=[build_options])
+    library_parser.add_argument('--force', action='store_true', help='Ignore the incremental build manifest and regenerate every page')
 
     # Hooks command
-    hooks_parser = subparsers.add_parser('hooks', help='Generate hooks documentation')
-    hooks_parser.add_argument('--force', action='store_true', help='Force regeneration of existing files')
+    hooks_parser = subparsers.add_parser('hooks', help='Generate hooks documentation', parents=[build_options, hook_options])
+    hooks_parser.add_argument('--force', action='store_true', help='Ignore the incremental build manifest and regenerate every page')
 
     # Compatibility command
-    compatibility_parser = subparsers.add_parser('compatibility', help='Generate compatibility documentation (legacy alias for hook category pages)')
-    compatibility_parser.add_argument('--force', action='store_true', help='Force regeneration of existing files')
+    compatibility_parser = subparsers.add_parser('compatibility', help='Generate compatibility documentation (legacy alias for hook category pages)', parents=[build_options, hook_options])
+    compatibility_parser.add_argument('--force', action='store_true', help='Ignore the incremental build manifest and regenerate every page')
 
     # Generators command
-    generators_parser = subparsers.add_parser('generators', help='Generate generators index')
+    generators_parser = subparsers.add_parser('generators', help='Generate generators index', parents=[build_options])
     generators_parser.add_argument('--force', action='store_true', help='Force regeneration')
 
     # About command
-    about_parser = subparsers.add_parser('about', help='Generate about page with dynamic content')
+    about_parser = subparsers.add_parser('about', help='Generate about page with dynamic content', parents=[build_options])
     about_parser.add_argument('--force', action='store_true', help='Force regeneration (checking for updates)')
 
     # All command
-    all_parser = subparsers.add_parser('all', help='Generate the full documentation site content')
-    all_parser.add_argument('--force', action='store_true', help='Force regeneration of pages that support force-aware workflows')
+    all_parser = subparsers.add_parser('all', help='Generate the full documentation site content', parents=[build_options, hook_options])
+    all_parser.add_argument('--force', action='store_true', help='Ignore the incremental build manifest and regenerate every page')
+
+    # Watch command
+    watch_parser = subparsers.add_parser('watch', help='Rebuild affected pages whenever Lua sources under gamemode/ change', parents=[source_options, jobs_options, page_options])
+    watch_parser.add_argument('--force', action='store_true', help='Ignore the incremental build manifest for the initial build')
+    watch_parser.add_argument('--interval', type=float, default=0.5, metavar='SECONDS', help='How often to poll gamemode/ for changes')
+    watch_parser.add_argument('--debounce', type=float, default=0.3, metavar='SECONDS', help='Quiet period that coalesces several saves into one rebuild')
+
+    # Check-links command
+    check_links_parser = subparsers.add_parser('check-links', help='Validate internal links, anchors and source links of the generated docs tree', parents=[jobs_options])
+    check_links_parser.add_argument('--report', metavar='PATH', help="Also write the full result as JSON to PATH ('-' for stdout)")
+
+    # Dump command
+    dump_parser = subparsers.add_parser('dump', help='Stream every documented function, meta method and hook as machine-readable records', parents=[source_options])
+    dump_parser.add_argument('--format', choices=DUMP_FORMATS, default='ndjson', help='Record format (one JSON object per line)')
+    dump_parser.add_argument('--output', '-o', default='-', metavar='PATH', help="Where to write the records ('-' for stdout, the default)")
+    dump_parser.add_argument('--index', metavar='PATH', help=f'Where to write the name -> byte offset index (default: PATH{DUMP_INDEX_SUFFIX} next to --output; none for stdout)')
+
+    # Bench command
+    bench_parser = subparsers.add_parser('bench', help='Run micro-benchmarks against the current source tree', parents=[source_options, history_options])
+    bench_parser.add_argument('benchmarks', nargs='*', metavar='NAME', help=f"Benchmarks to run ({', '.join(BENCHMARKS)}; default: all), or 'compare A B' to compare recorded runs (run id, --label, commit prefix or git revision), or 'history' to list them")
+    bench_parser.add_argument('--repeat', type=int, default=20, metavar='N', help='Timed passes per benchmark; the best one is reported')
+    bench_parser.add_argument('--output', metavar='PATH', help='Save the results as JSON to PATH')
+    bench_parser.add_argument('--baseline', metavar='PATH', help='Compare against results saved with --output and fail on regressions')
+    bench_parser.add_argument('--threshold', type=float, default=BENCH_REGRESSION_THRESHOLD, metavar='FRACTION', help=f'Slowdown over the baseline that counts as a regression (default {BENCH_REGRESSION_THRESHOLD})')
+    bench_parser.add_argument('--verify', action='store_true', help=f'parse: check parse_comment_block against {PARSE_SNAPSHOT_PATH.as_posix()} for every block in gamemode/ and fail on a difference')
+    bench_parser.add_argument('--update-snapshot', action='store_true', help=f'parse: rewrite {PARSE_SNAPSHOT_PATH.as_posix()} from the current parser')
 
     args = parser.parse_args()
 
     base_dir = Path(__file__).parent
     docs_dir = base_dir / 'documentation' / 'docs'
-    should_sync_nav = True
     force = getattr(args, 'force', False)
+    DOC_PREFILTER.exclude = tuple(getattr(args, 'exclude', ()))
+    PAGE_BUDGET.max_symbols = max(0, getattr(args, 'max_page_symbols', PAGE_BUDGET.max_symbols))
+    PAGE_BUDGET.max_bytes = max(0, getattr(args, 'max_page_bytes', PAGE_BUDGET.max_bytes))
+    DETAIL_FRAGMENTS.configure(docs_dir, getattr(args, 'lazy_details', False))
+    LUA_STUBS.output_dir = Path(args.stubs).resolve() if getattr(args, 'stubs', None) else None
+    TRACE.configure(getattr(args, 'profile', None), base_dir)
+    MEMORY.configure(getattr(args, 'memory_report', False), getattr(args, 'memory_budget', None))
+    jobs = getattr(args, 'jobs', 1)
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    started = time.perf_counter()
+    manifest = BuildManifest(
+        base_dir / DOCGEN_MANIFEST_NAME,
+        compute_generator_fingerprint([*sorted(DOC_PREFILTER.exclude), f'page-budget={PAGE_BUDGET.max_symbols}/{PAGE_BUDGET.max_bytes}', f'lazy-details={DETAIL_FRAGMENTS.enabled}', f'stubs={LUA_STUBS.output_dir}']),
+        force=force,
+    )
 
-    remove_legacy_generated_docs(docs_dir)
-
-    if args.command == 'meta':
-        run_meta_generation(base_dir, docs_dir, force)
+    if args.command == 'bench' and args.benchmarks[:1] == ['history']:
+        for row in BENCH_HISTORY.recent():
+            print(f" {row[0]:>5}  {row[1]}  {(row[4] or 'no commit')[:12]:<12}  Python {row[5]}, {row[6]} CPU  {row[7]:>3} timings  {row[2]}{f' [{row[3]}]' if row[3] else ''}")
+        return
 
-    elif args.command == 'library':
-        run_library_generation(base_dir, docs_dir, force)
+    if args.command == 'bench' and args.benchmarks[:1] == ['compare']:
+        if len(args.benchmarks) != 3:
+            parser.error('bench compare takes two run references: bench compare A B')
+        if not compare_history_runs(base_dir, args.benchmarks[1], args.benchmarks[2]):
+            sys.exit(1)
+        return
 
-    elif args.command == 'hooks':
-        run_hooks_generation(base_dir, docs_dir)
+    if args.command == 'bench':
+        unknown = [name for name in args.benchmarks if name not in BENCHMARKS]
+        if unknown:
+            parser.error(f"unknown benchmark: {', '.join(unknown)} (choose from {', '.join(BENCHMARKS)})")
+        if (args.verify or args.update_snapshot) and not verify_parse_snapshot(base_dir, args.update_snapshot):
+            sys.exit(1)
+        if not run_benchmarks(base_dir, docs_dir, args.benchmarks or list(BENCHMARKS), args.repeat, args.output, args.baseline, args.threshold, not args.no_history, args.label):
+            sys.exit(1)
+        return
 
-    elif args.command == 'compatibility':
-        run_compatibility_generation(base_dir, docs_dir)
+    if args.command == 'dump':
+        dump_symbols(base_dir, docs_dir, args.output, args.index)
+        return
 
-    elif args.command == 'generators':
-        run_generators_generation(docs_dir)
+    if args.command == 'check-links':
+        if not check_documentation_links(base_dir, docs_dir, jobs, args.report):
+            sys.exit(1)
+        return
 
-    elif args.command == 'about':
-        run_about_generation(docs_dir, force)
+    PAGE_REGISTRY.load(base_dir / DOCGEN_PAGES_NAME)
+    remove_legacy_generated_docs(docs_dir)
 
-    elif args.command == 'all':
-        run_meta_generation(base_dir, docs_dir, force)
-        run_library_generation(base_dir, docs_dir, force)
-        run_hooks_generation(base_dir, docs_dir)
-        run_generators_generation(docs_dir)
-        run_about_generation(docs_dir, force)
+    if args.command == 'watch':
+        watch_documentation(base_dir, docs_dir, manifest, jobs, interval=args.interval, debounce=args.debounce)
+        return
 
-    else:
+    if args.command not in COMMAND_PHASES:
         parser.print_help()
         return
 
-    # Generate pages file for all commands
     # generate_comprehensive_index(docs_dir)  # Disabled to preserve manual index.md
-    generate_development_index(docs_dir / 'developer')
-    generate_pages_file(docs_dir)
-    if should_sync_nav:
-        sync_mkdocs_nav(base_dir / 'documentation' / 'mkdocs.yml', docs_dir)
+    if jobs > 1:
+        # Build the shared inventory before phases start using it from several threads.
+        get_source_inventory(base_dir)
+    phases = build_phase_plan(
+        COMMAND_PHASES[args.command], base_dir, docs_dir, force, manifest, jobs,
+        sync_definitions=args.command == 'all',
+        verify_output=getattr(args, 'verify_output', False),
+        max_index_bytes=max(0, getattr(args, 'max_index_bytes', SYMBOL_INDEX_MAX_BYTES)),
+    )
+    try:
+        PhaseScheduler(phases, jobs=jobs).run()
+    except MemoryBudgetExceeded as error:
+        print(f" {error}")
+        MEMORY.print_report(jobs, always=True)
+        sys.exit(1)
+    if force and args.command == 'all':
+        # Only a full rebuild knows every fragment that is still referenced.
+        DETAIL_FRAGMENTS.prune()
+    manifest.save()
+    PAGE_REGISTRY.save()
+
+    ir_output = getattr(args, 'ir_output', None)
+    if ir_output:
+        DOC_MODEL.write_json(Path(ir_output), root=docs_dir)
+        print(f" Wrote documentation model for {len(DOC_MODEL.pages)} pages ({DOC_MODEL.symbol_count()} symbols) to {ir_output}")
+
+    TRACE.save()
+    if TRACE.recording and not args.no_history:
+        BENCH_HISTORY.record(base_dir, ' '.join(sys.argv[1:]), {**TRACE.phase_timings(args.command), f'profile.{args.command}.total_seconds': time.perf_counter() - started}, args.label)
+    MEMORY.print_report(jobs)
+    print(f" {SOURCE_CACHE.report()}")
+    print(f" {DOC_PREFILTER.report()}")
+    print(f" {OUTPUT_WRITER.report()}")
+    print(f" {PAGE_REGISTRY.report()}")
+    print(f" Finished {args.command} in {time.perf_counter() - started:.2f}s with {jobs} job{'s' if jobs != 1 else ''}")
 
 
 def extract_title_and_summary(md_file: Path) -> Tuple[str, str]:
-    """Extract title and summary from a markdown file."""
+    """Extract title and summary from a markdown file, preferring the page registry."""
+    recorded = PAGE_REGISTRY.lookup(md_file)
+    if recorded is not None:
+        return recorded
+
     try:
         with open(md_file, 'r', encoding='utf-8') as f:
             content = f.read()
@@ -1921,7 +4977,11 @@ def extract_title_and_summary(md_file: Path) -> Tuple[str, str]:
         name = md_file.stem
         display_name = name.replace('lia.', '').replace('_', ' ').title()
         return display_name, ''
-    
+    return parse_title_and_summary(content, md_file)
+
+
+def parse_title_and_summary(content: str, md_file: Path) -> Tuple[str, str]:
+    """Extract title and summary from markdown text read from md_file."""
     lines = content.split('\n')
     title = ''
     summary = ''
@@ -1973,13 +5033,15 @@ def _extract_markdown_title(md_file: Path) -> str:
     return title
 
 
-def _sort_doc_paths(paths: List[Path], preferred_order: List[str]) -> List[Path]:
+def _sort_doc_paths(paths: List[Path], preferred_order: List[str], titles: Optional[Dict[Path, str]]=None) -> List[Path]:
     order_index = {name: index for index, name in enumerate(preferred_order)}
+    if titles is None:
+        titles = {path: _extract_markdown_title(path) for path in paths}
     return sorted(
         paths,
         key=lambda path: (
             order_index.get(path.stem.lower(), len(order_index)),
-            _extract_markdown_title(path).lower(),
+            titles[path].lower(),
             path.stem.lower(),
         ),
     )
@@ -1987,17 +5049,28 @@ def _sort_doc_paths(paths: List[Path], preferred_order: List[str]) -> List[Path]
 
 def _build_nav_lines(files: List[Path], docs_dir: Path, base_indent: str, preferred_order: List[str]) -> List[str]:
     lines: List[str] = []
-    for md_file in _sort_doc_paths(files, preferred_order):
+    titles = {md_file: _extract_markdown_title(md_file) for md_file in files}
+    for md_file in _sort_doc_paths(files, preferred_order, titles):
         if md_file.stem.lower() == 'index':
             continue
-        title = _extract_markdown_title(md_file)
+        title = titles[md_file]
         relative_path = md_file.relative_to(docs_dir).as_posix()
+        split_dir = md_file.with_suffix('')
+        if (split_dir / '.pages').is_file():
+            lines.append(f"{base_indent}- {title}:")
+            lines.append(f"{base_indent}    - Overview: {relative_path}")
+            arrange = [line[3:-3] for line in (split_dir / '.pages').read_text(encoding='utf-8').splitlines() if line.startswith(' - ')]
+            lines.extend(_build_nav_lines(list(split_dir.glob('*.md')), docs_dir, base_indent + '    ', arrange))
+            continue
         lines.append(f"{base_indent}- {title}: {relative_path}")
     return lines
 
 
-def sync_mkdocs_nav(mkdocs_path: Path, docs_dir: Path) -> None:
-    """Sync selected MkDocs nav sections from the current docs tree."""
+def sync_mkdocs_nav(mkdocs_path: Path, docs_dir: Path, directories: Optional[Sequence[str]]=None) -> None:
+    """Sync selected MkDocs nav sections from the current docs tree.
+
+    directories limits the sync to sections whose docs-relative directory is listed.
+    """
     if not mkdocs_path.exists():
         print(f" Warning: {mkdocs_path} does not exist. Skipping nav sync.")
         return
@@ -2051,6 +5124,8 @@ def sync_mkdocs_nav(mkdocs_path: Path, docs_dir: Path) -> None:
     updated_content = content
     for section in sections:
         directory = section['directory']
+        if directories is not None and directory.relative_to(docs_dir).as_posix() not in directories:
+            continue
         if not directory.exists():
             print(f" Warning: {directory} does not exist. Skipping {section['name']} nav sync.")
             continue
@@ -2080,7 +5155,7 @@ def sync_mkdocs_nav(mkdocs_path: Path, docs_dir: Path) -> None:
         return
 
     try:
-        mkdocs_path.write_text(updated_content, encoding='utf-8')
+        OUTPUT_WRITER.write_text(mkdocs_path, updated_content)
         print(f" Synced dynamic navigation in {mkdocs_path.name}")
     except OSError as exc:
         print(f" Warning: Could not write {mkdocs_path}: {exc}")
@@ -2262,30 +5337,8 @@ def generate_index_file(output_dir: Path, doc_type: str) -> None:
 
     index_path = output_dir / 'index.md'
 
-    with open(index_path, 'w', encoding='utf-8') as f:
-        css_block = '''<style>
-details > summary {
-    position: relative;
-    display: flex;
-    align-items: center;
-    min-height: 70px;
-    padding-right: 180px;
-}
-
-details > summary .summary-main {
-    min-width: 0;
-}
-
-details > summary .source-link-button--summary {
-    position: absolute;
-    right: 56px;
-    top: 50%;
-    transform: translateY(-50%);
-    white-space: nowrap;
-    z-index: 2;
-}
-</style>\n\n'''
-        f.write(css_block)
+    with OUTPUT_WRITER.open(index_path) as f:
+        f.write(PAGE_CSS_BLOCK)
         f.write(f'# {title}\n\n')
 
         if doc_type == 'guides':
@@ -2306,28 +5359,21 @@ details > summary .source-link-button--summary {
         if md_files:
             items = []
             for md_file in md_files:
-                # Use custom title for guides and generators
+                # Use custom titles and summaries for guides, about and generators
                 if doc_type == 'guides':
                     file_title = get_custom_title('Guides', md_file)
+                    summary = get_custom_summary('Guides', md_file, output_dir.parent.parent)
                 elif doc_type == 'about':
                     file_title = get_custom_title('About', md_file)
+                    summary = get_custom_summary('About', md_file, output_dir.parent.parent)
                 elif doc_type == 'generators':
                     file_title = get_custom_title('Generators', md_file)
+                    summary = get_custom_summary('Generators', md_file, output_dir.parent)
                 else:
-                    file_title, _ = extract_title_and_summary(md_file)
+                    file_title, summary = extract_title_and_summary(md_file)
 
                 link_name = md_file.name
-                
-                # Custom summary logic
-                if doc_type == 'guides':
-                    summary = get_custom_summary('Guides', md_file, output_dir.parent.parent)
-                elif doc_type == 'about':
-                    summary = get_custom_summary('About', md_file, output_dir.parent.parent)
-                elif doc_type == 'generators':
-                    summary = get_custom_summary('Generators', md_file, output_dir.parent)
-                else:
-                    _, summary = extract_title_and_summary(md_file)
-                
+
                 items.append((file_title, f'./{link_name}', summary))
             
             write_cards(f, items)
@@ -2342,8 +5388,7 @@ details > summary .source-link-button--summary {
                      file_title = get_custom_title('Generators', md_file)
                      summary = get_custom_summary('Generators', md_file, output_dir.parent)
                 else:
-                     file_title, _ = extract_title_and_summary(md_file)
-                     _, summary = extract_title_and_summary(md_file)
+                     file_title, summary = extract_title_and_summary(md_file)
                 
                 # Make link relative
                 try:
@@ -2410,7 +5455,7 @@ def generate_comprehensive_index(docs_dir: Path) -> None:
     if not sections:
         return
 
-    with open(index_path, 'w', encoding='utf-8') as f:
+    with OUTPUT_WRITER.open(index_path) as f:
         f.write('# Index\n\n')
         f.write('This page provides an index of all available documentation.\n\n')
 
@@ -2486,7 +5531,7 @@ def generate_development_index(dev_dir: Path) -> None:
 
     index_path = dev_dir / 'index.md'
 
-    with open(index_path, 'w', encoding='utf-8') as f:
+    with OUTPUT_WRITER.open(index_path) as f:
         f.write('# Developer\n\n')
         f.write('This section is for people who want to change how Lilia works or build on top of it. It collects the main references in one place so you can find the right system faster.\n\n')
         f.write('<div class="card-grid">\n')
@@ -2520,7 +5565,7 @@ def generate_module_development_index(dev_modules_dir: Path) -> None:
 
     index_path = dev_modules_dir / 'index.md'
 
-    with open(index_path, 'w', encoding='utf-8') as f:
+    with OUTPUT_WRITER.open(index_path) as f:
         f.write('# Modules\n\n')
         f.write('This section collects developer references that belong to bundled modules and submodules rather than the framework core.\n\n')
         f.write('<div class="card-grid">\n')
@@ -2562,7 +5607,7 @@ def generate_pages_file(docs_dir: Path) -> None:
     # Development Pages
     dev_pages_path = docs_dir / 'developer' / '.pages'
     if dev_pages_path.parent.exists():
-        with open(dev_pages_path, 'w', encoding='utf-8') as f:
+        with OUTPUT_WRITER.open(dev_pages_path) as f:
             f.write('title: Developer\narrange:\n')
             f.write(' - compatibility\n')
             f.write(' - hooks\n')
@@ -2572,7 +5617,7 @@ def generate_pages_file(docs_dir: Path) -> None:
     # No separate developer/modules .pages file: modules are surfaced under libraries/hooks
 
  # Write root .pages file
-    with open(pages_path, 'w', encoding='utf-8') as f:
+    with OUTPUT_WRITER.open(pages_path) as f:
         f.write('arrange:\n')
         for item in nav_order:
             f.write(f' - {item}\n')